@@ -9,6 +9,7 @@ import os
 import sys
 from dotenv import load_dotenv
 from atlassian.jira import Jira
+from create_weekly_report import create_http_session, HTTP_READ_TIMEOUT_SECONDS
 
 # .env 파일 로드
 load_dotenv()
@@ -34,7 +35,9 @@ def check_jira_fields():
             url=env["ATLASSIAN_URL"], 
             username=env["ATLASSIAN_USERNAME"], 
             password=env["ATLASSIAN_API_TOKEN"], 
-            cloud=True
+            cloud=True,
+            session=create_http_session(),
+            timeout=HTTP_READ_TIMEOUT_SECONDS
         )
         
         print("=== Jira 필드 정보 조회 ===")
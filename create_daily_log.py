@@ -8,6 +8,7 @@ crontab에서 실행되는 스크립트의 출력을 해당 날짜의 로그 파
 
 import os
 import sys
+import shutil
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -64,7 +65,7 @@ def run_weekly_report_with_logging():
     venv_python = "/Users/eos/Desktop/weekly-deploy-reporter/venv/bin/python"
     
     # 명령어 구성
-    command = [venv_python, script_path, "update"]
+    command = [venv_python, script_path, "update", "--delta-sync"]
     
     try:
         # 로그 파일에 실행 시작 시간 기록
@@ -81,14 +82,11 @@ def run_weekly_report_with_logging():
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                universal_newlines=True
             )
             
-            # 실시간으로 출력을 로그 파일에 기록
-            for line in process.stdout:
-                log_file.write(line)
-                log_file.flush()  # 즉시 파일에 쓰기
+            # 출력을 줄 단위가 아니라 버퍼 단위로 로그 파일에 복사
+            shutil.copyfileobj(process.stdout, log_file)
             
             process.wait()
             
@@ -12,12 +12,19 @@
     last     - 지난 주 배포 예정 티켓으로 리포트 생성/업데이트
     
 옵션:
-    --no-pagination  - 페이지네이션 없이 한 번에 조회 (기본값, 최대 1000개)
-    --pagination     - 페이지네이션을 사용하여 모든 티켓 조회
+    --no-pagination  - 페이지네이션 없이 한 번에 조회 (기본값, 결과가 잘리면 나머지 페이지 순차 조회)
+    --pagination     - 나머지 페이지를 동시에 조회하여 모든 티켓 조회 (Server/DC, Jira Cloud는 nextPageToken으로 순차 조회)
     --force-update   - 강제 업데이트 (변경사항 없어도 업데이트)
     --check-page     - Confluence 페이지 내용 확인
     --debug-links [티켓키] - 특정 티켓의 연결 관계 디버깅
     --test           - 테스트 모드 (Slack 알림 전송 비활성화)
+    --verify-filter  - 서버 측 날짜 필터링 결과를 Python 필터링 결과와 비교 검증
+    --delta-sync     - 로컬 이슈 저장소를 updated 기준으로 증분 동기화하여 사용
+    --async          - asyncio 실행 엔진으로 독립적인 Jira/Confluence 호출을 동시에 실행
+    --verbose        - 티켓별 상세 로그(DEBUG) 출력 (LOG_LEVEL=DEBUG와 동일)
+    --compact        - Confluence 기본 표와 상태 매크로, 최소한의 안내 문구로 페이지 본문을 간결하게 생성
+    --compare-size   - --compact와 함께 사용, 기본 본문도 만들어 본문 크기를 비교 출력
+    --static-table   - Jira 매크로 대신 조회한 티켓으로 만든 정적 표를 페이지에 넣음
 
 예시:
     python create_weekly_report.py current
@@ -34,12 +41,30 @@ import sys
 from dotenv import load_dotenv
 from jira import JIRA
 from atlassian.confluence import Confluence
+from atlassian.errors import ApiNotFoundError
 import requests
 import json
+import hashlib
 import re
 import html
-from datetime import datetime, date, timedelta
-import numpy as np # 스마트 필터링 시 사용
+from datetime import datetime, date, timedelta, timezone
+import time
+import asyncio
+import functools
+import random
+import threading
+import logging
+import sqlite3
+import tempfile
+import uuid
+import fcntl
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+import numpy as np # 예정된 시작 값 컬럼 필터링/주간 분류에 사용
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 
 # .env 파일에서 환경 변수들을 읽어와서 현재 환경에 설정합니다.
 # 예: ATLASSIAN_URL, ATLASSIAN_USERNAME, ATLASSIAN_API_TOKEN, SLACK_WEBHOOK_URL, SLACK_BOT_TOKEN 등
@@ -49,6 +74,102 @@ load_dotenv()
 
 # Jira 필드 ID 설정
 JIRA_DEPLOY_DATE_FIELD_ID = "customfield_10817"  # 예정된 시작 필드 ID
+JIRA_DEPLOY_DATE_JQL_FIELD = "cf[10817]"  # JQL에서 사용하는 예정된 시작 필드 표기
+
+# 예정된 시작 값의 시간대 (예: "2025-07-23T11:00:00.000+0900")
+DEPLOY_DATE_TIMEZONE = timezone(timedelta(hours=9))
+# JQL 날짜 리터럴이 해석되는 시간대 (API 계정의 Jira 프로필 시간대, 기본값: KST)
+JIRA_JQL_UTC_OFFSET_HOURS = float(os.getenv('JIRA_JQL_UTC_OFFSET_HOURS', '9'))
+
+# 배포 예정 티켓 검색 시 요청하는 필드 (연결된 IT 티켓을 검색 결과에서 바로 추출하기 위해 issuelinks, issuetype 포함)
+JIRA_SEARCH_FIELDS = f"key,summary,status,assignee,created,updated,issuetype,issuelinks,{JIRA_DEPLOY_DATE_FIELD_ID}"
+
+# Jira 검색 페이지 설정
+JIRA_SEARCH_MAX_RESULTS = 1000  # 요청하는 페이지 크기 (Jira Cloud는 서버에서 100개로 제한함)
+JIRA_PAGE_FETCH_WORKERS = int(os.getenv('JIRA_PAGE_FETCH_WORKERS', '4'))  # --pagination 사용 시 동시 조회 수
+LINK_FETCH_MAX_WORKERS = int(os.getenv('LINK_FETCH_MAX_WORKERS', '8'))  # 연결된 IT 티켓 동시 조회 수
+
+# Jira/Confluence/Slack 요청 제어 설정 (호스트별 token bucket + 지수 백오프)
+REQUEST_RATE_PER_SECOND = float(os.getenv('REQUEST_RATE_PER_SECOND', '10'))  # 호스트별 초당 요청 수
+REQUEST_BURST = int(os.getenv('REQUEST_BURST', '10'))  # 순간적으로 허용하는 요청 수
+REQUEST_MAX_RETRIES = 4  # 요청당 최대 재시도 횟수
+REQUEST_BACKOFF_BASE_SECONDS = 0.5
+REQUEST_BACKOFF_MAX_SECONDS = 30
+REQUEST_RETRY_BUDGET = int(os.getenv('REQUEST_RETRY_BUDGET', '30'))  # 실행 한 번에 허용하는 전체 재시도 횟수
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+# 서버가 요청을 받은 뒤 실패해도 다시 보내도 되는 메서드. 그 외(POST: 페이지 생성, Slack 전송)는
+# 429 응답과 연결 단계 오류(요청이 서버에 닿지 않은 경우)만 재시도합니다.
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT'}
+
+# 공유 HTTP 연결 풀 설정 (Jira, Confluence, Slack 클라이언트가 같은 연결 풀을 사용)
+HTTP_POOL_CONNECTIONS = 4  # 연결 풀을 유지할 호스트 수
+HTTP_POOL_MAXSIZE = 16  # 호스트별 최대 연결 수 (동시 조회 수보다 크게 설정)
+HTTP_CONNECT_TIMEOUT_SECONDS = 5
+HTTP_READ_TIMEOUT_SECONDS = 60
+
+# 연결된 IT 티켓 캐시 (이슈 키 + 부모 티켓 updated 기준, 연결 티켓의 요약/상태는 실행마다 묶어서 다시 조회)
+LINKED_TICKETS_CACHE_FILE_PATH = "linked_tickets_cache.json"
+LINKED_TICKETS_CACHE_MAX_ENTRIES = 2000
+LINKED_TICKETS_CACHE_MAX_AGE_DAYS = 14
+LINKED_TICKETS_REFRESH_BATCH_SIZE = 100  # 캐시된 연결 티켓 상태를 다시 조회할 때 한 번의 검색에 넣는 키 수
+
+# 로컬 이슈 저장소 (--delta-sync 사용 시 updated 기준 증분 동기화)
+ISSUE_STORE_FILE_PATH = "jira_issue_store.json"
+ISSUE_STORE_FULL_SYNC_HOURS = 24  # 이 시간이 지나면 전체 동기화 (삭제된 티켓 정리)
+ISSUE_STORE_SYNC_OVERLAP_MINUTES = 5  # 증분 조회 시 high-water mark 이전으로 겹쳐서 조회할 시간
+
+# 스냅샷 비교 시 변경으로 보는 필드: 변경 이름 → (스냅샷 키, Slack 표시 이름)
+SNAPSHOT_DIFF_FIELDS = {
+    'deploy_date': (JIRA_DEPLOY_DATE_FIELD_ID, '배포 예정일'),
+    'status': ('status', '상태'),
+    'assignee': ('assignee', '담당자'),
+    'summary': ('summary', '요약'),
+}
+
+# 주간 스냅샷 이력 (주간·티켓 키별로 바뀐 시점마다 행을 추가하는 SQLite 이력, weekly_issues_snapshot_*.json 대체)
+SNAPSHOT_HISTORY_DB_PATH = "weekly_issues_history.sqlite3"
+
+# 마지막으로 게시한 페이지 본문 지문(sha256)과 Confluence 버전 (본문이 같으면 현재 본문 다운로드 생략)
+PUBLISHED_FINGERPRINT_FILE_PATH = "published_page_fingerprints.json"
+
+# 배포 예정 표의 행(HTML) 캐시 (티켓 요약/상태와 연결된 IT 티켓 지문 기준, 바뀐 행만 다시 생성)
+ROW_RENDER_CACHE_FILE_PATH = "row_render_cache.json"
+ROW_RENDER_CACHE_MAX_ENTRIES = 1000
+ROW_RENDER_VERSION = 2  # 행 HTML 형식을 바꾸면 올려서 기존 캐시를 무효화
+
+# 주간 페이지 제목 → 페이지 ID 색인 (상위 페이지의 하위 페이지 목록으로 만들고, 없거나 404일 때만 갱신)
+CONFLUENCE_PAGE_INDEX_FILE_PATH = "confluence_page_index.json"
+CONFLUENCE_CHILD_PAGE_LIMIT = 200  # 하위 페이지 목록 한 번에 조회하는 개수
+
+# 배포 예정 표가 이 예산을 넘으면 주간 페이지 아래 배포 예정일별 하위 페이지로 나누고 주간 페이지에는 목차만 둡니다 (0이면 제한 없음).
+PAGE_SPLIT_MAX_ROWS = int(os.getenv('PAGE_SPLIT_MAX_ROWS', '100'))  # 하위 페이지 하나에 넣는 최대 행 수
+PAGE_SPLIT_MAX_BYTES = int(os.getenv('PAGE_SPLIT_MAX_BYTES', '150000'))  # 하위 페이지 하나의 최대 표 크기(바이트)
+
+# Slack 중복 알림 방지 저장소 (주간별 알림 지문과 만료 시각, 만료된 항목은 저장 시 정리)
+NOTIFICATION_DEDUPE_FILE_PATH = "notification_dedupe.json"
+NOTIFICATION_DEDUPE_TTL_DAYS = int(os.getenv('NOTIFICATION_DEDUPE_TTL_DAYS', '35'))
+LEGACY_NOTIFIED_DEPLOY_KEYS_FILE_PATH = "notified_deploy_keys.json"  # 이전 형식, 처음 한 번만 읽어 옮김
+
+# Slack 발송 대기열: 알림은 파일에 쌓아 두고 백그라운드에서 보냅니다 (알림 시간 외에는 보류 후 다음 실행에서 전송).
+SLACK_OUTBOX_FILE_PATH = "slack_outbox.json"
+SLACK_NOTIFICATION_START_HOUR = 10
+SLACK_NOTIFICATION_END_HOUR = 21
+SLACK_POST_TIMEOUT_SECONDS = 10  # 메시지 하나를 보내는 요청의 제한 시간
+SLACK_FLUSH_TIMEOUT_SECONDS = int(os.getenv('SLACK_FLUSH_TIMEOUT_SECONDS', '30'))  # 실행 종료 시 전송을 기다리는 최대 시간
+SLACK_OUTBOX_MAX_ATTEMPTS = 5  # 이 횟수만큼 실패한 메시지는 버림
+SLACK_OUTBOX_CLAIM_SECONDS = 120  # 보내는 중인 메시지를 다른 실행이 다시 보내지 않도록 잡아 두는 시간
+
+# 실행 잠금: 겹친 cron 실행(create/update 등)은 주간과 관계없이 하나씩 진행합니다.
+# 이슈 저장소, 캐시, 페이지 색인, 알림 기록 등 상태 파일을 모든 주간이 함께 쓰기 때문입니다.
+RUN_LOCK_FILE_PATH = "weekly_report.lock"
+RUN_LOCK_TIMEOUT_SECONDS = int(os.getenv('RUN_LOCK_TIMEOUT_SECONDS', '900'))  # 앞선 실행을 기다리는 최대 시간
+RUN_LOCK_POLL_SECONDS = 1
+RUN_REUSE_SECONDS = int(os.getenv('RUN_REUSE_SECONDS', '120'))  # 기다리는 동안 같은 주간·모드의 실행이 이 시간 안에 끝났으면 이번 실행 생략
+RUN_STATE_FILE_PATH = "weekly_report_runs.json"
+
+# 로그 설정: 티켓/링크별 상세 로그는 DEBUG 레벨이며 기본값(INFO)에서는 출력하지 않습니다.
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+CRON_LOG_FILE_PATH = "cron.log"
 
 # Confluence에서 생성될 주간 리포트 페이지의 상위 페이지 제목입니다.
 # 이 페이지 아래에 "X월 Y째주: (MM/DD~MM/DD)" 형식의 자식 페이지가 생성됩니다.
@@ -56,7 +177,25 @@ CONFLUENCE_PARENT_PAGE_TITLE = "25-2H 주간 배포 리스트"
 
 # ---------------------------------------------------------
 
+# 로그 메시지는 호출 시점이 아니라 출력될 때만 포맷합니다 (예: logger.debug("%s: %s", key, summary)).
+logger = logging.getLogger('weekly_report')
+cron_logger = logging.getLogger('weekly_report.cron')
+
 # === [1단계] 유틸리티 함수 및 템플릿 정의 ===
+def configure_logging(level=LOG_LEVEL, stream=None):
+    """
+    리포트 로그의 레벨과 출력 대상을 설정합니다.
+    print() 출력과 순서가 섞이지 않도록 같은 표준 출력 버퍼로 내보냅니다.
+    """
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    for old_handler in list(logger.handlers):
+        logger.removeHandler(old_handler)
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return handler
+
 def load_env_vars(keys):
     values = {k: os.getenv(k) for k in keys}
     missing = [k for k, v in values.items() if not v]
@@ -91,13 +230,7 @@ def get_week_range(mode):
     # 일요일은 월요일 + 6일
     sunday = monday + timedelta(days=6)
     
-    # 디버깅 정보 출력
-    print(f"=== 날짜 계산 디버깅 ===")
-    print(f"모드: {mode}")
-    print(f"현재 날짜: {today}")
-    print(f"계산된 월요일: {monday}")
-    print(f"계산된 일요일: {sunday}")
-    print(f"주간 범위: {monday.strftime('%m/%d')}~{sunday.strftime('%m/%d')}")
+    logger.debug("날짜 계산: 모드=%s, 현재 날짜=%s, 주간 범위=%s~%s", mode, today, monday, sunday)
     
     return monday, sunday
 
@@ -115,17 +248,236 @@ def read_json(path, default=None):
         return default
 
 def write_json(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=2))
+
+def atomic_write_text(path, text):
+    """
+    같은 디렉터리의 임시 파일에 쓴 뒤 os.replace로 바꿔 끼웁니다.
+    동시에 실행 중인 다른 프로세스는 이전 내용이나 새 내용 전체만 읽고, 쓰다 만 파일을 보지 않습니다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
 
 def log(message):
-    with open("cron.log", "a", encoding="utf-8") as f:
-        f.write(message + "\n")
+    """cron.log에 메시지를 기록합니다. 파일은 처음 기록할 때 한 번만 열고 계속 사용합니다."""
+    if not cron_logger.handlers:
+        handler = logging.FileHandler(CRON_LOG_FILE_PATH, encoding='utf-8', delay=True)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        cron_logger.addHandler(handler)
+        cron_logger.setLevel(logging.INFO)
+        cron_logger.propagate = False
+    cron_logger.info(message)
 
 def normalize_html_content(html_content):
     unescaped = html.unescape(html_content)
     return re.sub(r'\s+', ' ', unescaped).strip()
 
+def content_fingerprint(html_content):
+    """정규화한 페이지 본문의 sha256 지문을 반환합니다."""
+    return hashlib.sha256(normalize_html_content(html_content).encode('utf-8')).hexdigest()
+
+class RequestGovernor:
+    """
+    Jira, Confluence, Slack 요청에 공통으로 적용하는 요청 제어기입니다.
+
+    - 호스트별 token bucket으로 초당 요청 수를 제한합니다.
+    - 429/5xx 응답이나 연결 오류는 지수 백오프(jitter 포함)로 재시도하며, Retry-After 헤더가 있으면 그 값을 따릅니다.
+      멱등이 아닌 요청(POST)은 중복 생성/전송을 막기 위해 429와 연결 단계 오류만 재시도합니다.
+    - 실행 한 번에 허용하는 전체 재시도 횟수(retry_budget)를 넘으면 더 이상 재시도하지 않습니다.
+    """
+    
+    def __init__(self, rate=REQUEST_RATE_PER_SECOND, burst=REQUEST_BURST, max_retries=REQUEST_MAX_RETRIES,
+                 backoff_base=REQUEST_BACKOFF_BASE_SECONDS, backoff_max=REQUEST_BACKOFF_MAX_SECONDS,
+                 retry_budget=REQUEST_RETRY_BUDGET, sleep=time.sleep, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_budget = retry_budget
+        self.sleep = sleep
+        self.clock = clock
+        self.retries = 0
+        self.throttled = 0
+        self._buckets = {}  # host -> [남은 토큰 수, 마지막 갱신 시각]
+        self._lock = threading.Lock()
+    
+    def acquire(self, host):
+        """host에 대한 요청 토큰을 하나 얻을 때까지 기다립니다."""
+        while True:
+            with self._lock:
+                now = self.clock()
+                tokens, last = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            self.sleep(wait)
+    
+    def _take_retry(self):
+        with self._lock:
+            if self.retries >= self.retry_budget:
+                return False
+            self.retries += 1
+            return True
+    
+    def retry_delay(self, attempt, response=None):
+        """Retry-After 헤더가 있으면 그 값을, 없으면 jitter가 포함된 지수 백오프 대기 시간을 반환합니다."""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return min(self.backoff_max, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    return min(self.backoff_max, max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds()))
+                except (TypeError, ValueError):
+                    pass
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+    
+    @staticmethod
+    def is_retryable_error(method, error):
+        """요청 오류를 재시도해도 되는지 확인합니다. 멱등이 아닌 요청은 서버에 닿지 않은 연결 단계 오류만 재시도합니다."""
+        if not isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return False
+        if method in IDEMPOTENT_METHODS or isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(error, requests.exceptions.ConnectionError) and isinstance(reason, NewConnectionError)
+    
+    @staticmethod
+    def is_retryable_status(method, status_code):
+        if method in IDEMPOTENT_METHODS:
+            return status_code in RETRYABLE_STATUS_CODES
+        return status_code == 429
+    
+    def execute(self, host, send, method='GET'):
+        """
+        send()로 요청을 보내고, 재시도 가능한 실패는 백오프 후 다시 보냅니다.
+
+        Args:
+            host (str): rate limit을 적용할 호스트
+            send (callable): requests.Response를 반환하는 함수
+            method (str): HTTP 메서드 (재시도 가능 여부 판단에 사용)
+        """
+        method = method.upper()
+        for attempt in range(self.max_retries + 1):
+            self.acquire(host)
+            try:
+                response = send()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not self.is_retryable_error(method, e) or attempt == self.max_retries or not self._take_retry():
+                    raise
+                delay = self.retry_delay(attempt)
+                print(f"⚠️ {host} 요청 오류 ({e.__class__.__name__}), {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                self.sleep(delay)
+                continue
+            
+            if response.status_code == 429:
+                self.throttled += 1
+            if not self.is_retryable_status(method, response.status_code):
+                return response
+            if attempt == self.max_retries or not self._take_retry():
+                return response
+            delay = self.retry_delay(attempt, response)
+            print(f"⚠️ {host} 응답 {response.status_code}, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+            response.close()
+            self.sleep(delay)
+        return response
+    
+    def stats_text(self):
+        return f"요청 제어: 재시도 {self.retries}/{self.retry_budget}회, 429 응답 {self.throttled}회"
+
+REQUEST_GOVERNOR = RequestGovernor()
+
+class GovernedHTTPAdapter(HTTPAdapter):
+    """
+    모든 요청을 RequestGovernor를 거쳐 보내는 requests 어댑터입니다.
+    timeout이 지정되지 않은 요청에는 연결/읽기 timeout을 명시적으로 적용합니다.
+    """
+    
+    def __init__(self, governor=REQUEST_GOVERNOR, connect_timeout=HTTP_CONNECT_TIMEOUT_SECONDS,
+                 read_timeout=HTTP_READ_TIMEOUT_SECONDS, **kwargs):
+        self.governor = governor
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        timeout = kwargs.get('timeout')
+        if timeout is None:
+            kwargs['timeout'] = (self.connect_timeout, self.read_timeout)
+        elif isinstance(timeout, (int, float)):
+            kwargs['timeout'] = (min(self.connect_timeout, timeout), timeout)
+        host = urlparse(request.url).netloc
+        return self.governor.execute(
+            host, lambda: super(GovernedHTTPAdapter, self).send(request, **kwargs), method=request.method or 'GET'
+        )
+
+_SHARED_HTTP_ADAPTER = None
+_SHARED_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+def get_shared_http_adapter():
+    """모든 세션이 함께 사용하는 keep-alive 연결 풀 어댑터를 반환합니다."""
+    global _SHARED_HTTP_ADAPTER
+    with _HTTP_SESSION_LOCK:
+        if _SHARED_HTTP_ADAPTER is None:
+            _SHARED_HTTP_ADAPTER = GovernedHTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=0  # 재시도는 RequestGovernor가 담당
+            )
+        return _SHARED_HTTP_ADAPTER
+
+def create_http_session(session=None):
+    """
+    공유 연결 풀, 요청 제어, timeout, 압축 설정이 적용된 requests 세션을 만듭니다.
+    session을 넘기면 (예: jira 클라이언트가 만든 세션) 해당 세션에 같은 설정을 적용합니다.
+    """
+    session = session if session is not None else requests.Session()
+    adapter = get_shared_http_adapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,
+        'Connection': 'keep-alive'
+    })
+    return session
+
+def get_http_session():
+    """Slack 등 라이브러리 클라이언트가 없는 요청에 사용하는 공유 세션을 반환합니다."""
+    global _SHARED_HTTP_SESSION
+    if _SHARED_HTTP_SESSION is None:
+        _SHARED_HTTP_SESSION = create_http_session()
+    return _SHARED_HTTP_SESSION
+
+def create_jira_client(url, username, token):
+    """공유 HTTP 세션 설정이 적용된 JIRA 클라이언트를 만듭니다."""
+    # 재시도는 RequestGovernor가 담당하므로 jira 라이브러리 자체 재시도는 끕니다.
+    jira = JIRA(server=url, basic_auth=(username, token), max_retries=0,
+                timeout=(HTTP_CONNECT_TIMEOUT_SECONDS, HTTP_READ_TIMEOUT_SECONDS))
+    create_http_session(jira._session)
+    return jira
+
+def create_confluence_client(url, username, token):
+    """공유 HTTP 세션 설정이 적용된 Confluence 클라이언트를 만듭니다."""
+    return Confluence(url=url, username=username, password=token, cloud=True,
+                      session=create_http_session(), timeout=HTTP_READ_TIMEOUT_SECONDS)
+
 # 기본 Jira 매크로 (날짜 포맷 없음)
 JIRA_MACRO_TEMPLATE = '''
 <ac:structured-macro ac:name="jira">
@@ -185,6 +537,25 @@ DEPLOY_LINKS_MACRO_TEMPLATE = '''
 </ac:structured-macro>
 '''
 
+# 간결 렌더링(--compact): 인라인 스타일 없이 Confluence 기본 표 스타일과 상태(status) 매크로만 사용합니다.
+# (storage 형식은 <style> 블록과 class 속성을 저장하지 않습니다)
+COMPACT_PAGE_HEADER = '''<p><strong>⚠️ 자동 생성 페이지입니다. 직접 편집하면 다음 업데이트 시 변경사항이 사라집니다.</strong></p>
+'''
+
+COMPACT_TABLE_HEADER = '''<h2>배포 예정 목록</h2>
+<table><tbody>
+<tr><th>키</th><th>요약</th><th>연결된 이슈</th></tr>
+'''
+
+# 정적 이슈 표(--static-table) 열: Jira 매크로(JIRA_CUSTOM_DATE_FORMAT_TEMPLATE)의 columns와 같은 순서
+STATIC_TABLE_COLUMNS = ['키', '유형', '상태', '요약', '담당자', '생성일', '수정일', '예정된 시작']
+
+# get_status_style()의 색상 → 간결 렌더링 상태 매크로 색상 (그 밖의 상태는 Grey)
+COMPACT_STATUS_COLOURS = {
+    'background-color: #FFE4B5; color: #8B4513;': 'Yellow',
+    'background-color: #90EE90; color: #006400;': 'Green',
+}
+
 
 # === [2단계] API/알림/스냅샷 래퍼 함수 간소화 ===
 def get_jira_issues_simple(jira, project_key, date_field_id, start_date, end_date):
@@ -223,20 +594,43 @@ def get_jira_issues_simple(jira, project_key, date_field_id, start_date, end_dat
         return []
 
 
-def create_confluence_content(jql_query, issues, jira_url, jira, jira_project_key, start_date_str, end_date_str, use_pagination=False): 
-    # 이슈 수 계산
-    issue_count = len(issues) if issues else 0
+def create_confluence_content(jql_query, issues, jira_url, jira, jira_project_key, start_date_str, end_date_str, use_pagination=False, use_issue_store=False, compact=False, static_table=False): 
+    """주간 페이지 본문을 만듭니다. 배포 예정 목록을 하위 페이지로 나누지 않습니다."""
+    content, _ = create_confluence_page_set(
+        jql_query, issues, jira_url, jira, jira_project_key, start_date_str, end_date_str,
+        use_pagination, use_issue_store, compact, static_table
+    )
+    return content
+
+def create_confluence_page_set(jql_query, issues, jira_url, jira, jira_project_key, start_date_str, end_date_str, use_pagination=False, use_issue_store=False, compact=False, static_table=False, page_title=None, compare_size=False):
+    """
+    주간 페이지 본문과 배포 예정 목록 하위 페이지들을 만듭니다.
+    page_title을 주면 배포 예정 표가 예산을 넘을 때 하위 페이지로 나눕니다 (create_deploy_links_section 참고).
+    compact와 compare_size를 함께 주면 기본 본문도 만들어 크기를 비교 출력합니다.
+
+    Returns:
+        tuple: (주간 페이지 본문, [(하위 페이지 제목, 본문), ...])
+    """
+    # get_jira_issues_by_customfield_10817 함수를 사용하여 정확한 배포 예정 티켓 조회
+    print(f"=== Confluence 페이지용 배포 예정 티켓 조회 ===")
+    deploy_issues = get_jira_issues_by_customfield_10817(jira, jira_project_key, start_date_str, end_date_str, use_pagination, use_issue_store=use_issue_store)
     
-    # 날짜 포맷이 적용된 전체 매크로 사용 (이슈 수 포함)
-    macro = JIRA_CUSTOM_DATE_FORMAT_TEMPLATE.format(jql_query=jql_query)
+    if static_table:
+        # 조회한 티켓으로 정적 표를 만들어, 페이지를 열 때마다 Jira 매크로가 JQL을 다시 실행하지 않도록 합니다.
+        macro = render_static_issue_table(deploy_issues, jira_url, compact)
+        issue_status_guide = f"<em>• 총 {len(deploy_issues)}건 (리포트 갱신 시점 기준, 다음 업데이트 때 다시 반영됩니다)</em>"
+    else:
+        # 날짜 포맷이 적용된 전체 매크로 사용 (이슈 수 포함)
+        macro = JIRA_CUSTOM_DATE_FORMAT_TEMPLATE.format(jql_query=jql_query)
+        issue_status_guide = '''<em>• 매크로 로딩 중에는 "검색된 이슈가 없습니다" 메시지가 표시될 수 있습니다<br>
+• 로딩이 완료되면 실제 이슈 목록이 표시됩니다<br>
+• 새로고침 버튼을 클릭하여 최신 데이터를 확인할 수 있습니다</em>'''
     
     # 이슈 수 표시 섹션 추가
     issue_count_section = f'''
 <div style="background-color: #f8f9fa; padding: 12px; border-radius: 5px; margin-bottom: 15px; border-left: 4px solid #007bff;">
 <h3 style="margin: 0 0 8px 0; color: #007bff;">📈 이번 주 배포 예정 이슈 현황</h3>
-<em>• 매크로 로딩 중에는 "검색된 이슈가 없습니다" 메시지가 표시될 수 있습니다<br>
-• 로딩이 완료되면 실제 이슈 목록이 표시됩니다<br>
-• 새로고침 버튼을 클릭하여 최신 데이터를 확인할 수 있습니다</em>
+{issue_status_guide}
 </div>
 
 <div style="background-color: #fff3cd; border: 1px solid #ffeaa7; border-radius: 5px; padding: 12px; margin-bottom: 15px;">
@@ -251,15 +645,20 @@ def create_confluence_content(jql_query, issues, jira_url, jira, jira_project_ke
 </div>
 '''
     
-    # get_jira_issues_by_customfield_10817 함수를 사용하여 정확한 배포 예정 티켓 조회
-    print(f"=== Confluence 페이지용 배포 예정 티켓 조회 ===")
-    deploy_issues = get_jira_issues_by_customfield_10817(jira, jira_project_key, start_date_str, end_date_str, use_pagination)
+    # 간결 렌더링에서 기본 본문과 크기를 비교할 때는 연결된 IT 티켓을 한 번만 조회해 두 표에 함께 사용합니다.
+    linked_tickets_by_issue = enrich_linked_it_tickets(jira, deploy_issues) if compact and compare_size else None
     
-    # IT 티켓만 필터링하는 HTML 테이블 생성 (정확한 결과 사용)
-    deploy_links_html_table = create_deploy_links_html_table_with_issues(jira, deploy_issues, jira_url)
-    
-    # 전체 너비 레이아웃을 위한 컨테이너 추가 (이슈 현황 섹션 제외)
-    full_width_container = '''
+    content = None
+    if not compact or compare_size:
+        # IT 티켓만 필터링하는 HTML 테이블 생성 (정확한 결과 사용)
+        # 간결 렌더링에서는 기본 표를 크기 비교에만 쓰므로 간결 표만 하위 페이지로 나눕니다.
+        deploy_links_html_table, child_pages = create_deploy_links_section(
+            jira, deploy_issues, jira_url, linked_tickets_by_issue=linked_tickets_by_issue,
+            page_title=None if compact else page_title
+        )
+        
+        # 전체 너비 레이아웃을 위한 컨테이너 추가 (이슈 현황 섹션 제외)
+        full_width_container = '''
 <div style="width: 100%; max-width: none; margin: 0; padding: 0; overflow-x: auto;">
 <style>
 .ac-content-wrapper {
@@ -276,16 +675,94 @@ def create_confluence_content(jql_query, issues, jira_url, jira, jira_project_ke
 }
 </style>
 '''
+        
+        content = issue_count_section + full_width_container + macro + deploy_links_html_table + '</div>'
+    
+    if compact:
+        compact_table, child_pages = create_deploy_links_section(
+            jira, deploy_issues, jira_url, compact=True, linked_tickets_by_issue=linked_tickets_by_issue,
+            page_title=page_title
+        )
+        standard_size = len(content.encode('utf-8')) if content is not None else None
+        content = COMPACT_PAGE_HEADER + macro + compact_table
+        if standard_size is not None:
+            compact_size = len(content.encode('utf-8'))
+            print(f"📦 페이지 본문 크기: 기본 {standard_size:,}바이트 → 간결 {compact_size:,}바이트 "
+                  f"({(1 - compact_size / standard_size) * 100:.0f}% 감소)")
+    
+    return content, child_pages
+
+def format_jira_datetime(value):
+    """Jira 날짜 값("2025-07-23T11:00:00.000+0900")을 KST 기준 'YYYY-MM-DD HH:MM' 문자열로 바꿉니다."""
+    if not value:
+        return ''
+    try:
+        parsed = datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f%z')
+    except (TypeError, ValueError):
+        return str(value)[:16].replace('T', ' ')
+    return parsed.astimezone(DEPLOY_DATE_TIMEZONE).strftime('%Y-%m-%d %H:%M')
+
+def render_static_issue_table(deploy_issues, jira_url, compact=False):
+    """
+    조회한 배포 예정 티켓으로 Jira 매크로와 같은 열의 정적 표를 만듭니다.
+    매크로처럼 예정된 시작 오름차순으로 정렬합니다 (값이 없는 티켓은 마지막).
+    """
+    deploy_issues = [IssueRecord.coerce(issue) for issue in deploy_issues]
+    column = build_deploy_date_column([issue.deploy_date for issue in deploy_issues])
+    order = np.argsort(column, kind='stable')
+    
+    if compact:
+        cell, header_cell, table_open = '<td>{}</td>', '<th>{}</th>', '<table><tbody>'
+    else:
+        cell = '<td style="padding: 8px; border: 1px solid #dfe1e6;">{}</td>'
+        header_cell = '<th style="text-align: left; background-color: #f4f5f7; padding: 8px; border: 1px solid #dfe1e6;">{}</th>'
+        table_open = '<table class="wrapped" style="width: 100%;"><tbody>'
     
-    return issue_count_section + full_width_container + macro + deploy_links_html_table + '</div>'
+    rows = [table_open, '<tr>' + ''.join(header_cell.format(name) for name in STATIC_TABLE_COLUMNS) + '</tr>']
+    for index in order:
+        issue = deploy_issues[index]
+        values = [
+            f'<a href="{jira_url}/browse/{issue.key}">{issue.key}</a>',
+            html.escape(issue.issue_type),
+            html.escape(issue.status),
+            html.escape(issue.summary),
+            html.escape(issue.assignee),
+            format_jira_datetime(issue.created),
+            format_jira_datetime(issue.updated),
+            format_jira_datetime(issue.deploy_date),
+        ]
+        rows.append('<tr>' + ''.join(cell.format(value) for value in values) + '</tr>')
+    if not deploy_issues:
+        rows.append(f'<tr><td colspan="{len(STATIC_TABLE_COLUMNS)}"><em>배포 예정 티켓 없음</em></td></tr>')
+    rows.append('</tbody></table>')
+    return '\n'.join(rows) + '\n'
+
+def create_deploy_links_html_table_with_issues(jira, deploy_issues, jira_url, compact=False, linked_tickets_by_issue=None):
+    """
+    정확한 배포 예정 티켓들을 사용하여 HTML 테이블을 생성합니다.
+    compact=True이면 안내 문구와 인라인 스타일 없이 Confluence 기본 표 스타일과 상태(status) 매크로를 사용합니다
+    (COMPACT_PAGE_HEADER는 자동 생성 안내 문구만 포함합니다).
+    linked_tickets_by_issue를 주면 연결된 IT 티켓을 다시 조회하지 않습니다.
+    """
+    html_content, _ = create_deploy_links_section(jira, deploy_issues, jira_url, compact, linked_tickets_by_issue)
+    return html_content
 
-def create_deploy_links_html_table_with_issues(jira, deploy_issues, jira_url):
-    """정확한 배포 예정 티켓들을 사용하여 HTML 테이블을 생성합니다."""
+def create_deploy_links_section(jira, deploy_issues, jira_url, compact=False, linked_tickets_by_issue=None, page_title=None):
+    """
+    주간 페이지에 넣을 배포 예정 목록을 만듭니다.
+
+    page_title을 주고 표가 PAGE_SPLIT_MAX_ROWS/PAGE_SPLIT_MAX_BYTES 예산을 넘으면, 표를 배포 예정일별 하위 페이지 본문들로
+    나누고 주간 페이지에는 하위 페이지 목차만 넣습니다.
+
+    Returns:
+        tuple: (주간 페이지에 넣을 HTML, [(하위 페이지 제목, 본문), ...]). 나누지 않으면 하위 페이지 목록은 비어 있습니다.
+    """
     try:
         print(f"=== 정확한 배포 예정 티켓으로 HTML 테이블 생성 ===")
         print(f"배포 예정 티켓 수: {len(deploy_issues)}")
+        deploy_issues = [IssueRecord.coerce(issue) for issue in deploy_issues]
         
-        html_content = '''
+        header = '''
 <h2 style="margin-top: 20px;">배포 예정 목록</h2>
 <p><em>아래 표는 이번 주 배포 예정인 부모 IT 티켓들을 보여줍니다. 각 티켓의 배포 관계는 Jira에서 직접 확인하실 수 있습니다.</em></p>
 
@@ -314,57 +791,220 @@ def create_deploy_links_html_table_with_issues(jira, deploy_issues, jira_url):
 </tr>
 '''
         
-        for i, issue in enumerate(deploy_issues, 1):
-            issue_key = issue['key']
-            
-            # 데이터 구조에 따라 summary와 status 추출
-            if 'fields' in issue:
-                # get_jira_issues_by_customfield_10817 함수의 구조
-                summary = issue['fields'].get('summary', '')
-                status = issue['fields'].get('status', {}).get('name', '')
-                custom_field = issue['fields'].get(JIRA_DEPLOY_DATE_FIELD_ID, '')
-            else:
-                # 기존 구조
-                summary = issue.get('summary', '')
-                status = issue.get('status', '')
-                custom_field = issue.get('customfield_10817', '')
-            
-            print(f"{i}. {issue_key}: {summary}")
-            print(f"   예정된 시작: {custom_field}")
-            print(f"   상태: {status}")
-            
-            # IT 티켓만 필터링하여 연결된 이슈 조회 (재시도 로직 포함)
-            linked_it_tickets = get_linked_it_tickets_with_retry(jira, issue_key)
-            print(f"   연결된 IT 티켓 수: {len(linked_it_tickets)}")
-            
-            # 연결된 IT 티켓들을 포맷팅
-            if linked_it_tickets:
-                linked_tickets_html = '<br>'.join([
-                    f"{j}. <a href=\"{jira_url}/browse/{ticket['key']}\">{ticket['key']}</a><span style=\"display: inline-block; padding: 2px 8px; margin-left: 4px; border-radius: 12px; font-size: 11px; font-weight: 500; {get_status_style(ticket['status'])}\">{ticket['status']}</span><br>: {ticket['summary']}"
-                    for j, ticket in enumerate(linked_it_tickets, 1)
-                ])
-            else:
-                linked_tickets_html = '<em>연결된 IT 티켓 없음</em>'
-            
-            html_content += f'''
-<tr>
-<td style="padding: 8px; border: 1px solid #dfe1e6;"><a href="{jira_url}/browse/{issue_key}">{issue_key}</a></td>
-<td style="padding: 8px; border: 1px solid #dfe1e6;">{summary}</td>
-<td style="padding: 8px; border: 1px solid #dfe1e6;">{linked_tickets_html}</td>
-</tr>
-'''
+        if compact:
+            header = COMPACT_TABLE_HEADER
         
-        html_content += '''
+        footer = '''
 </tbody>
 </table>
 '''
         
-        print(f"=== HTML 테이블 생성 완료 ===")
-        return html_content
+        # 행은 연결된 IT 티켓 조회가 끝나는 순서(원래 순서)대로 만들어 한 번에 이어 붙입니다.
+        rows = iter_deploy_link_rows(jira, deploy_issues, jira_url, compact, linked_tickets_by_issue)
+        if page_title is None:
+            html_content = ''.join([header, *rows, footer])
+            print(f"=== HTML 테이블 생성 완료 ===")
+            return html_content, []
+        
+        rows = list(rows)
+        if rows_fit_budget(rows):
+            html_content = ''.join([header, *rows, footer])
+            print(f"=== HTML 테이블 생성 완료 ===")
+            return html_content, []
+        
+        # 하위 페이지마다 같은 표 머리글을 두어, 각 페이지를 따로 열어도 완전한 표가 되도록 합니다.
+        child_pages = []
+        index_entries = []
+        for label, day, chunk in split_rows_by_deploy_day(deploy_issues, rows):
+            child_title = get_child_page_title(page_title, label)
+            body = ''.join([COMPACT_PAGE_HEADER if compact else '', header, *chunk, footer])
+            child_pages.append((child_title, body))
+            index_entries.append((child_title, len(chunk), day))
+        print(f"=== 배포 예정 목록을 하위 페이지 {len(child_pages)}개로 나눔 (행 {len(deploy_issues)}개) ===")
+        return render_child_page_index(index_entries, compact), child_pages
         
     except Exception as e:
         print(f"배포 예정 목록 HTML 테이블 생성 실패: {e}")
-        return f'<p>배포 예정 목록 HTML 테이블 생성 중 오류가 발생했습니다: {e}</p>'
+        return f'<p>배포 예정 목록 HTML 테이블 생성 중 오류가 발생했습니다: {e}</p>', []
+
+def rows_fit_budget(rows, max_rows=None, max_bytes=None):
+    """표의 행(HTML)이 행 수와 바이트 수 예산 안에 들어가면 True. 예산이 0이면 해당 제한을 두지 않습니다."""
+    max_rows = PAGE_SPLIT_MAX_ROWS if max_rows is None else max_rows
+    max_bytes = PAGE_SPLIT_MAX_BYTES if max_bytes is None else max_bytes
+    if max_rows and len(rows) > max_rows:
+        return False
+    return not max_bytes or sum(len(row.encode('utf-8')) for row in rows) <= max_bytes
+
+def split_rows_by_deploy_day(deploy_issues, rows, max_rows=None, max_bytes=None):
+    """
+    표의 행(HTML)을 배포 예정일(KST) 단위로 묶습니다.
+
+    묶음 경계가 앞선 행의 개수가 아니라 각 티켓의 날짜로 정해지므로, 티켓이 추가/삭제/변경되어도
+    그 날짜의 하위 페이지만 바뀌고 다른 날짜의 하위 페이지는 그대로입니다.
+    하루치가 예산을 넘으면 티켓 키의 해시로 예산에 맞는 최소 개수의 조각으로 나눕니다 (조각 수가 같으면 키의 조각은 고정).
+
+    Returns:
+        list: 날짜순 [(제목 라벨, 날짜 표시, [행, ...]), ...]. 예정일이 없는 티켓은 '날짜 미정'으로 맨 뒤에 둡니다.
+    """
+    days = build_deploy_date_column([issue.deploy_date for issue in deploy_issues]).astype('datetime64[D]')
+    by_day = {}
+    for day, issue, row in zip(days, deploy_issues, rows):
+        by_day.setdefault(None if np.isnat(day) else str(day), []).append((issue.key, row))
+    
+    groups = []
+    for day in sorted(by_day, key=lambda value: (value is None, value or '')):
+        day_label = '날짜 미정' if day is None else f"{day[5:7]}/{day[8:10]}"
+        entries = by_day[day]
+        parts = 1
+        while True:
+            buckets = [[] for _ in range(parts)]
+            for key, row in entries:
+                buckets[int(hashlib.sha256(key.encode('utf-8')).hexdigest(), 16) % parts].append(row)
+            if parts >= len(entries) or all(rows_fit_budget(bucket, max_rows, max_bytes) for bucket in buckets):
+                break
+            parts += 1
+        if parts == 1:
+            groups.append((day_label, day_label, buckets[0]))
+            continue
+        for part, bucket in enumerate(buckets, 1):
+            if bucket:
+                groups.append((f"{day_label} ({part}/{parts})", day_label, bucket))
+    return groups
+
+def get_child_page_title(page_title, label):
+    """주간 페이지 아래 배포 예정 목록 하위 페이지 제목 (예: "7월 4째주: (07/21~07/27) - 배포 예정 목록 07/23")"""
+    return f"{page_title} - 배포 예정 목록 {label}"
+
+def render_child_page_index(index_entries, compact=False):
+    """하위 페이지로 나눈 배포 예정 목록의 목차 표를 만듭니다. index_entries: [(제목, 티켓 수, 배포 예정일), ...]"""
+    if compact:
+        cell, header_cell, table_open = '<td>{}</td>', '<th>{}</th>', '<h2>배포 예정 목록</h2>\n<table><tbody>'
+    else:
+        cell = '<td style="padding: 8px; border: 1px solid #dfe1e6;">{}</td>'
+        header_cell = '<th style="text-align: left; background-color: #f4f5f7; padding: 8px; border: 1px solid #dfe1e6;">{}</th>'
+        table_open = ('<h2 style="margin-top: 20px;">배포 예정 목록</h2>\n'
+                      f'<p><em>배포 예정 티켓이 많아 {len(index_entries)}개의 하위 페이지로 나누어 게시합니다.</em></p>\n'
+                      '<table class="wrapped" style="width: 100%;"><tbody>')
+    rows = [table_open, '<tr>' + ''.join(header_cell.format(name) for name in ('페이지', '티켓 수', '배포 예정일')) + '</tr>']
+    for title, count, day in index_entries:
+        link = f'<ac:link><ri:page ri:content-title="{html.escape(title)}" /></ac:link>'
+        rows.append('<tr>' + ''.join(cell.format(value) for value in (link, count, day)) + '</tr>')
+    rows.append('</tbody></table>')
+    return '\n'.join(rows) + '\n'
+
+class RowRenderCache:
+    """
+    배포 예정 표의 행 HTML을 행 지문(row_fingerprint) 기준으로 저장하는 영구 캐시입니다.
+
+    지문이 같은 행은 다시 만들지 않고 저장된 HTML을 사용하므로, 표 생성 시간은 바뀐 행 수에 비례합니다.
+    저장 시 이번 실행에서 사용한 행을 우선 남기고 max_entries를 넘는 항목은 정리합니다.
+    """
+    
+    def __init__(self, path=ROW_RENDER_CACHE_FILE_PATH, max_entries=ROW_RENDER_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.rows = None
+        self.hits = 0
+        self.misses = 0
+        self._used = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+    
+    def _ensure_loaded(self):
+        if self.rows is None:
+            rows = read_json(self.path, default={})
+            self.rows = rows if isinstance(rows, dict) else {}
+    
+    def get(self, fingerprint):
+        with self._lock:
+            self._ensure_loaded()
+            row = self.rows.get(fingerprint)
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._used.add(fingerprint)
+            return row
+    
+    def put(self, fingerprint, row):
+        with self._lock:
+            self._ensure_loaded()
+            self.rows[fingerprint] = row
+            self._used.add(fingerprint)
+            self._dirty = True
+    
+    def save(self):
+        if self.rows is None:
+            return
+        with self._lock:
+            if len(self.rows) > self.max_entries:
+                used = [key for key in self.rows if key in self._used]
+                others = [key for key in reversed(list(self.rows)) if key not in self._used]
+                keep = set(used + others[:max(0, self.max_entries - len(used))])
+                self.rows = {key: row for key, row in self.rows.items() if key in keep}
+                self._dirty = True
+            if self._dirty:
+                write_json(self.path, self.rows)
+                self._dirty = False
+    
+    def stats_text(self):
+        return f"배포 예정 표 행 캐시: 재사용 {self.hits}행, 새로 생성 {self.misses}행"
+
+ROW_RENDER_CACHE = RowRenderCache()
+
+def row_fingerprint(issue, linked_it_tickets, jira_url, compact=False):
+    """행 HTML을 결정하는 값(렌더링 방식, 티켓 키/요약/상태, 연결된 IT 티켓 키/상태/요약)의 지문을 반환합니다."""
+    row_source = [
+        ROW_RENDER_VERSION, compact, jira_url, issue.key, issue.summary, issue.status,
+        [(ticket['key'], ticket['status'], ticket['summary']) for ticket in linked_it_tickets]
+    ]
+    return hashlib.sha256(json.dumps(row_source, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def render_deploy_link_row(issue, linked_it_tickets, jira_url, compact=False):
+    """배포 예정 티켓 한 건의 표 행(HTML)을 만듭니다."""
+    if compact:
+        linked_tickets_html = '<br>'.join([
+            f'{j}. <a href="{jira_url}/browse/{ticket["key"]}">{ticket["key"]}</a>'
+            f' {render_status_macro(ticket["status"])}<br>: {ticket["summary"]}'
+            for j, ticket in enumerate(linked_it_tickets, 1)
+        ]) or '<em>연결된 IT 티켓 없음</em>'
+        return (f'<tr><td><a href="{jira_url}/browse/{issue.key}">{issue.key}</a></td>'
+                f'<td>{issue.summary}</td><td>{linked_tickets_html}</td></tr>\n')
+    
+    # 연결된 IT 티켓들을 포맷팅
+    if linked_it_tickets:
+        linked_tickets_html = '<br>'.join([
+            f"{j}. <a href=\"{jira_url}/browse/{ticket['key']}\">{ticket['key']}</a><span style=\"display: inline-block; padding: 2px 8px; margin-left: 4px; border-radius: 12px; font-size: 11px; font-weight: 500; {get_status_style(ticket['status'])}\">{ticket['status']}</span><br>: {ticket['summary']}"
+            for j, ticket in enumerate(linked_it_tickets, 1)
+        ])
+    else:
+        linked_tickets_html = '<em>연결된 IT 티켓 없음</em>'
+    
+    return f'''
+<tr>
+<td style="padding: 8px; border: 1px solid #dfe1e6;"><a href="{jira_url}/browse/{issue.key}">{issue.key}</a></td>
+<td style="padding: 8px; border: 1px solid #dfe1e6;">{issue.summary}</td>
+<td style="padding: 8px; border: 1px solid #dfe1e6;">{linked_tickets_html}</td>
+</tr>
+'''
+
+def iter_deploy_link_rows(jira, deploy_issues, jira_url, compact=False, linked_tickets_by_issue=None):
+    """
+    배포 예정 티켓(IssueRecord)마다 연결된 IT 티켓을 조회하여 표의 행(HTML)을 차례대로 내보냅니다.
+    행 지문이 ROW_RENDER_CACHE에 있으면 저장된 행을 그대로 사용합니다.
+    """
+    if linked_tickets_by_issue is None:
+        linked_tickets_by_issue = iter_linked_it_tickets(jira, deploy_issues)
+    for i, (issue, linked_it_tickets) in enumerate(zip(deploy_issues, linked_tickets_by_issue), 1):
+        logger.debug("%d. %s: %s (예정된 시작: %s, 상태: %s, 연결된 IT 티켓 %d개)",
+                     i, issue.key, issue.summary, issue.deploy_date, issue.status, len(linked_it_tickets))
+        
+        fingerprint = row_fingerprint(issue, linked_it_tickets, jira_url, compact)
+        row = ROW_RENDER_CACHE.get(fingerprint)
+        if row is None:
+            row = render_deploy_link_row(issue, linked_it_tickets, jira_url, compact)
+            ROW_RENDER_CACHE.put(fingerprint, row)
+        yield row
 
 def get_status_style(status):
     """상태에 따른 CSS 스타일을 반환합니다."""
@@ -379,90 +1019,294 @@ def get_status_style(status):
     }
     return status_styles.get(status, 'background-color: #D3D3D3; color: #2F4F4F;')
 
-def get_linked_it_tickets(jira, issue_key):
-    """특정 이슈의 'is deployed by' 관계로 연결된 IT 티켓들을 가져옵니다."""
-    try:
-        print(f"=== '{issue_key}'의 연결된 IT 티켓 조회 시작 ===")
-        
-        # Jira API에서 이슈 정보를 가져옵니다 (issuelinks 확장)
-        issue_response = jira.issue(issue_key, expand='issuelinks')
+def render_status_macro(status):
+    """간결 렌더링의 상태 배지를 Confluence 상태(status) 매크로로 만듭니다 (색상은 get_status_style()과 같은 구분)."""
+    colour = COMPACT_STATUS_COLOURS.get(get_status_style(status), 'Grey')
+    return ('<ac:structured-macro ac:name="status">'
+            f'<ac:parameter ac:name="colour">{colour}</ac:parameter>'
+            f'<ac:parameter ac:name="title">{html.escape(status)}</ac:parameter>'
+            '</ac:structured-macro>')
+
+# 배포 관련 링크 타입 (Deployments, is deployed by로 제한)
+DEPLOYMENT_LINK_TYPES = ['Deployments', 'is deployed by']
+# IT 관련 이슈 타입들 (더 유연한 필터링)
+IT_ISSUE_TYPES = ['변경', 'Change', 'IT', '개발', 'Development', 'Task', 'Sub-task']
+
+def extract_linked_it_tickets(issue_links):
+    """issuelinks 목록에서 'is deployed by' 관계로 연결된 IT 티켓들을 추출합니다."""
+    linked_it_tickets = []
+    for i, link in enumerate(issue_links):
+        link_type = link.get('type', {}).get('name', '')
         
-        # 응답이 딕셔너리인지 확인
-        if isinstance(issue_response, dict):
-            issue_data = issue_response
-        else:
-            # 객체인 경우 딕셔너리로 변환
-            issue_data = issue_response.raw
+        linked_ticket = None
         
-        linked_it_tickets = []
+        if link_type in DEPLOYMENT_LINK_TYPES:
+            # IT-5332의 경우: IT-5332가 배포되는 관계이므로 inwardIssue가 배포 티켓
+            linked_ticket = link.get('inwardIssue') or link.get('outwardIssue')
         
-        # issuelinks 필드가 있는지 확인
-        if 'fields' in issue_data and 'issuelinks' in issue_data['fields']:
-            print(f"발견된 issuelinks 수: {len(issue_data['fields']['issuelinks'])}")
+        # 연결된 티켓이 IT 관련 타입인 경우 추가
+        if linked_ticket:
+            issue_type = linked_ticket.get('fields', {}).get('issuetype', {}).get('name', '')
             
-            for i, link in enumerate(issue_data['fields']['issuelinks']):
-                link_type = link.get('type', {}).get('name', '')
-                print(f"  링크 {i+1}: {link_type}")
-                
-                linked_ticket = None
-                
-                # 배포 관련 링크 타입만 확인 (Deployments, is deployed by로 제한)
-                deployment_link_types = ['Deployments', 'is deployed by']
-                if link_type in deployment_link_types:
-                    # IT-5332의 경우: IT-5332가 배포되는 관계이므로 inwardIssue가 배포 티켓
-                    if 'inwardIssue' in link:
-                        linked_ticket = link['inwardIssue']
-                        print(f"    inwardIssue 발견: {linked_ticket.get('key', 'Unknown')}")
-                    elif 'outwardIssue' in link:
-                        linked_ticket = link['outwardIssue']
-                        print(f"    outwardIssue 발견: {linked_ticket.get('key', 'Unknown')}")
-                
-                # 연결된 티켓이 IT 관련 타입인 경우 추가
-                if linked_ticket:
-                    issue_type = linked_ticket.get('fields', {}).get('issuetype', {}).get('name', '')
-                    print(f"    티켓 타입: {issue_type}")
-                    
-                    # IT 관련 이슈 타입들 (더 유연한 필터링)
-                    it_issue_types = ['변경', 'Change', 'IT', '개발', 'Development', 'Task', 'Sub-task']
-                    if any(it_type in issue_type for it_type in it_issue_types):
-                        ticket_info = {
-                            'key': linked_ticket['key'],
-                            'summary': linked_ticket['fields'].get('summary', ''),
-                            'status': linked_ticket['fields'].get('status', {}).get('name', '')
-                        }
-                        linked_it_tickets.append(ticket_info)
-                        print(f"    ✅ IT 티켓 추가: {ticket_info['key']} - {ticket_info['summary']}")
-                    else:
-                        print(f"    ⏭️ IT 타입이 아님: {linked_ticket.get('key', 'Unknown')} ({issue_type})")
-                else:
-                    print(f"    ⏭️ 연결된 티켓 없음")
+            if any(it_type in issue_type for it_type in IT_ISSUE_TYPES):
+                ticket_info = {
+                    'key': linked_ticket['key'],
+                    'summary': linked_ticket['fields'].get('summary', ''),
+                    'status': linked_ticket['fields'].get('status', {}).get('name', '')
+                }
+                linked_it_tickets.append(ticket_info)
+                logger.debug("  링크 %d (%s): ✅ IT 티켓 추가 %s - %s", i + 1, link_type, ticket_info['key'], ticket_info['summary'])
+            else:
+                logger.debug("  링크 %d (%s): ⏭️ IT 타입이 아님 %s (%s)", i + 1, link_type, linked_ticket.get('key', 'Unknown'), issue_type)
         else:
-            print("issuelinks 필드를 찾을 수 없습니다.")
-        
-        print(f"=== '{issue_key}' 연결된 IT 티켓 조회 완료: {len(linked_it_tickets)}개 ===")
-        return linked_it_tickets
-        
+            logger.debug("  링크 %d (%s): ⏭️ 배포 연결 티켓 없음", i + 1, link_type)
+    return linked_it_tickets
+
+def is_issue_links_complete(issue_links):
+    """
+    검색 결과의 issuelinks만으로 연결된 티켓을 판단할 수 있는지 확인합니다.
+    issuelinks가 없거나(요청되지 않음) 연결된 티켓의 fields/issuetype이 잘려 있으면 False를 반환합니다.
+    """
+    if not isinstance(issue_links, list):
+        return False
+    for link in issue_links:
+        linked_ticket = link.get('inwardIssue') or link.get('outwardIssue')
+        if linked_ticket is not None and 'issuetype' not in linked_ticket.get('fields', {}):
+            return False
+    return True
+
+def fetch_linked_it_tickets(jira, issue_key):
+    """
+    특정 이슈의 'is deployed by' 관계로 연결된 IT 티켓들을 Jira에서 조회합니다.
+    조회 실패 시 예외를 그대로 전달하므로 재시도가 필요한 곳에서 사용합니다.
+    """
+    # Jira API에서 이슈 정보를 가져옵니다 (issuelinks 확장)
+    issue_response = jira.issue(issue_key, expand='issuelinks')
+    
+    # 응답이 딕셔너리인지 확인
+    if isinstance(issue_response, dict):
+        issue_data = issue_response
+    else:
+        # 객체인 경우 딕셔너리로 변환
+        issue_data = issue_response.raw
+    
+    linked_it_tickets = []
+    
+    # issuelinks 필드가 있는지 확인
+    if 'fields' in issue_data and 'issuelinks' in issue_data['fields']:
+        logger.debug("'%s' issuelinks 수: %d", issue_key, len(issue_data['fields']['issuelinks']))
+        linked_it_tickets = extract_linked_it_tickets(issue_data['fields']['issuelinks'])
+    else:
+        logger.debug("'%s' issuelinks 필드를 찾을 수 없습니다.", issue_key)
+    
+    logger.debug("'%s' 연결된 IT 티켓 조회 완료: %d개", issue_key, len(linked_it_tickets))
+    return linked_it_tickets
+
+def get_linked_it_tickets(jira, issue_key):
+    """특정 이슈의 'is deployed by' 관계로 연결된 IT 티켓들을 가져옵니다."""
+    try:
+        return fetch_linked_it_tickets(jira, issue_key)
     except Exception as e:
         print(f"'{issue_key}'의 연결된 IT 티켓 조회 실패: {e}")
         return []
 
-def get_linked_it_tickets_with_retry(jira, issue_key, max_retries=3):
-    """재시도 로직을 포함한 연결된 IT 티켓 조회"""
+def get_linked_it_tickets_with_retry(jira, issue_key, max_retries=3, raise_on_failure=False):
+    """
+    재시도 로직을 포함한 연결된 IT 티켓 조회
+
+    최대 재시도 횟수를 넘으면 빈 목록을 반환합니다. raise_on_failure=True이면 마지막 예외를 전달합니다.
+    """
     for attempt in range(max_retries):
         try:
-            result = get_linked_it_tickets(jira, issue_key)
-            if result is not None:  # 성공적인 결과
-                return result
+            return fetch_linked_it_tickets(jira, issue_key)
         except Exception as e:
             print(f"'{issue_key}' 조회 시도 {attempt + 1}/{max_retries} 실패: {e}")
             if attempt < max_retries - 1:
-                import time
-                time.sleep(1)  # 1초 대기 후 재시도
+                time.sleep(REQUEST_GOVERNOR.retry_delay(attempt))  # 지수 백오프 후 재시도
             else:
                 print(f"'{issue_key}' 최대 재시도 횟수 초과")
-                return []
+                if raise_on_failure:
+                    raise
     return []
 
+class LinkedTicketsCache:
+    """
+    연결된 IT 티켓 조회 결과를 (이슈 키, 부모 티켓 updated) 기준으로 저장하는 영구 캐시입니다.
+
+    부모 티켓이 수정되면 updated 값이 바뀌므로 해당 항목은 자동으로 무효화됩니다.
+    연결 티켓의 상태가 바뀌어도 부모 티켓의 updated는 바뀌지 않으므로, 캐시에서 읽기 전에
+    refresh_cached_linked_tickets()가 연결 티켓의 요약/상태를 다시 조회해 refresh_tickets()로 갱신합니다.
+    저장 시 max_age_days보다 오래된 항목과 max_entries를 넘는 오래된 항목을 정리합니다.
+    """
+    
+    def __init__(self, path=LINKED_TICKETS_CACHE_FILE_PATH, max_entries=LINKED_TICKETS_CACHE_MAX_ENTRIES,
+                 max_age_days=LINKED_TICKETS_CACHE_MAX_AGE_DAYS):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.entries = None
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+    
+    def _ensure_loaded(self):
+        if self.entries is None:
+            entries = read_json(self.path, default={})
+            self.entries = entries if isinstance(entries, dict) else {}
+    
+    def get(self, issue_key, updated):
+        """캐시된 연결 티켓 목록을 반환합니다. 없거나 부모 티켓이 수정되었으면 None을 반환합니다."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self.entries.get(issue_key)
+            if entry and entry.get('updated') == updated:
+                self.hits += 1
+                return entry['tickets']
+            self.misses += 1
+            return None
+    
+    def peek(self, issue_key, updated):
+        """적중/미적중을 세지 않고 캐시된 연결 티켓 목록을 반환합니다. 없거나 부모 티켓이 수정되었으면 None."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self.entries.get(issue_key)
+            return entry['tickets'] if entry and entry.get('updated') == updated else None
+    
+    def refresh_tickets(self, issue_keys, latest_by_key):
+        """
+        issue_keys 항목의 연결 티켓 요약/상태를 latest_by_key(연결 티켓 키 → (요약, 상태))로 바꿉니다.
+        다시 조회되지 않은 연결 티켓(삭제, 권한 없음)이 있는 항목은 지워서 개별 조회하게 합니다.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            for issue_key in issue_keys:
+                entry = self.entries.get(issue_key)
+                if entry is None:
+                    continue
+                if any(ticket['key'] not in latest_by_key for ticket in entry['tickets']):
+                    del self.entries[issue_key]
+                    self._dirty = True
+                    continue
+                # 이미 반환한 목록이 바뀌지 않도록 새 dict로 교체합니다.
+                tickets = [
+                    {**ticket, 'summary': latest_by_key[ticket['key']][0], 'status': latest_by_key[ticket['key']][1]}
+                    for ticket in entry['tickets']
+                ]
+                if tickets != entry['tickets']:
+                    entry['tickets'] = tickets
+                    self._dirty = True
+    
+    def forget(self, issue_keys):
+        with self._lock:
+            self._ensure_loaded()
+            for issue_key in issue_keys:
+                if self.entries.pop(issue_key, None) is not None:
+                    self._dirty = True
+    
+    def put(self, issue_key, updated, tickets):
+        with self._lock:
+            self._ensure_loaded()
+            self.entries[issue_key] = {'updated': updated, 'tickets': tickets, 'cached_at': time.time()}
+            self._dirty = True
+    
+    def evict(self):
+        """오래된 항목과 최대 개수를 넘는 항목을 제거합니다."""
+        with self._lock:
+            self._ensure_loaded()
+            cutoff = time.time() - self.max_age_days * 86400
+            entries = {k: v for k, v in self.entries.items() if v.get('cached_at', 0) >= cutoff}
+            if len(entries) > self.max_entries:
+                newest = sorted(entries.items(), key=lambda item: item[1].get('cached_at', 0), reverse=True)
+                entries = dict(newest[:self.max_entries])
+            if len(entries) != len(self.entries):
+                self._dirty = True
+            self.entries = entries
+    
+    def save(self):
+        if self.entries is None:
+            return
+        self.evict()
+        if self._dirty:
+            write_json(self.path, self.entries)
+            self._dirty = False
+    
+    def stats_text(self):
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total else 0
+        return f"연결된 IT 티켓 캐시: 적중 {self.hits}회, 미적중 {self.misses}회 (적중률 {hit_rate:.0f}%)"
+
+LINKED_TICKETS_CACHE = LinkedTicketsCache()
+
+def resolve_linked_it_tickets(jira, issue):
+    """
+    배포 예정 티켓(IssueRecord)의 연결된 IT 티켓 목록을 반환합니다.
+    검색 결과에 포함된 issuelinks를 우선 사용하고, 없거나 잘린 경우에만 이슈를 개별 조회합니다.
+    """
+    if is_issue_links_complete(issue.issuelinks):
+        return extract_linked_it_tickets(issue.issuelinks)
+    
+    # 부모 티켓의 updated가 이전 조회와 같으면 캐시된 결과를 사용합니다.
+    updated = issue.updated
+    if updated:
+        cached_tickets = LINKED_TICKETS_CACHE.get(issue.key, updated)
+        if cached_tickets is not None:
+            return cached_tickets
+    
+    logger.debug("'%s' 검색 결과에 issuelinks가 없거나 잘려 있어 개별 조회합니다.", issue.key)
+    try:
+        linked_it_tickets = get_linked_it_tickets_with_retry(jira, issue.key, raise_on_failure=True)
+    except Exception:
+        # 조회에 실패한 결과는 캐시하지 않습니다.
+        return []
+    if updated:
+        LINKED_TICKETS_CACHE.put(issue.key, updated, linked_it_tickets)
+    return linked_it_tickets
+
+def refresh_cached_linked_tickets(jira, deploy_issues):
+    """
+    캐시에서 읽을 배포 예정 티켓들의 연결 티켓 요약/상태를 키 묶음(LINKED_TICKETS_REFRESH_BATCH_SIZE)마다
+    한 번의 검색으로 다시 조회해 캐시에 반영합니다. 조회에 실패하면 해당 캐시 항목을 지워 개별 조회하게 합니다.
+    """
+    cached = {}
+    for issue in deploy_issues:
+        if issue.updated and not is_issue_links_complete(issue.issuelinks):
+            tickets = LINKED_TICKETS_CACHE.peek(issue.key, issue.updated)
+            if tickets:
+                cached[issue.key] = tickets
+    linked_keys = sorted({ticket['key'] for tickets in cached.values() for ticket in tickets})
+    if not linked_keys:
+        return
+    
+    latest_by_key = {}
+    try:
+        for start in range(0, len(linked_keys), LINKED_TICKETS_REFRESH_BATCH_SIZE):
+            batch = linked_keys[start:start + LINKED_TICKETS_REFRESH_BATCH_SIZE]
+            for issue in iter_search_issues(jira, f"key in ({', '.join(batch)})", 'summary,status'):
+                record = IssueRecord.from_jira(issue)
+                latest_by_key[record.key] = (record.summary, record.status)
+    except Exception as e:
+        print(f"캐시된 연결 티켓 상태 조회 실패, 개별 조회합니다: {e}")
+        LINKED_TICKETS_CACHE.forget(cached)
+        return
+    LINKED_TICKETS_CACHE.refresh_tickets(cached, latest_by_key)
+
+def iter_linked_it_tickets(jira, deploy_issues, max_workers=LINK_FETCH_MAX_WORKERS):
+    """
+    배포 예정 티켓들(IssueRecord)의 연결된 IT 티켓 목록을 최대 max_workers개씩 동시에 조회하여 차례대로 내보냅니다.
+    결과는 deploy_issues와 같은 순서이며, 티켓별 재시도는 서로 독립적으로 진행됩니다.
+    캐시된 연결 티켓의 상태는 조회 전에 refresh_cached_linked_tickets()로 최신 값으로 맞춥니다.
+    """
+    if not deploy_issues:
+        return
+    refresh_cached_linked_tickets(jira, deploy_issues)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(deploy_issues)))) as executor:
+        yield from executor.map(lambda issue: resolve_linked_it_tickets(jira, issue), deploy_issues)
+
+def enrich_linked_it_tickets(jira, deploy_issues, max_workers=LINK_FETCH_MAX_WORKERS):
+    """배포 예정 티켓들의 연결된 IT 티켓 목록을 deploy_issues와 같은 순서의 목록으로 반환합니다."""
+    return list(iter_linked_it_tickets(jira, deploy_issues, max_workers))
+
 
 def get_macro_table_issues(jira, jira_project_key, start_date_str, end_date_str, use_pagination=False):
     """macro table에 표시될 실제 티켓들을 동적으로 가져옵니다."""
@@ -514,126 +1358,324 @@ def get_macro_table_issues(jira, jira_project_key, start_date_str, end_date_str,
 
 
 
-def send_slack(text):
-    url = os.getenv("SLACK_WEBHOOK_URL")
-    if not url:
-        print("SLACK_WEBHOOK_URL 미설정, Slack 알림 생략")
-        return
+class SlackOutbox:
+    """
+    Slack 메시지 발송 대기열입니다. 메시지는 파일에 저장되어 실행이 끝나도 사라지지 않습니다.
+
+    - 알림 시간(SLACK_NOTIFICATION_START_HOUR~END_HOUR) 밖에서는 버리지 않고 보류했다가 다음 실행에서 보냅니다.
+    - coalesce_key가 같은 메시지(같은 주간 페이지의 변경 알림)는 바로 보내되, 앞선 메시지가 아직 대기 중이면
+      (알림 시간 외 보류, 전송 실패) 그 메시지에 합쳐 한 번에 보냅니다.
+    - flush_in_background()로 실행과 동시에 보내고, 실행 끝에서 wait()로 제한 시간까지만 기다립니다.
+    여러 프로세스가 같은 파일을 쓰므로 읽기/쓰기는 잠금 파일(fcntl.flock)로 보호합니다. 잠금은 대기열을 읽고 쓰는 동안만
+    잡고, Slack 요청 중에는 잡지 않습니다. 보내는 중인 메시지는 claimed_until까지 다른 실행이 보내거나 합치지 않습니다.
+    """
     
-    # 시간 제한 확인 (8시~21시 사이에만 알림 전송)
-    notification_start_hour =10
-    notification_end_hour = 21
+    def __init__(self, path=SLACK_OUTBOX_FILE_PATH):
+        self.path = path
+        self._thread = None
     
-    today = datetime.now()
-    if today.hour < notification_start_hour or today.hour >= notification_end_hour:
-        print(f"현재 시간에는 슬랙 알림 전송을 건너뜁니다. (오전 {notification_start_hour}시 ~ {notification_end_hour}시 외)")
-        return
+    def _update(self, apply):
+        """잠금을 잡고 대기열을 읽어 apply(messages)를 실행한 뒤 저장합니다. apply의 반환값을 돌려줍니다."""
+        with open(f"{self.path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                messages = read_json(self.path, default=[])
+                result = apply(messages)
+                write_json(self.path, messages)
+                return result
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
     
-    try:
-        r = requests.post(url, json={"text": text})
-        if r.status_code != 200:
-            print(f"Slack 알림 실패: {r.text}")
-        else:
-            print(f"Slack 알림 전송 성공: {len(text)}자")
-    except Exception as e:
-        print(f"Slack 알림 오류: {e}")
-
-def snapshot_issues(issues, field_id):
-    """이슈들의 스냅샷을 생성합니다."""
-    snapshot = []
-    for i in issues:
-        # Jira 객체인지 딕셔너리인지 확인
-        if hasattr(i, 'key'):
-            # Jira 객체인 경우
-            key = i.key
-            fields = i.fields
-            summary = getattr(fields, 'summary', '')
-            status = getattr(fields, 'status', '')
-            status_name = status.name if hasattr(status, 'name') else str(status)
-            assignee = getattr(fields, 'assignee', None)
-            assignee_name = assignee.displayName if assignee else "미지정"
-            custom_field = getattr(fields, field_id, '')
+    def pending(self):
+        return read_json(self.path, default=[])
+    
+    @staticmethod
+    def is_claimed(message, now):
+        return message.get('claimed_until', 0) > now
+    
+    def enqueue(self, text, header=None, coalesce_key=None, now=None):
+        """메시지를 대기열에 넣습니다. 같은 coalesce_key의 메시지가 대기 중이면 그 메시지에 합칩니다."""
+        now = time.time() if now is None else now
+        part = {'at': datetime.fromtimestamp(now).strftime('%H:%M'), 'text': text}
+        
+        def apply(messages):
+            if coalesce_key is not None:
+                for message in messages:
+                    if message.get('coalesce_key') == coalesce_key and not self.is_claimed(message, now):
+                        message['header'] = header
+                        message['parts'].append(part)
+                        return True
+            messages.append({
+                'id': uuid.uuid4().hex, 'header': header, 'parts': [part], 'coalesce_key': coalesce_key,
+                'queued_at': now, 'attempts': 0
+            })
+            return False
+        
+        return self._update(apply)
+    
+    @staticmethod
+    def render(message):
+        """대기열 메시지를 Slack 본문으로 만듭니다. 합쳐진 메시지는 부분마다 대기열에 들어온 시각을 붙입니다."""
+        parts = message['parts']
+        if len(parts) == 1:
+            body = parts[0]['text']
         else:
-            # 딕셔너리인 경우
-            key = i['key']
-            fields = i['fields']
-            summary = fields.get('summary', '')
-            status = fields.get('status', {})
-            status_name = status.get('name', '') if isinstance(status, dict) else str(status)
-            assignee = fields.get('assignee', None)
-            # assignee가 딕셔너리인지 객체인지 확인
-            if isinstance(assignee, dict):
-                assignee_name = assignee.get('displayName', '미지정')
-            elif hasattr(assignee, 'displayName'):
-                assignee_name = assignee.displayName
-            else:
-                assignee_name = "미지정"
-            custom_field = fields.get(field_id, '')
+            body = '\n\n'.join(f"[{part['at']}] {part['text']}" for part in parts)
+        return f"{message['header']}\n\n{body}" if message.get('header') else body
+    
+    @staticmethod
+    def is_quiet_hour(now):
+        hour = datetime.fromtimestamp(now).hour
+        return hour < SLACK_NOTIFICATION_START_HOUR or hour >= SLACK_NOTIFICATION_END_HOUR
+    
+    def _claim_next(self, now, skipped):
+        """보낼 때가 된 메시지 하나를 골라 claimed_until을 기록하고 반환합니다. 없으면 None."""
+        def apply(messages):
+            for message in messages:
+                if message['id'] in skipped or self.is_claimed(message, now):
+                    continue
+                message['claimed_until'] = now + SLACK_OUTBOX_CLAIM_SECONDS
+                return dict(message)
+            return None
         
-        snapshot.append({
-            "key": key,
-            "summary": summary,
-            "status": status_name,
-            "assignee": assignee_name,
-            field_id: custom_field
-        })
-    return snapshot
-
-def issues_changed(prev, curr):
-    return prev != curr
+        return self._update(apply)
+    
+    def _record(self, message_id, delivered):
+        """전송 결과를 기록합니다. 보낸 메시지는 지우고, 실패한 메시지는 시도 횟수를 늘려 다시 보낼 수 있게 둡니다."""
+        def apply(messages):
+            for index, message in enumerate(messages):
+                if message['id'] != message_id:
+                    continue
+                message.pop('claimed_until', None)
+                if delivered:
+                    del messages[index]
+                    return None
+                message['attempts'] += 1
+                if message['attempts'] >= SLACK_OUTBOX_MAX_ATTEMPTS:
+                    del messages[index]
+                    return message
+                return None
+            return None
+        
+        dropped = self._update(apply)
+        if dropped:
+            log(f"Slack 알림 {dropped['attempts']}회 실패로 버림: {self.render(dropped)[:100]}")
+    
+    def flush(self, now=None, timeout=SLACK_POST_TIMEOUT_SECONDS):
+        """
+        보낼 때가 된 메시지를 하나씩 보냅니다. 실패한 메시지는 대기열에 남겨 다음에 다시 보냅니다.
+        메시지마다 보낸 직후 결과를 기록하므로, 중간에 실행이 끝나도 이미 보낸 메시지를 다시 보내지 않습니다.
+
+        Returns:
+            int: 보낸 메시지 수
+        """
+        url = os.getenv("SLACK_WEBHOOK_URL")
+        now = time.time() if now is None else now
+        if not url or not os.path.exists(self.path):
+            return 0
+        if self.is_quiet_hour(now):
+            pending = self.pending()
+            if pending:
+                print(f"알림 시간({SLACK_NOTIFICATION_START_HOUR}시~{SLACK_NOTIFICATION_END_HOUR}시) 외: "
+                      f"Slack 메시지 {len(pending)}개를 보류합니다.")
+            return 0
+        
+        sent = 0
+        attempted = set()
+        while True:
+            message = self._claim_next(now, attempted)
+            if message is None:
+                return sent
+            attempted.add(message['id'])
+            text = self.render(message)
+            try:
+                r = get_http_session().post(url, json={"text": text}, timeout=timeout)
+                delivered = r.status_code == 200
+                if not delivered:
+                    print(f"Slack 알림 실패: {r.text}")
+            except Exception as e:
+                delivered = False
+                print(f"Slack 알림 오류: {e}")
+            self._record(message['id'], delivered)
+            if delivered:
+                sent += 1
+                print(f"Slack 알림 전송 성공: {len(text)}자 (합친 알림 {len(message['parts'])}개)")
+    
+    def flush_in_background(self):
+        """대기열 전송을 백그라운드 스레드에서 시작합니다. 이미 전송 중이면 아무것도 하지 않습니다."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self.flush, name='slack-outbox', daemon=True)
+        self._thread.start()
+    
+    def wait(self, timeout=SLACK_FLUSH_TIMEOUT_SECONDS):
+        """백그라운드 전송이 끝나기를 timeout초까지 기다립니다. 남은 메시지는 다음 실행에서 보냅니다."""
+        if self._thread is None:
+            return
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            print(f"Slack 전송이 {timeout}초 안에 끝나지 않아 남은 메시지는 다음 실행에서 보냅니다.")
 
+SLACK_OUTBOX = SlackOutbox()
 
-def get_notified_deploy_keys():
+def send_slack(text, header=None, coalesce_key=None):
     """
-    이미 Slack 알림을 보낸 배포 티켓의 키 목록을 파일에서 읽어옵니다.
-    이 함수는 중복 알림을 방지하기 위해 사용됩니다.
-
-    Returns:
-        set: 알림을 보낸 티켓 키들의 집합(set). 파일이 없거나 오류 발생 시 빈 집합을 반환합니다.
+    Slack 메시지를 발송 대기열에 넣고 백그라운드 전송을 시작합니다.
+    coalesce_key를 주면 같은 키로 대기 중인 메시지와 합쳐서 한 번에 보냅니다.
     """
-    try:
-        with open("notified_deploy_keys.json", "r") as f:
-            # JSON 파일에서 리스트를 읽어와 set으로 변환하여 반환합니다.
-            # set을 사용하면 중복된 키가 없고, 특정 키의 존재 여부를 O(1) 시간 복잡도로 빠르게 확인할 수 있습니다.
-            return set(json.load(f))
-    except Exception:
-        # 파일이 존재하지 않거나 JSON 파싱 오류가 발생하면 빈 set을 반환합니다.
-        return set()
+    url = os.getenv("SLACK_WEBHOOK_URL")
+    if not url:
+        print("SLACK_WEBHOOK_URL 미설정, Slack 알림 생략")
+        return
+    
+    merged = SLACK_OUTBOX.enqueue(text, header=header, coalesce_key=coalesce_key)
+    if merged:
+        print("같은 주간의 대기 중인 Slack 알림에 합쳤습니다.")
+    SLACK_OUTBOX.flush_in_background()
 
-def save_notified_deploy_keys(keys):
-    """
-    Slack 알림을 보낸 배포 티켓 키 목록을 JSON 파일에 저장합니다.
+def snapshot_issues(issues, field_id):
+    """이슈들의 스냅샷을 생성합니다."""
+    return [IssueRecord.coerce(issue).snapshot(field_id) for issue in issues]
 
-    Args:
-        keys (set): 저장할 티켓 키들의 집합(set)
-    """
-    with open("notified_deploy_keys.json", "w") as f:
-        # set을 list로 변환하여 JSON 형식으로 파일에 저장합니다.
-        json.dump(list(keys), f)
+def issue_fingerprint(item):
+    """스냅샷 항목의 지문: SNAPSHOT_DIFF_FIELDS 값의 튜플 (순서/다른 필드와 무관하게 같은 값이면 같음)"""
+    return tuple(item.get(snapshot_key) for snapshot_key, _ in SNAPSHOT_DIFF_FIELDS.values())
 
-def get_notified_changes():
+def diff_snapshots(prev, curr):
     """
-    이미 Slack 알림을 보낸 변경사항의 해시를 파일에서 읽어옵니다.
-    이 함수는 중복 알림을 방지하기 위해 사용됩니다.
+    두 스냅샷을 키 기준 해시 조인으로 비교합니다. 티켓 순서는 비교하지 않습니다.
 
     Returns:
-        set: 알림을 보낸 변경사항 해시들의 집합(set). 파일이 없거나 오류 발생 시 빈 집합을 반환합니다.
+        tuple: (추가된 항목 목록, 제거된 항목 목록, [(이전 항목, 현재 항목, 바뀐 필드 이름 목록), ...])
     """
-    try:
-        with open("notified_changes.json", "r") as f:
-            return set(json.load(f))
-    except Exception:
-        return set()
+    prev_by_key = {item['key']: item for item in prev or []}
+    added = []
+    updated = []
+    for item in curr or []:
+        previous = prev_by_key.pop(item['key'], None)
+        if previous is None:
+            added.append(item)
+        elif issue_fingerprint(previous) != issue_fingerprint(item):
+            fields = [
+                name for name, (snapshot_key, _) in SNAPSHOT_DIFF_FIELDS.items()
+                if previous.get(snapshot_key) != item.get(snapshot_key)
+            ]
+            updated.append((previous, item, fields))
+    return added, list(prev_by_key.values()), updated
 
-def save_notified_changes(changes):
+def issues_changed(prev, curr):
+    """이전 스냅샷이 없거나, 티켓이 추가/제거되었거나, 추적하는 필드가 바뀌었으면 True"""
+    return prev is None or any(diff_snapshots(prev, curr))
+
+
+def notification_digest(kind, value):
+    """중복 알림 확인용 고정 길이 지문 (sha256 hex). kind로 알림 종류('deploy', 'change')를 구분합니다."""
+    return hashlib.sha256(f"{kind}:{value}".encode('utf-8')).hexdigest()
+
+class NotificationDedupeStore:
     """
-    Slack 알림을 보낸 변경사항 해시를 JSON 파일에 저장합니다.
+    Slack 중복 알림 방지 저장소입니다 (notified_deploy_keys.json / notified_changes.json 대체).
 
-    Args:
-        changes (set): 저장할 변경사항 해시들의 집합(set)
+    알림마다 고정 길이 지문과 만료 시각만 주간 페이지 단위(partition)로 저장합니다.
+    만료(ttl_days)된 항목과 빈 주간은 저장할 때 정리하므로, 파일 크기와 로드 시간은 사용 기간과 관계없이 일정합니다.
+    저장할 때는 파일 잠금을 잡고 다시 읽어 합치므로, 동시에 실행된 다른 주간의 기록을 덮어쓰지 않습니다.
+    저장소 파일이 없으면 기존 배포 키 알림 파일을 읽어 LEGACY_PARTITION으로 한 번 옮겨 옵니다.
+    (notified_changes.json은 변경사항 지문 형식이 달라 옮겨도 일치하지 않으므로 읽지 않습니다)
     """
-    with open("notified_changes.json", "w") as f:
-        json.dump(list(changes), f)
+    
+    LEGACY_PARTITION = 'legacy'
+    
+    def __init__(self, path=NOTIFICATION_DEDUPE_FILE_PATH, ttl_days=NOTIFICATION_DEDUPE_TTL_DAYS,
+                 legacy_deploy_keys_path=LEGACY_NOTIFIED_DEPLOY_KEYS_FILE_PATH):
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400
+        self.legacy_deploy_keys_path = legacy_deploy_keys_path
+        self.partitions = None
+        self._dirty = False
+        self._lock = threading.Lock()
+    
+    def _ensure_loaded(self):
+        if self.partitions is not None:
+            return
+        data = read_json(self.path)
+        if isinstance(data, dict):
+            self.partitions = data.get('partitions', {})
+            return
+        self.partitions = {}
+        self._import_legacy()
+    
+    def _import_legacy(self):
+        """기존 알림 파일의 배포 키를 지문으로 바꿔 옮깁니다."""
+        expires_at = time.time() + self.ttl_seconds
+        legacy = {}
+        for key in read_json(self.legacy_deploy_keys_path, default=[]) or []:
+            legacy[notification_digest('deploy', key)] = expires_at
+        if legacy:
+            self.partitions[self.LEGACY_PARTITION] = legacy
+            self._dirty = True
+            print(f"기존 알림 기록 {len(legacy)}건을 중복 알림 저장소로 옮겼습니다.")
+    
+    def contains(self, partition, digest, now=None):
+        """해당 주간(또는 이전 기록)에 만료되지 않은 같은 지문이 있으면 True"""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._ensure_loaded()
+            for name in (partition, self.LEGACY_PARTITION):
+                expires_at = self.partitions.get(name, {}).get(digest)
+                if expires_at is not None and expires_at > now:
+                    return True
+            return False
+    
+    def add(self, partition, digest, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            self._ensure_loaded()
+            self.partitions.setdefault(partition, {})[digest] = now + self.ttl_seconds
+            self._dirty = True
+    
+    def _compact_locked(self, now):
+        removed = 0
+        for name in list(self.partitions):
+            entries = self.partitions[name]
+            expired = [digest for digest, expires_at in entries.items() if expires_at <= now]
+            for digest in expired:
+                del entries[digest]
+            removed += len(expired)
+            if not entries:
+                del self.partitions[name]
+        return removed
+    
+    def compact(self, now=None):
+        """만료된 지문과 빈 주간을 지웁니다. 지운 지문 수를 반환합니다."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._ensure_loaded()
+            removed = self._compact_locked(now)
+            if removed:
+                self._dirty = True
+        return removed
+    
+    def save(self):
+        """파일 잠금을 잡고 저장된 기록을 다시 읽어 합친 뒤(같은 지문은 늦은 만료 시각) 정리해서 저장합니다."""
+        with self._lock:
+            if self.partitions is None or not self._dirty:
+                return
+            with open(f"{self.path}.lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    data = read_json(self.path)
+                    stored = data.get('partitions', {}) if isinstance(data, dict) else {}
+                    for name, entries in stored.items():
+                        merged = self.partitions.setdefault(name, {})
+                        for digest, expires_at in entries.items():
+                            merged[digest] = max(merged.get(digest, 0), expires_at)
+                    self._compact_locked(time.time())
+                    write_json(self.path, {'partitions': self.partitions})
+                    self._dirty = False
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+NOTIFICATION_DEDUPE = NotificationDedupeStore()
 
 def generate_change_hash(changed_issues, page_title):
     """
@@ -644,7 +1686,7 @@ def generate_change_hash(changed_issues, page_title):
         page_title (str): 페이지 제목
         
     Returns:
-        str: 변경사항의 고유 해시
+        str: 변경사항의 sha256 지문 (hex)
     """
     # 모든 변경사항을 하나의 리스트로 합치고 정렬하여 일관된 해시 생성
     all_issues = []
@@ -653,16 +1695,17 @@ def generate_change_hash(changed_issues, page_title):
             all_issues.append({
                 'key': issue['key'],
                 'summary': issue['summary'],
-                'type': change_type
+                'type': change_type,
+                'changes': issue.get('changes', {})
             })
     
     # 키로 정렬하여 일관된 해시 생성
     sorted_issues = sorted(all_issues, key=lambda x: x['key'])
     change_data = {
         'page_title': page_title,
-        'issues': [(issue['key'], issue['summary'], issue['type']) for issue in sorted_issues]
+        'issues': [(issue['key'], issue['summary'], issue['type'], issue['changes']) for issue in sorted_issues]
     }
-    return json.dumps(change_data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(json.dumps(change_data, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
 
 
 def notify_new_deploy_tickets(issues, jira_url, page_title, deploy_message_enabled=False):
@@ -673,27 +1716,24 @@ def notify_new_deploy_tickets(issues, jira_url, page_title, deploy_message_enabl
         return
     
     try:
-        # 기존에 알림을 보낸 배포 키들을 로드
-        notified_keys = get_notified_deploy_keys()
-        
         # 새로운 배포 티켓들을 찾습니다
         new_deploy_tickets = []
         
         for issue in issues:
-            issue_key = issue['key']
+            issue = IssueRecord.coerce(issue)
+            issue_key = issue.key
             
-            # 이미 알림을 보낸 키는 건너뜁니다
-            if issue_key in notified_keys:
+            # 이번 주간에 이미 알림을 보낸 키는 건너뜁니다
+            if NOTIFICATION_DEDUPE.contains(page_title, notification_digest('deploy', issue_key)):
                 continue
             
             # 배포 관련 이슈 타입인지 확인
-            issue_type = issue['fields'].get('issuetype', {}).get('name', '')
-            if issue_type in ['Deploy', 'Release', '배포']:
+            if issue.issue_type in ['Deploy', 'Release', '배포']:
                 new_deploy_tickets.append({
                     'key': issue_key,
-                    'summary': issue['fields'].get('summary', ''),
-                    'status': issue['fields'].get('status', {}).get('name', ''),
-                    'assignee': issue['fields'].get('assignee', {}).get('displayName', '미지정'),
+                    'summary': issue.summary,
+                    'status': issue.status,
+                    'assignee': issue.assignee,
                     'url': f"{jira_url}/browse/{issue_key}"
                 })
         
@@ -752,9 +1792,9 @@ def notify_new_deploy_tickets(issues, jira_url, page_title, deploy_message_enabl
                 send_slack(full_message)
                 
                 # 알림을 보낸 키들을 저장
-                new_keys = [ticket['key'] for ticket in new_deploy_tickets]
-                notified_keys.extend(new_keys)
-                save_notified_deploy_keys(notified_keys)
+                for ticket in new_deploy_tickets:
+                    NOTIFICATION_DEDUPE.add(page_title, notification_digest('deploy', ticket['key']))
+                NOTIFICATION_DEDUPE.save()
                 
                 print(f"새로운 배포 티켓 알림 전송 완료: {len(new_deploy_tickets)}개")
         
@@ -768,11 +1808,86 @@ def get_now_str():
     return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
 
+class ReportRunLock:
+    """
+    리포트 실행을 한 번에 하나만 진행시키는 파일 잠금(fcntl.flock)입니다.
+
+    모든 주간이 같은 상태 파일(이슈 저장소, 캐시, 페이지 색인, 알림 기록)을 읽고 통째로 저장하므로,
+    대상 주간이 달라도 겹쳐 실행하면 나중에 저장한 실행이 앞선 실행의 변경을 덮어씁니다.
+    앞선 실행이 잠금을 가지고 있으면 timeout초까지 기다립니다. 프로세스가 비정상 종료되어도
+    운영체제가 잠금을 풀기 때문에 남은 잠금 파일을 따로 정리할 필요가 없습니다.
+    """
+    
+    def __init__(self, timeout=RUN_LOCK_TIMEOUT_SECONDS, path=RUN_LOCK_FILE_PATH):
+        self.path = path
+        self.timeout = timeout
+        self.waited = 0.0
+        self._file = None
+    
+    def acquire(self):
+        """잠금을 얻을 때까지 기다립니다. timeout 안에 얻지 못하면 TimeoutError."""
+        self._file = open(self.path, "a")
+        started = time.monotonic()
+        while True:
+            try:
+                fcntl.flock(self._file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                self.waited = time.monotonic() - started
+                if self.waited >= self.timeout:
+                    self._file.close()
+                    self._file = None
+                    raise TimeoutError(f"{self.timeout}초 안에 실행 잠금을 얻지 못했습니다: {self.path}")
+                time.sleep(RUN_LOCK_POLL_SECONDS)
+        if self.waited:
+            print(f"⏳ 앞선 실행이 끝나기를 {self.waited:.0f}초 기다렸습니다.")
+        return self
+    
+    def release(self):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        return self.acquire()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+def get_recent_run(week, mode, now=None, path=RUN_STATE_FILE_PATH):
+    """같은 주간·모드의 실행이 RUN_REUSE_SECONDS 안에 끝났으면 끝난 시각을 반환합니다. 없으면 None."""
+    finished_at = read_json(path, default={}).get(week, {}).get(mode)
+    now = time.time() if now is None else now
+    if finished_at is not None and now - finished_at < RUN_REUSE_SECONDS:
+        return finished_at
+    return None
+
+def should_reuse_recent_run(run_lock, week, mode, force_update, path=RUN_STATE_FILE_PATH):
+    """
+    잠금을 기다리는 동안 같은 주간·모드의 실행이 방금 끝났으면 그 결과를 그대로 두고 이번 실행을 생략합니다.
+    기다리지 않고 시작한 실행과 --force-update는 항상 진행합니다 (예: update 직후의 current 실행).
+    """
+    if force_update or not run_lock.waited:
+        return False
+    now = time.time()
+    finished_at = get_recent_run(week, mode, now=now, path=path)
+    # 기다리기 시작한 뒤에 끝난 실행만 재사용합니다
+    return finished_at is not None and finished_at >= now - run_lock.waited
+
+def mark_run_completed(week, mode, path=RUN_STATE_FILE_PATH):
+    """주간·모드별로 실행이 끝난 시각을 기록합니다. 잠금을 가진 상태에서 호출합니다."""
+    runs = read_json(path, default={})
+    runs.setdefault(week, {})[mode] = time.time()
+    write_json(path, runs)
+
 # === [3단계] main() 간결화 및 불필요 코드/주석 제거 ===
 
 def get_snapshot_file_path(mode):
     """
     모드별로 별도의 스냅샷 파일 경로를 반환합니다.
+    스냅샷은 SNAPSHOT_HISTORY에 저장하며, 이 파일은 이력이 없는 주간의 비교 기준으로만 읽습니다.
 
     Args:
         mode (str): 실행 모드 (create, current, update, last)
@@ -790,12 +1905,162 @@ def get_snapshot_file_path(mode):
     suffix = mode_suffix.get(mode, "current_week")
     return f'weekly_issues_snapshot_{suffix}.json'
 
+class SnapshotHistory:
+    """
+    주간 배포 예정 티켓 스냅샷 이력 저장소 (SQLite)입니다.
+
+    티켓마다 (주간, 키) 기준으로 값이 바뀐 시점에만 새 행을 추가하고 이전 행의 valid_to를 닫습니다.
+    따라서 저장 비용은 바뀐 티켓 수에 비례하고, 지난 실행 시점의 스냅샷도 그대로 조회할 수 있습니다.
+    주간(week)은 리포트 시작일('YYYY-MM-DD')이므로 모드가 달라도 같은 주간이면 같은 이력을 사용합니다.
+    """
+    
+    SCHEMA = '''
+CREATE TABLE IF NOT EXISTS snapshot_runs (
+    week TEXT NOT NULL,
+    run_at TEXT NOT NULL,
+    issue_count INTEGER NOT NULL,
+    PRIMARY KEY (week, run_at)
+);
+CREATE TABLE IF NOT EXISTS issue_versions (
+    week TEXT NOT NULL,
+    key TEXT NOT NULL,
+    summary TEXT,
+    status TEXT,
+    assignee TEXT,
+    deploy_date TEXT,
+    position INTEGER NOT NULL,
+    valid_from TEXT NOT NULL,
+    valid_to TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_issue_versions_current ON issue_versions (week, valid_to, key);
+CREATE INDEX IF NOT EXISTS idx_issue_versions_from ON issue_versions (week, valid_from);
+'''
+    TRACKED_FIELDS = ('summary', 'status', 'assignee', 'deploy_date')
+    
+    def __init__(self, path=SNAPSHOT_HISTORY_DB_PATH, field_id=JIRA_DEPLOY_DATE_FIELD_ID):
+        self.path = path
+        self.field_id = field_id
+        self._connection = None
+        self._lock = threading.Lock()
+    
+    def _connect(self):
+        if self._connection is None:
+            # 동기/asyncio 실행 엔진 모두 같은 연결을 사용하므로 스레드 검사는 끄고 _lock으로 보호합니다.
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.executescript(self.SCHEMA)
+        return self._connection
+    
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def _to_row(self, item):
+        return (item.get('summary'), item.get('status'), item.get('assignee'), item.get(self.field_id, ''))
+    
+    def _to_snapshot(self, row):
+        key, summary, status, assignee, deploy_date = row
+        return {'key': key, 'summary': summary, 'status': status, 'assignee': assignee, self.field_id: deploy_date}
+    
+    def runs(self, week):
+        """주간의 스냅샷 저장 시각 목록 (오래된 순)"""
+        with self._lock:
+            rows = self._connect().execute(
+                'SELECT run_at FROM snapshot_runs WHERE week = ? ORDER BY run_at', (week,)
+            ).fetchall()
+        return [run_at for (run_at,) in rows]
+    
+    def load(self, week, at=None):
+        """
+        주간 스냅샷을 스냅샷 파일과 같은 형식(snapshot_issues)으로 반환합니다.
+        at(저장 시각)을 주면 그 시점의 스냅샷을 키 순으로 반환합니다 (순서 변경은 이력으로 남기지 않음).
+        저장한 적이 없으면 None.
+        """
+        with self._lock:
+            connection = self._connect()
+            if at is None:
+                if connection.execute('SELECT 1 FROM snapshot_runs WHERE week = ? LIMIT 1', (week,)).fetchone() is None:
+                    return None
+                rows = connection.execute(
+                    'SELECT key, summary, status, assignee, deploy_date FROM issue_versions '
+                    'WHERE week = ? AND valid_to IS NULL ORDER BY position', (week,)
+                ).fetchall()
+            else:
+                if connection.execute('SELECT 1 FROM snapshot_runs WHERE week = ? AND run_at <= ? LIMIT 1', (week, at)).fetchone() is None:
+                    return None
+                rows = connection.execute(
+                    'SELECT key, summary, status, assignee, deploy_date FROM issue_versions '
+                    'WHERE week = ? AND valid_from <= ? AND (valid_to IS NULL OR valid_to > ?) ORDER BY key',
+                    (week, at, at)
+                ).fetchall()
+        return [self._to_snapshot(row) for row in rows]
+    
+    def save(self, week, snapshot, run_at=None):
+        """
+        현재 스냅샷을 저장합니다. 바뀐 티켓만 새 행을 추가하고, 제거/변경된 티켓의 이전 행은 run_at으로 닫습니다.
+
+        Returns:
+            str: 저장 시각(run_at)
+        """
+        run_at = run_at or datetime.now(timezone.utc).isoformat(timespec='microseconds')
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                current = {
+                    key: (rowid, tuple(row[:4]), row[4]) for rowid, key, *row in connection.execute(
+                        'SELECT rowid, key, summary, status, assignee, deploy_date, position FROM issue_versions '
+                        'WHERE week = ? AND valid_to IS NULL', (week,)
+                    )
+                }
+                closed = []
+                inserted = []
+                moved = []
+                for position, item in enumerate(snapshot):
+                    values = self._to_row(item)
+                    previous = current.pop(item['key'], None)
+                    if previous is None or previous[1] != values:
+                        if previous is not None:
+                            closed.append((run_at, previous[0]))
+                        inserted.append((week, item['key'], *values, position, run_at))
+                    elif previous[2] != position:
+                        # 순서만 바뀐 티켓은 이력을 남기지 않고 현재 행의 순서만 고칩니다.
+                        moved.append((position, previous[0]))
+                closed.extend((run_at, rowid) for rowid, _, _ in current.values())
+                
+                connection.executemany('UPDATE issue_versions SET valid_to = ? WHERE rowid = ?', closed)
+                connection.executemany('UPDATE issue_versions SET position = ? WHERE rowid = ?', moved)
+                connection.executemany(
+                    'INSERT INTO issue_versions (week, key, summary, status, assignee, deploy_date, position, valid_from) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', inserted
+                )
+                connection.execute(
+                    'INSERT OR REPLACE INTO snapshot_runs (week, run_at, issue_count) VALUES (?, ?, ?)',
+                    (week, run_at, len(snapshot))
+                )
+        logger.debug("스냅샷 이력 저장 (%s): 새 행 %d개, 닫은 행 %d개", week, len(inserted), len(closed))
+        return run_at
+
+SNAPSHOT_HISTORY = SnapshotHistory()
+
+def load_previous_snapshot(options):
+    """
+    주간의 마지막 스냅샷을 이력에서 읽습니다.
+    이력에 없는 주간이면 이전 방식의 스냅샷 파일(snapshot_file_path)을 읽어 비교 기준으로 사용합니다.
+    """
+    prev_snapshot = SNAPSHOT_HISTORY.load(options['start_date_str'])
+    if prev_snapshot is None:
+        prev_snapshot = read_json(options['snapshot_file_path'])
+        if prev_snapshot is not None:
+            print(f"스냅샷 이력 없음: 기존 스냅샷 파일로 비교 ({options['snapshot_file_path']})")
+    return prev_snapshot
+
 def get_changed_issues(prev, curr, jira_url):
     """
     이전 스냅샷(prev)과 현재 스냅샷(curr)을 비교하여 변경된 IT티켓 목록을 반환합니다.
     - 새로 추가된 티켓 (+)
     - 제거된 티켓 (-)
-    - deploy_date(배포 예정일)가 변경된 티켓 (🔄)
+    - 배포 예정일/상태/담당자/요약이 변경된 티켓 (🔄): 'changes'에 필드별 (이전 값, 현재 값)을 담습니다.
     Args:
         prev (list): 이전 스냅샷
         curr (list): 현재 스냅샷
@@ -803,168 +2068,591 @@ def get_changed_issues(prev, curr, jira_url):
     Returns:
         dict: 변경 유형별 티켓 목록 {'added': [], 'removed': [], 'updated': []}
     """
-    prev_dict = {i['key']: i for i in prev or []}
-    curr_dict = {i['key']: i for i in curr or []}
+    added, removed, updated = diff_snapshots(prev, curr)
     
-    added = []
-    removed = []
-    updated = []
+    def change_item(item):
+        return {
+            'key': item['key'],
+            'summary': item.get('summary', ''),
+            'url': f"{jira_url}/browse/{item['key']}"
+        }
     
-    # 새로 추가된 티켓과 업데이트된 티켓 확인
-    for key, curr_issue in curr_dict.items():
-        prev_issue = prev_dict.get(key)
-        if not prev_issue:
-            # 새로 추가된 티켓
-            added.append({
-                'key': key,
-                'summary': curr_issue.get('summary', ''),
-                'url': f"{jira_url}/browse/{key}"
-            })
+    updated_items = []
+    for previous, item, fields in updated:
+        updated_item = change_item(item)
+        updated_item['changes'] = {
+            name: (previous.get(SNAPSHOT_DIFF_FIELDS[name][0]), item.get(SNAPSHOT_DIFF_FIELDS[name][0])) for name in fields
+        }
+        updated_items.append(updated_item)
+    
+    return {
+        'added': [change_item(item) for item in added],
+        'removed': [change_item(item) for item in removed],
+        'updated': updated_items
+    }
+
+def format_field_changes(changes):
+    """바뀐 필드를 Slack 메시지용 문자열로 만듭니다 (예: "배포 예정일 2025-07-23 11:00 → 2025-07-24 11:00, 요약")."""
+    parts = []
+    for name, (before, after) in changes.items():
+        label = SNAPSHOT_DIFF_FIELDS[name][1]
+        if name == 'summary':
+            parts.append(label)
+        elif name == 'deploy_date':
+            parts.append(f"{label} {format_jira_datetime(before) or '없음'} → {format_jira_datetime(after) or '없음'}")
         else:
-            # deploy_date만 변경 여부 확인
-            if curr_issue.get('deploy_date') != prev_issue.get('deploy_date'):
-                updated.append({
-                    'key': key,
-                    'summary': curr_issue.get('summary', ''),
-                    'url': f"{jira_url}/browse/{key}"
-                })
+            parts.append(f"{label} {before or '없음'} → {after or '없음'}")
+    return ', '.join(parts)
+
+
+def build_deploy_date_jql(project_key, start_date, end_date):
+    """
+    예정된 시작(customfield_10817) 값이 [start_date, end_date] 주간에 속하는 티켓을 찾는 JQL을 생성합니다.
+
+    예정된 시작 값은 +0900(KST) 기준이므로 주간 경계를 KST 자정으로 잡은 뒤,
+    JQL 날짜 리터럴이 해석되는 시간대(API 계정 프로필 시간대)로 변환하여 서버에서 직접 필터링합니다.
+
+    Args:
+        project_key (str): Jira 프로젝트 키
+        start_date (str): 시작일 (YYYY-MM-DD)
+        end_date (str): 종료일 (YYYY-MM-DD, 해당 일 포함)
+
+    Returns:
+        str: 날짜 범위가 포함된 JQL
+    """
+    jql_timezone = timezone(timedelta(hours=JIRA_JQL_UTC_OFFSET_HOURS))
+    window_start = datetime.strptime(start_date, '%Y-%m-%d').replace(tzinfo=DEPLOY_DATE_TIMEZONE)
+    window_end = datetime.strptime(end_date, '%Y-%m-%d').replace(tzinfo=DEPLOY_DATE_TIMEZONE) + timedelta(days=1)
+    start_literal = window_start.astimezone(jql_timezone).strftime('%Y-%m-%d %H:%M')
+    end_literal = window_end.astimezone(jql_timezone).strftime('%Y-%m-%d %H:%M')
+    return (
+        f"project = '{project_key}' AND "
+        f"{JIRA_DEPLOY_DATE_JQL_FIELD} >= \"{start_literal}\" AND {JIRA_DEPLOY_DATE_JQL_FIELD} < \"{end_literal}\" "
+        f"ORDER BY created DESC"
+    )
+
+# 예정된 시작 문자열 형식: "2025-07-23T11:00:00.000+0900", "2025-07-23T11:00Z", "2025-07-23"
+DEPLOY_DATE_PATTERN = re.compile(
+    r'^(\d{4}-\d{2}-\d{2})(?:[T ](\d{2}):(\d{2})(?::\d{2}(?:\.\d+)?)?)?(Z|[+-]\d{2}:?\d{2})?$'
+)
+
+def _split_deploy_date(value):
+    """예정된 시작 값을 (현지 시각 'YYYY-MM-DDTHH:MM', UTC 오프셋(분))으로 나눕니다. 해석할 수 없으면 ('NaT', 0)."""
+    kst_offset_minutes = int(DEPLOY_DATE_TIMEZONE.utcoffset(None).total_seconds() // 60)
+    if isinstance(value, datetime):
+        offset = value.utcoffset()
+        offset_minutes = int(offset.total_seconds() // 60) if offset is not None else kst_offset_minutes
+        return value.strftime('%Y-%m-%dT%H:%M'), offset_minutes
+    if isinstance(value, date):
+        return f"{value.isoformat()}T00:00", kst_offset_minutes
+    match = DEPLOY_DATE_PATTERN.match(value.strip()) if isinstance(value, str) else None
+    if not match:
+        return 'NaT', 0
+    day, hour, minute, offset = match.groups()
+    if offset is None:
+        offset_minutes = kst_offset_minutes
+    elif offset == 'Z':
+        offset_minutes = 0
+    else:
+        sign = -1 if offset[0] == '-' else 1
+        digits = offset[1:].replace(':', '')
+        offset_minutes = sign * (int(digits[:2]) * 60 + int(digits[2:]))
+    return f"{day}T{hour or '00'}:{minute or '00'}", offset_minutes
+
+def build_deploy_date_column(values):
+    """
+    예정된 시작 값 목록을 KST 벽시계 기준 datetime64[m] 배열 하나로 변환합니다.
+
+    값마다 UTC 오프셋을 읽어 KST로 맞추므로 다른 시간대로 저장된 값도 같은 기준으로 비교됩니다.
+    값이 없거나 해석할 수 없는 항목은 NaT가 됩니다.
+    """
+    if not values:
+        return np.array([], dtype='datetime64[m]')
+    offset_cache = {}
+    local_times = []
+    offsets = []
+    for value in values:
+        # Jira 기본 형식("2025-07-23T11:00:00.000+0900")은 정규식 없이 위치로 잘라냅니다
+        if isinstance(value, str) and len(value) == 28 and value[10] == 'T' and value[23] in '+-':
+            offset = value[23:]
+            if offset not in offset_cache:
+                offset_cache[offset] = _split_deploy_date(value)[1]
+            local_times.append(value[:16])
+            offsets.append(offset_cache[offset])
+        else:
+            local_time, offset_minutes = _split_deploy_date(value)
+            local_times.append(local_time)
+            offsets.append(offset_minutes)
+    kst_offset_minutes = int(DEPLOY_DATE_TIMEZONE.utcoffset(None).total_seconds() // 60)
+    try:
+        column = np.array(local_times, dtype='datetime64[m]')
+    except ValueError:
+        # 정규식은 통과했지만 존재하지 않는 날짜(예: 2025-02-30)가 섞인 경우 해당 항목만 NaT로 처리
+        column = np.array([_to_datetime64_or_nat(local_time) for local_time in local_times], dtype='datetime64[m]')
+    return column + (kst_offset_minutes - np.array(offsets, dtype=np.int64)).astype('timedelta64[m]')
+
+def _to_datetime64_or_nat(local_time):
+    try:
+        return np.datetime64(local_time, 'm')
+    except ValueError:
+        return np.datetime64('NaT', 'm')
+
+def deploy_date_window_mask(column, start_date, end_date):
+    """예정된 시작 날짜(KST)가 [start_date, end_date]에 속하는 항목의 불리언 마스크를 반환합니다."""
+    window_start = np.datetime64(str(start_date)[:10], 'm')
+    window_end = np.datetime64(str(end_date)[:10], 'D') + np.timedelta64(1, 'D')
+    return (column >= window_start) & (column < window_end.astype('datetime64[m]'))
+
+def _name_of(value, attr='name'):
+    """{'name': ...} 딕셔너리나 Resource 객체에서 이름 속성을 꺼냅니다."""
+    if isinstance(value, dict):
+        return value.get(attr) or ''
+    return getattr(value, attr, None) or ''
+
+class IssueRecord:
+    """
+    배포 예정 티켓 한 건을 나타내는 레코드입니다.
+
+    Jira 검색 결과(Resource)나 저장소의 딕셔너리는 조회 경계에서 한 번만 IssueRecord로 변환하고,
+    스냅샷·변경 비교·HTML 생성·알림은 모두 이 레코드의 속성을 바로 사용합니다.
+    """
     
-    # 제거된 티켓 확인
-    for key, prev_issue in prev_dict.items():
-        if key not in curr_dict:
-            removed.append({
-                'key': key,
-                'summary': prev_issue.get('summary', ''),
-                'url': f"{jira_url}/browse/{key}"
-            })
+    __slots__ = ('key', 'summary', 'status', 'assignee', 'issue_type', 'created', 'updated', 'deploy_date', 'issuelinks')
     
-    return {
-        'added': added,
-        'removed': removed,
-        'updated': updated
+    def __init__(self, key, summary='', status='', assignee='미지정', issue_type='', created='', updated='',
+                 deploy_date=None, issuelinks=None):
+        self.key = key
+        self.summary = summary
+        self.status = status
+        self.assignee = assignee
+        self.issue_type = issue_type
+        self.created = created
+        self.updated = updated
+        self.deploy_date = deploy_date
+        # 검색 결과에 issuelinks가 없으면 None (연결된 IT 티켓을 개별 조회해야 함을 뜻함)
+        self.issuelinks = issuelinks
+    
+    @classmethod
+    def from_jira(cls, issue):
+        """jira 검색 결과(Resource)를 변환합니다. issuelinks, issuetype은 원본 응답(raw)에서 가져옵니다."""
+        fields = issue.fields
+        raw = getattr(issue, 'raw', None)
+        raw_fields = raw.get('fields', {}) if isinstance(raw, dict) else {}
+        assignee = getattr(fields, 'assignee', None)
+        return cls(
+            key=issue.key,
+            summary=getattr(fields, 'summary', ''),
+            status=str(_name_of(getattr(fields, 'status', None))),
+            assignee=str(_name_of(assignee, 'displayName')) if assignee else '미지정',
+            issue_type=_name_of(raw_fields.get('issuetype')),
+            created=getattr(fields, 'created', ''),
+            updated=getattr(fields, 'updated', ''),
+            deploy_date=getattr(fields, JIRA_DEPLOY_DATE_FIELD_ID, None),
+            issuelinks=raw_fields.get('issuelinks'),
+        )
+    
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict()로 저장한 딕셔너리나 Jira REST 응답 형식({'key', 'fields': {...}})의 딕셔너리를 변환합니다."""
+        fields = data.get('fields') or {}
+        return cls(
+            key=data['key'],
+            summary=data.get('summary', fields.get('summary', '')),
+            status=data['status'] if 'status' in data else _name_of(fields.get('status')),
+            assignee=data.get('assignee') or _name_of(fields.get('assignee'), 'displayName') or '미지정',
+            issue_type=data['issue_type'] if 'issue_type' in data else _name_of(fields.get('issuetype')),
+            created=data.get('created', fields.get('created', '')),
+            updated=data.get('updated', fields.get('updated', '')),
+            deploy_date=data.get(JIRA_DEPLOY_DATE_FIELD_ID, fields.get(JIRA_DEPLOY_DATE_FIELD_ID)),
+            issuelinks=data.get('issuelinks', fields.get('issuelinks')),
+        )
+    
+    @classmethod
+    def coerce(cls, issue):
+        """IssueRecord는 그대로, 딕셔너리와 Resource는 변환하여 반환합니다."""
+        if isinstance(issue, cls):
+            return issue
+        if isinstance(issue, dict):
+            return cls.from_dict(issue)
+        return cls.from_jira(issue)
+    
+    def to_dict(self):
+        """로컬 이슈 저장소에 저장할 딕셔너리로 변환합니다."""
+        data = {slot: getattr(self, slot) for slot in self.__slots__ if slot != 'deploy_date'}
+        data[JIRA_DEPLOY_DATE_FIELD_ID] = self.deploy_date
+        return data
+    
+    def snapshot(self, field_id=JIRA_DEPLOY_DATE_FIELD_ID):
+        """스냅샷 파일에 기록하는 항목을 반환합니다."""
+        return {
+            "key": self.key,
+            "summary": self.summary,
+            "status": self.status,
+            "assignee": self.assignee,
+            field_id: self.deploy_date if self.deploy_date is not None else ''
+        }
+    
+    def __eq__(self, other):
+        if not isinstance(other, IssueRecord):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+    
+    def __repr__(self):
+        return f"IssueRecord({self.key!r}, {self.summary!r})"
+
+def is_jira_cloud(jira):
+    """Jira Cloud(deploymentType == 'Cloud')이면 True. Cloud 검색은 startAt 대신 nextPageToken으로 페이지를 넘깁니다."""
+    return getattr(jira, 'deploymentType', None) == 'Cloud'
+
+def iter_search_pages(jira, jql, fields_param, max_workers=1):
+    """
+    JQL 검색 결과를 페이지 단위로 차례대로 내보내는 제너레이터입니다.
+
+    - Jira Cloud: enhanced_search_issues를 nextPageToken이 없을 때까지 순차 호출합니다.
+      (Cloud의 search_issues는 startAt != 0을 거부하고, 반환 목록의 total은 실제 전체 개수가 아닌 받은 개수입니다)
+    - Server/DC: 첫 요청의 응답 크기로 실제 서버 페이지 크기를, `total`로 전체 개수를 확인한 뒤 나머지 페이지(startAt)를
+      최대 max_workers개씩 동시에 조회하고 startAt 순서대로 내보냅니다.
+      total이 없으면 요청 크기보다 작은 페이지가 올 때까지 순차 조회합니다.
+    프로젝트 크기와 관계없이 메모리에는 몇 페이지만 유지됩니다.
+    """
+    if is_jira_cloud(jira):
+        yield from iter_cloud_search_pages(jira, jql, fields_param, max_workers)
+        return
+    
+    first_page = jira.search_issues(jql, fields=fields_param, startAt=0, maxResults=JIRA_SEARCH_MAX_RESULTS)
+    page_size = len(first_page)
+    total = getattr(first_page, 'total', None)
+    yield list(first_page)
+    if not isinstance(total, int):
+        # total 정보가 없으면 요청 크기만큼 꽉 찬 페이지가 이어지는 동안 다음 페이지를 조회
+        start_at = page_size
+        while page_size and page_size >= JIRA_SEARCH_MAX_RESULTS:
+            page = list(jira.search_issues(jql, fields=fields_param, startAt=start_at, maxResults=JIRA_SEARCH_MAX_RESULTS))
+            yield page
+            start_at += len(page)
+            page_size = len(page)
+        return
+    if page_size == 0 or total <= page_size:
+        return
+
+    start_ats = range(page_size, total, page_size)
+    workers = max(1, min(max_workers, len(start_ats)))
+    print(f"서버 페이지 크기: {page_size}개, 전체: {total}개 → 추가 {len(start_ats)}페이지 조회 (동시 {workers}개)")
+
+    def fetch_page(start_at):
+        return list(jira.search_issues(jql, fields=fields_param, startAt=start_at, maxResults=page_size))
+
+    fetched_count = page_size
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+        for start_at in start_ats:
+            in_flight.append(executor.submit(fetch_page, start_at))
+            if len(in_flight) >= workers:
+                page = in_flight.popleft().result()
+                fetched_count += len(page)
+                yield page
+        while in_flight:
+            page = in_flight.popleft().result()
+            fetched_count += len(page)
+            yield page
+    if fetched_count < total:
+        print(f"⚠️ 조회 중 전체 개수가 변경되었습니다: {fetched_count}개 조회 (전체 {total}개)")
+
+def iter_cloud_search_pages(jira, jql, fields_param, max_workers=1):
+    """Jira Cloud 검색 결과를 nextPageToken으로 한 페이지씩 순차 조회합니다 (토큰 방식이라 동시 조회 불가)."""
+    if max_workers > 1:
+        print("Jira Cloud는 nextPageToken으로 페이지를 넘기므로 나머지 페이지를 순차 조회합니다.")
+    next_page_token = None
+    while True:
+        page = jira.enhanced_search_issues(
+            jql, nextPageToken=next_page_token, maxResults=JIRA_SEARCH_MAX_RESULTS, fields=fields_param
+        )
+        yield list(page)
+        previous_token = next_page_token
+        next_page_token = getattr(page, 'nextPageToken', None)
+        if getattr(page, 'isLast', None) is True or not next_page_token:
+            return
+        if next_page_token == previous_token:
+            print(f"⚠️ 같은 nextPageToken이 반복되어 조회를 중단합니다. 결과가 누락되었을 수 있습니다.")
+            return
+
+def iter_search_issues(jira, jql, fields_param, use_pagination=False):
+    """
+    JQL로 이슈를 조회하여 한 건씩 내보내는 제너레이터입니다.
+
+    서버가 maxResults를 제한해 결과가 잘린 경우에도 나머지 페이지를 조회하므로 결과가 누락되지 않습니다.
+    페이지네이션 사용 시에는 (Server/DC에서) 나머지 페이지를 JIRA_PAGE_FETCH_WORKERS개씩 동시에 조회합니다.
+    """
+    max_workers = JIRA_PAGE_FETCH_WORKERS if use_pagination else 1
+    page_count = 0
+    issue_count = 0
+    for page in iter_search_pages(jira, jql, fields_param, max_workers):
+        page_count += 1
+        if page_count == 2 and not use_pagination and not is_jira_cloud(jira):
+            print(f"⚠️ 한 번의 요청으로 {issue_count}개만 반환되었습니다. 나머지 페이지를 순차 조회합니다. "
+                  f"--pagination 옵션을 사용하면 동시에 조회합니다.")
+        issue_count += len(page)
+        yield from page
+    print(f"✅ 티켓 조회 성공 ({'페이지네이션 사용' if use_pagination else '페이지네이션 미사용'}): "
+          f"{issue_count}개 ({page_count}페이지)")
+
+def search_jira_issues(jira, jql, fields_param, use_pagination=False):
+    """JQL로 이슈를 모두 조회하여 목록으로 반환합니다."""
+    return list(iter_search_issues(jira, jql, fields_param, use_pagination))
+
+def select_issues_in_window(issues, start_date, end_date):
+    """예정된 시작 값이 [start_date, end_date]에 속하는 이슈만 반환합니다 (제외 사유 문자열은 만들지 않음)."""
+    column = build_deploy_date_column([getattr(issue.fields, JIRA_DEPLOY_DATE_FIELD_ID, None) for issue in issues])
+    mask = deploy_date_window_mask(column, start_date, end_date)
+    return [issue for issue, selected in zip(issues, mask) if selected]
+
+def verify_deploy_date_filter(jira, project_key, server_issues, start_date, end_date, fields_param, use_pagination=False):
+    """
+    서버 측 JQL 필터링 결과를 기존 Python 필터링 결과와 비교하여 불일치를 보고합니다.
+
+    Returns:
+        dict: {'missing': 서버 결과에 빠진 키 목록, 'unexpected': 범위 밖인데 서버가 반환한 키 목록}
+    """
+    print(f"\n=== 서버 측 필터링 검증 ===")
+    base_jql = f"project = '{project_key}' AND {JIRA_DEPLOY_DATE_JQL_FIELD} IS NOT EMPTY ORDER BY created DESC"
+    print(f"검증용 JQL: {base_jql}")
+    # 프로젝트 전체를 페이지 단위로 훑으며 범위에 속하는 키만 남깁니다.
+    max_workers = JIRA_PAGE_FETCH_WORKERS if use_pagination else 1
+    expected_keys = set()
+    for page in iter_search_pages(jira, base_jql, fields_param, max_workers):
+        expected_keys.update(issue.key for issue in select_issues_in_window(page, start_date, end_date))
+
+    server_keys = {issue.key for issue in server_issues}
+    mismatch = {
+        'missing': sorted(expected_keys - server_keys),
+        'unexpected': sorted(server_keys - expected_keys)
     }
+    if mismatch['missing'] or mismatch['unexpected']:
+        print(f"⚠️ 서버/Python 필터링 결과 불일치")
+        print(f"  서버 결과에 누락된 티켓: {', '.join(mismatch['missing']) or '없음'}")
+        print(f"  범위 밖인데 서버가 반환한 티켓: {', '.join(mismatch['unexpected']) or '없음'}")
+    else:
+        print(f"✅ 서버/Python 필터링 결과 일치 ({len(server_keys)}개)")
+    return mismatch
+
+def load_issue_store(path=ISSUE_STORE_FILE_PATH):
+    """로컬 이슈 저장소를 읽어옵니다. 파일이 없으면 빈 저장소를 반환합니다."""
+    store = read_json(path, default=None)
+    if not isinstance(store, dict) or not isinstance(store.get('issues'), dict):
+        return {'project': None, 'high_water_mark': None, 'last_full_sync': None, 'issues': {}}
+    store['issues'] = {key: IssueRecord.from_dict(issue) for key, issue in store['issues'].items()}
+    return store
+
+def save_issue_store(store, path=ISSUE_STORE_FILE_PATH):
+    """로컬 이슈 저장소를 저장합니다. IssueRecord는 딕셔너리로 변환하여 기록합니다."""
+    write_json(path, dict(store, issues={key: issue.to_dict() for key, issue in store['issues'].items()}))
+
+def sync_issue_store(jira, project_key, store, use_pagination=False):
+    """
+    Jira 이슈를 로컬 이슈 저장소에 동기화합니다.
+
+    - 처음 실행하거나 ISSUE_STORE_FULL_SYNC_HOURS가 지나면 예정된 시작 값이 있는 모든 티켓을 다시 받아옵니다.
+    - 그 외에는 `updated >= high-water mark` 조건으로 변경된 티켓만 받아와 key 기준으로 병합합니다.
+      예정된 시작 값이 지워진 티켓은 저장소에서 제거됩니다.
+    - 전체 동기화 조회 개수가 JIRA_SEARCH_MAX_RESULTS의 배수이면 검색이 잘렸을 수 있으므로(updated 오름차순이라
+      최근에 바뀐 티켓이 빠짐) 저장소를 교체하지 않고 병합만 하며, 동기화 시각을 남기지 않아 다음 실행에서 다시 시도합니다.
+
+    Args:
+        jira: JIRA 클라이언트
+        project_key (str): Jira 프로젝트 키
+        store (dict): load_issue_store()로 읽은 저장소 (제자리에서 갱신됨)
+        use_pagination (bool): 페이지네이션 사용 여부
+
+    Returns:
+        int: 이번 동기화에서 받아온 티켓 수
+    """
+    sync_started = datetime.now(timezone.utc)
+    high_water_mark = store.get('high_water_mark')
+    last_full_sync = store.get('last_full_sync')
+    full_sync = (
+        store.get('project') != project_key
+        or not high_water_mark
+        or not last_full_sync
+        or sync_started - datetime.fromisoformat(last_full_sync) > timedelta(hours=ISSUE_STORE_FULL_SYNC_HOURS)
+    )
+    fields_param = JIRA_SEARCH_FIELDS
 
+    if full_sync:
+        jql = f"project = '{project_key}' AND {JIRA_DEPLOY_DATE_JQL_FIELD} IS NOT EMPTY ORDER BY updated ASC"
+        print(f"이슈 저장소 전체 동기화: {jql}")
+    else:
+        jql_timezone = timezone(timedelta(hours=JIRA_JQL_UTC_OFFSET_HOURS))
+        since = datetime.fromisoformat(high_water_mark).astimezone(jql_timezone).strftime('%Y-%m-%d %H:%M')
+        jql = f"project = '{project_key}' AND updated >= \"{since}\" ORDER BY updated ASC"
+        print(f"이슈 저장소 증분 동기화: {jql}")
+
+    issues = {} if full_sync else store['issues']
+    fetched_by_key = {}
+    fetched_count = 0
+    removed = 0
+    for issue in iter_search_issues(jira, jql, fields_param, use_pagination):
+        fetched_count += 1
+        record = IssueRecord.from_jira(issue)
+        if not full_sync:
+            fetched_by_key[record.key] = record
+        if record.deploy_date:
+            issues[record.key] = record
+        elif issues.pop(record.key, None) is not None:
+            removed += 1
+    
+    # 배포 티켓의 상태가 바뀌어도 부모 티켓의 updated는 바뀌지 않으므로,
+    # 증분 조회된 티켓을 참조하는 저장된 issuelinks의 요약/상태를 갱신합니다.
+    if not full_sync:
+        refresh_linked_issue_fields(issues, fetched_by_key)
+    
+    if full_sync and fetched_count and fetched_count % JIRA_SEARCH_MAX_RESULTS == 0:
+        print(f"⚠️ 전체 동기화 조회 개수({fetched_count}개)가 검색 요청 크기({JIRA_SEARCH_MAX_RESULTS}개)의 배수입니다. "
+              f"결과가 잘렸을 수 있어 기존 저장소에 병합만 하고 다음 실행에서 전체 동기화를 다시 시도합니다.")
+        if store.get('project') == project_key:
+            issues = dict(store['issues'], **issues)
+        store['issues'] = issues
+        store['project'] = project_key
+        store['last_full_sync'] = None
+        return fetched_count
+
+    store['project'] = project_key
+    store['issues'] = issues
+    store['high_water_mark'] = (sync_started - timedelta(minutes=ISSUE_STORE_SYNC_OVERLAP_MINUTES)).isoformat()
+    if full_sync:
+        store['last_full_sync'] = sync_started.isoformat()
+
+    print(f"✅ 이슈 저장소 동기화 완료 ({'전체' if full_sync else '증분'}): "
+          f"조회 {fetched_count}개, 제거 {removed}개, 저장소 {len(issues)}개")
+    return fetched_count
+
+def refresh_linked_issue_fields(issues, fetched_by_key):
+    """저장된 이슈들의 issuelinks 중 fetched_by_key에 있는 티켓의 요약/상태를 최신 값으로 바꿉니다."""
+    for issue in issues.values():
+        for link in issue.issuelinks or []:
+            linked_ticket = link.get('inwardIssue') or link.get('outwardIssue')
+            latest = fetched_by_key.get(linked_ticket.get('key')) if linked_ticket else None
+            if latest:
+                linked_fields = linked_ticket.setdefault('fields', {})
+                linked_fields['summary'] = latest.summary
+                linked_fields['status'] = {'name': latest.status}
+
+def select_issues_from_store(store, start_date, end_date):
+    """로컬 이슈 저장소에서 예정된 시작 값이 [start_date, end_date]에 속하는 티켓을 생성일 역순으로 반환합니다."""
+    stored_issues = list(store['issues'].values())
+    column = build_deploy_date_column([issue.deploy_date for issue in stored_issues])
+    mask = deploy_date_window_mask(column, start_date, end_date)
+    selected = [issue for issue, included in zip(stored_issues, mask) if included]
+    return sorted(selected, key=lambda issue: issue.created or '', reverse=True)
+
+class RunScopedCache:
+    """
+    한 번의 실행 동안만 유지되는 조회 결과 캐시입니다.
+
+    같은 실행 안에서 같은 조건(정규화된 조회 파라미터)으로 다시 조회하면 저장된 결과를 돌려주어,
+    스냅샷·본문 생성·알림이 하나의 조회 결과를 함께 사용하도록 합니다. enable() 전에는 캐시하지 않습니다.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self.hits = 0
+        self.misses = 0
+        self._results = {}
+        self._lock = threading.Lock()
+    
+    def enable(self):
+        self.enabled = True
+    
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    @staticmethod
+    def make_key(name, **params):
+        """문자열은 공백 제거, 날짜는 ISO 문자열로 바꿔 파라미터 순서·표기와 관계없는 키를 만듭니다."""
+        normalized = []
+        for param, value in sorted(params.items()):
+            if isinstance(value, (date, datetime)):
+                value = value.isoformat()[:10]
+            elif isinstance(value, str):
+                value = value.strip()
+            normalized.append((param, value))
+        return (name, tuple(normalized))
+    
+    def get_or_compute(self, key, compute):
+        if not self.enabled:
+            return compute()
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key]
+        result = compute()
+        with self._lock:
+            self.misses += 1
+            self._results[key] = result
+        return result
+    
+    def stats_text(self):
+        return f"실행 범위 조회 캐시: 조회 {self.misses}회, 재사용 {self.hits}회 (절약된 조회 {self.hits}회)"
+
+RUN_CACHE = RunScopedCache()
+
+def get_jira_issues_by_customfield_10817(jira, project_key, start_date, end_date, use_pagination=False, verify_filter=False, use_issue_store=False):
+    """
+    customfield_10817 필드 값이 해당 주간에 속하는 모든 티켓을 조회합니다.
+
+    한 번의 실행 안에서는 같은 프로젝트·기간의 조회 결과를 RUN_CACHE로 재사용합니다.
+    페이지네이션, 검증, 이슈 저장소 사용 여부는 조회 방식만 다를 뿐 결과가 같으므로 캐시 키에 포함하지 않습니다.
+    """
+    cache_key = RUN_CACHE.make_key(
+        'weekly_issues', project_key=project_key.upper(), start_date=start_date, end_date=end_date
+    )
+    return RUN_CACHE.get_or_compute(cache_key, lambda: fetch_jira_issues_by_customfield_10817(
+        jira, project_key, start_date, end_date, use_pagination, verify_filter, use_issue_store
+    ))
+
+def fetch_jira_issues_by_customfield_10817(jira, project_key, start_date, end_date, use_pagination=False, verify_filter=False, use_issue_store=False):
+    """
+    customfield_10817 필드 값이 해당 주간에 속하는 모든 티켓을 Jira에서 조회합니다.
 
-def get_jira_issues_by_customfield_10817(jira, project_key, start_date, end_date, use_pagination=False):
-    """customfield_10817 필드 값이 해당 주간에 속하는 모든 티켓을 조회합니다."""
+    날짜 범위는 JQL에 포함되어 서버에서 필터링됩니다.
+    verify_filter=True이면 전체 티켓을 추가로 조회하여 Python 필터링 결과와의 불일치를 보고합니다 (저장소 결과에도 적용).
+    use_issue_store=True이면 로컬 이슈 저장소를 증분 동기화한 뒤 저장소에서 해당 주간 티켓을 읽어옵니다.
+    """
     print(f"=== customfield_10817 직접 조회 시작 ===")
     print(f"프로젝트: {project_key}")
     print(f"대상 기간: {start_date} ~ {end_date}")
     print(f"페이지네이션 사용: {'예' if use_pagination else '아니오'}")
     
     try:
-        # 1단계: cf[10817] 형식으로 JQL 쿼리 (Jira 클라우드에서 작동)
-        base_jql = f"project = '{project_key}' AND cf[10817] IS NOT EMPTY ORDER BY created DESC"
-        fields_param = f"key,summary,status,assignee,created,updated,{JIRA_DEPLOY_DATE_FIELD_ID}"
-        
-        print(f"기본 JQL: {base_jql}")
-        print(f"조회 필드: {fields_param}")
-        
-        # 페이지네이션 사용 여부에 따른 티켓 조회
-        if use_pagination:
-            # 페이지네이션을 사용하여 모든 티켓 조회
-            all_issues = []
-            start_at = 0
-            max_results = 1000  # 한 번에 1000개씩 조회
-            
-            while True:
-                batch = jira.search_issues(base_jql, fields=fields_param, startAt=start_at, maxResults=max_results)
-                if not batch:
-                    break
-                all_issues.extend(batch)
-                start_at += len(batch)
-                print(f"배치 조회: {len(batch)}개 (총 {len(all_issues)}개)")
-                if len(batch) < max_results:
-                    break
-            
-            print(f"✅ 전체 티켓 조회 성공 (페이지네이션 사용): {len(all_issues)}개")
-        else:
-            # 페이지네이션 없이 한 번에 조회 (기본값: 최대 1000개)
-            all_issues = jira.search_issues(base_jql, fields=fields_param, maxResults=1000)
-            print(f"✅ 전체 티켓 조회 성공 (페이지네이션 미사용): {len(all_issues)}개")
-        
-        # 2단계: customfield_10817 필드 값이 해당 주간에 속하는 티켓 필터링
-        filtered_issues = []
-        start_date_obj = datetime.strptime(start_date, '%Y-%m-%d').date()
-        end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
-        
-        print(f"\n=== customfield_10817 필드 값 필터링 ===")
-        print(f"필터링 범위: {start_date_obj} ~ {end_date_obj}")
-        print(f"목표: 해당 주간에 속하는 모든 IT 티켓 포함")
+        if use_issue_store:
+            store = load_issue_store()
+            sync_issue_store(jira, project_key, store, use_pagination)
+            save_issue_store(store)
+            filtered_issues = select_issues_from_store(store, start_date, end_date)
+            print(f"로컬 이슈 저장소에서 해당 주간 티켓 조회: {len(filtered_issues)}개")
+            if verify_filter:
+                verify_deploy_date_filter(jira, project_key, filtered_issues, start_date, end_date, JIRA_SEARCH_FIELDS, use_pagination)
+            return filtered_issues
         
-        # 제거된 티켓들을 확인하기 위한 디버깅 리스트
-        removed_tickets = []
-        included_tickets = []
+        jql = build_deploy_date_jql(project_key, start_date, end_date)
+        fields_param = JIRA_SEARCH_FIELDS
         
-        for issue in all_issues:
-            issue_key = issue.key
-            custom_field_value = getattr(issue.fields, JIRA_DEPLOY_DATE_FIELD_ID, None)
-            
-            if custom_field_value:
-                # customfield_10817 값이 있는 경우, 날짜 파싱 및 필터링
-                try:
-                    # ISO 형식 날짜 문자열을 파싱
-                    if isinstance(custom_field_value, str):
-                        # "2025-07-23T11:00:00.000+0900" 형식 파싱
-                        field_date_str = custom_field_value.split('T')[0]  # 날짜 부분만 추출
-                        field_date = datetime.strptime(field_date_str, '%Y-%m-%d').date()
-                    else:
-                        # datetime 객체인 경우
-                        field_date = custom_field_value.date()
-                    
-                    # 해당 주간에 속하는지 확인
-                    if start_date_obj <= field_date <= end_date_obj:
-                        # 포함되는 티켓
-                        issue_dict = {
-                            'key': issue_key,
-                            'summary': getattr(issue.fields, 'summary', ''),
-                            'status': getattr(issue.fields, 'status', {}).name if hasattr(getattr(issue.fields, 'status', {}), 'name') else str(getattr(issue.fields, 'status', '')),
-                            'assignee': getattr(issue.fields, 'assignee', {}).displayName if hasattr(getattr(issue.fields, 'assignee', {}), 'displayName') else str(getattr(issue.fields, 'assignee', '')),
-                            'created': getattr(issue.fields, 'created', ''),
-                            'updated': getattr(issue.fields, 'updated', ''),
-                            'fields': {
-                                'summary': getattr(issue.fields, 'summary', ''),
-                                'status': {'name': getattr(issue.fields, 'status', {}).name if hasattr(getattr(issue.fields, 'status', {}), 'name') else str(getattr(issue.fields, 'status', ''))},
-                                JIRA_DEPLOY_DATE_FIELD_ID: custom_field_value
-                            }
-                        }
-                        filtered_issues.append(issue_dict)
-                        included_tickets.append(f"✅ {issue_key}: {field_date} (예정된 시작: {custom_field_value}) - 포함됨")
-                    else:
-                        # 범위 외 티켓
-                        removed_tickets.append(f"⏭️ {issue_key}: {field_date} (범위 외: {start_date_obj} ~ {end_date_obj})")
-                except Exception as e:
-                    print(f"날짜 파싱 오류 ({issue_key}): {e}")
-                    removed_tickets.append(f"⏭️ {issue_key}: 날짜 파싱 오류")
-            else:
-                # customfield_10817 값이 없는 티켓 (이 경우는 발생하지 않아야 함)
-                removed_tickets.append(f"⏭️ {issue_key}: customfield_10817 값 없음")
-        
-        # 필터링 결과 출력
-        print(f"\n=== 필터링 결과 ===")
-        print(f"전체 티켓: {len(all_issues)}개")
-        print(f"customfield_10817 값이 있는 티켓: {len([i for i in all_issues if getattr(i.fields, JIRA_DEPLOY_DATE_FIELD_ID, None)])}개")
-        print(f"해당 주간에 속하는 티켓: {len(filtered_issues)}개")
-        print(f"제거된 티켓: {len(removed_tickets)}개")
+        print(f"JQL: {jql}")
+        print(f"조회 필드: {fields_param}")
         
-        # 포함된 티켓 상세 정보 출력
-        print(f"\n=== 포함된 티켓 상세 정보 ===")
-        for ticket_info in included_tickets:
-            print(f"  {ticket_info}")
+        # Resource는 페이지 단위로 바로 IssueRecord로 바꾸고 버립니다.
+        filtered_issues = [IssueRecord.from_jira(issue) for issue in iter_search_issues(jira, jql, fields_param, use_pagination)]
         
-        # 제거된 티켓 상세 정보 출력 (최대 10개만)
-        if removed_tickets:
-            print(f"\n=== 제거된 티켓 상세 정보 ===")
-            for i, ticket_info in enumerate(removed_tickets[:10]):
-                print(f"  {ticket_info}")
-            if len(removed_tickets) > 10:
-                print(f"  ... 외 {len(removed_tickets) - 10}개")
+        if verify_filter:
+            verify_deploy_date_filter(jira, project_key, filtered_issues, start_date, end_date, fields_param, use_pagination)
         
         print(f"\n=== 최종 결과 ===")
-        for i, issue in enumerate(filtered_issues, 1):
-            print(f"{i}. {issue['key']}: {issue['summary']}")
-            print(f"   예정된 시작: {issue['fields'][JIRA_DEPLOY_DATE_FIELD_ID]}")
-            print(f"   상태: {issue['status']}")
+        print(f"해당 주간에 속하는 티켓: {len(filtered_issues)}개")
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, issue in enumerate(filtered_issues, 1):
+                logger.debug("%d. %s: %s (예정된 시작: %s, 상태: %s)", i, issue.key, issue.summary, issue.deploy_date, issue.status)
         
         return filtered_issues
         
@@ -999,36 +2687,39 @@ def main():
     
     # 2. API 클라이언트 생성
     try:
-        jira = JIRA(server=atlassian_url, basic_auth=(atlassian_username, atlassian_token))
-        confluence = Confluence(url=atlassian_url, username=atlassian_username, password=atlassian_token, cloud=True)
+        jira = create_jira_client(atlassian_url, atlassian_username, atlassian_token)
+        confluence = create_confluence_client(atlassian_url, atlassian_username, atlassian_token)
         print(f"\nJira/Confluence 서버 연결 성공!: {get_now_str()}")
     except Exception as e:
         print(f"Jira/Confluence 연결 오류: {e}")
         return
     
     # 3. 명령행 인수 처리
+    # --verbose 옵션 또는 LOG_LEVEL=DEBUG이면 티켓별 상세 로그를 출력합니다.
+    configure_logging('DEBUG' if "--verbose" in sys.argv else LOG_LEVEL)
     mode = "update"  # 기본값
     force_update = False  # 강제 업데이트 플래그
     use_pagination = False  # 페이지네이션 사용 여부 (기본값: False)
     test_mode = False  # 테스트 모드 플래그 (Slack 알림 비활성화)
+    verify_filter = False  # 서버 측 날짜 필터링 검증 여부
+    use_issue_store = False  # 로컬 이슈 저장소 증분 동기화 사용 여부
+    use_async = False  # asyncio 실행 엔진 사용 여부
+    compact = False  # 간결 렌더링 사용 여부
+    compare_size = False  # 간결 렌더링에서 기본 본문과 크기 비교 여부
+    static_table = False  # Jira 매크로 대신 정적 표 사용 여부
     
     if len(sys.argv) > 1:
         if sys.argv[1] == "--check-page":
             check_confluence_page_content()
             return
         elif sys.argv[1] == "--debug-links" and len(sys.argv) > 2:
-            # 특정 티켓의 연결 관계 디버깅
-            env_vars = load_env_vars([
-                'ATLASSIAN_URL', 'ATLASSIAN_USERNAME', 'ATLASSIAN_API_TOKEN'
-            ])
-            jira = JIRA(server=env_vars['ATLASSIAN_URL'], 
-                       basic_auth=(env_vars['ATLASSIAN_USERNAME'], env_vars['ATLASSIAN_API_TOKEN']))
+            # 특정 티켓의 연결 관계 디버깅 (위에서 만든 Jira 클라이언트 재사용)
             debug_issue_links(jira, sys.argv[2])
             return
         elif sys.argv[1] == "--force-update":
             mode = "update"
             force_update = True
-        else:
+        elif not sys.argv[1].startswith("--"):
             mode = sys.argv[1]
     
     # --pagination 옵션 확인
@@ -1044,22 +2735,41 @@ def main():
         test_mode = True
         print("🧪 테스트 모드가 활성화되었습니다. Slack 알림이 전송되지 않습니다.")
     
+    # --verify-filter 옵션 확인 (서버 측 필터링 결과 검증)
+    if "--verify-filter" in sys.argv:
+        verify_filter = True
+        print("🔍 서버 측 날짜 필터링 검증 모드가 활성화되었습니다.")
+    
+    # --delta-sync 옵션 확인 (로컬 이슈 저장소 증분 동기화)
+    if "--delta-sync" in sys.argv:
+        use_issue_store = True
+        print("🔄 로컬 이슈 저장소 증분 동기화가 활성화되었습니다.")
+    
+    # --async 옵션 확인 (독립적인 네트워크 호출을 동시에 실행)
+    if "--async" in sys.argv:
+        use_async = True
+        print("⚡ asyncio 실행 엔진이 활성화되었습니다.")
+    
+    # --compact 옵션 확인 (인라인 스타일과 안내 문구를 빼서 페이지 본문 크기 축소)
+    if "--compact" in sys.argv:
+        compact = True
+        print("📦 간결 렌더링이 활성화되었습니다.")
+    
+    # --compare-size 옵션 확인 (간결 렌더링에서 기본 본문도 만들어 크기 비교)
+    if "--compare-size" in sys.argv:
+        compare_size = True
+    
+    # --static-table 옵션 확인 (Jira 매크로 대신 조회 결과로 만든 정적 표 사용)
+    if "--static-table" in sys.argv:
+        static_table = True
+        print("📋 정적 이슈 표가 활성화되었습니다. 페이지 조회 시 Jira 매크로를 실행하지 않습니다.")
+    
     # 4. 날짜 범위 계산
     monday, sunday = get_week_range(mode)
     start_date_str, end_date_str = monday.strftime('%Y-%m-%d'), sunday.strftime('%Y-%m-%d')
     page_title = get_page_title(monday, sunday)
     
-    # 디버깅: 날짜 범위 상세 정보 출력
-    print(f"\n=== 날짜 범위 계산 디버깅 ===")
-    print(f"현재 날짜: {date.today()}")
-    print(f"요일: {date.today().weekday()} (0=월요일, 6=일요일)")
-    print(f"계산된 월요일: {monday}")
-    print(f"계산된 일요일: {sunday}")
-    print(f"시작일: {start_date_str}")
-    print(f"종료일: {end_date_str}")
-    print(f"페이지 제목: {page_title}")
-    print(f"사용자 의도 확인: 7월 4째주 (07/21~07/27)와 일치하는가?")
-    print()
+    logger.debug("날짜 범위: %s ~ %s, 페이지 제목: %s", start_date_str, end_date_str, page_title)
     
     # 모드별 설명 메시지
     mode_descriptions = {
@@ -1073,196 +2783,482 @@ def main():
     print(f"대상 기간: {start_date_str} ~ {end_date_str}")
     print(f"페이지 제목: {page_title}")
 
-    # 5. Jira 이슈 조회 (customfield_10817 직접 조회 사용)
-    jql_query = (
-        f"project = '{jira_project_key}' AND "
-        f"'{JIRA_DEPLOY_DATE_FIELD_ID}' >= '{start_date_str}' AND '{JIRA_DEPLOY_DATE_FIELD_ID}' <= '{end_date_str}' "
-        f"ORDER BY updated DESC"
+    # 5. 실행 옵션 정리
+    report_options = {
+        'mode': mode,
+        'mode_desc': mode_desc,
+        'force_update': force_update,
+        'use_pagination': use_pagination,
+        'verify_filter': verify_filter,
+        'use_issue_store': use_issue_store,
+        'compact': compact,
+        'compare_size': compare_size,
+        'static_table': static_table,
+        'test_mode': test_mode,
+        'deploy_message_enabled': deploy_message_enabled,
+        'atlassian_url': atlassian_url,
+        'jira_project_key': jira_project_key,
+        'confluence_space_key': confluence_space_key,
+        'parent_page_id': parent_page_id,
+        'start_date_str': start_date_str,
+        'end_date_str': end_date_str,
+        'page_title': page_title,
+        'jql_query': (
+            f"project = '{jira_project_key}' AND "
+            f"'{JIRA_DEPLOY_DATE_FIELD_ID}' >= '{start_date_str}' AND '{JIRA_DEPLOY_DATE_FIELD_ID}' <= '{end_date_str}' "
+            f"ORDER BY updated DESC"
+        ),
+        'snapshot_file_path': get_snapshot_file_path(mode),
+    }
+    
+    # 6. 조회 → 연결 티켓 조회 → 게시 파이프라인 실행
+    # 이번 실행의 조회 결과를 스냅샷·본문 생성·알림이 함께 사용하도록 실행 범위 캐시를 켭니다.
+    RUN_CACHE.enable()
+    # 실행이 겹치면 앞선 실행이 끝나기를 기다리고, 기다리는 동안 같은 주간·모드의 실행이 끝났으면 이번 실행을 생략합니다.
+    try:
+        with ReportRunLock() as run_lock:
+            if should_reuse_recent_run(run_lock, start_date_str, mode, force_update):
+                print(f"기다리는 동안 같은 주간({start_date_str})의 {mode} 실행이 끝났습니다. 이번 실행 생략. {get_now_str()}")
+                log(f"\n실행시간: {get_now_str()}\n같은 주간의 실행 결과 재사용. 실행 생략.")
+                return
+            if use_async:
+                asyncio.run(run_weekly_report_async(jira, confluence, report_options))
+            else:
+                run_weekly_report(jira, confluence, report_options)
+            mark_run_completed(start_date_str, mode)
+    except TimeoutError as e:
+        print(f"실행 생략: {e}")
+        log(f"\n실행시간: {get_now_str()}\n실행 잠금 대기 시간 초과. 실행 생략.")
+    finally:
+        # 이번 실행의 알림과 보류되어 있던 알림을 보냅니다 (알림 시간 외에는 다음 실행으로 미룸).
+        SLACK_OUTBOX.flush_in_background()
+        SLACK_OUTBOX.wait()
+
+def fetch_report_issues(jira, options):
+    """리포트 대상 주간의 배포 예정 티켓을 조회합니다."""
+    issues = get_jira_issues_by_customfield_10817(
+        jira, options['jira_project_key'], options['start_date_str'], options['end_date_str'],
+        options['use_pagination'], options['verify_filter'], options['use_issue_store']
     )
-    issues = get_jira_issues_by_customfield_10817(jira, jira_project_key, start_date_str, end_date_str, use_pagination)
     if not issues:
-        print(f"{mode_desc}에 배포 예정 티켓 없음. 빈 테이블로 생성/업데이트.")
+        print(f"{options['mode_desc']}에 배포 예정 티켓 없음. 빈 테이블로 생성/업데이트.")
+    return issues
+
+def detect_issue_changes(issues, options):
+    """
+    이전 스냅샷과 비교하여 변경사항을 구합니다.
 
-    # 6. 변경 감지
-    SNAPSHOT_FILE_PATH = get_snapshot_file_path(mode)
+    Returns:
+        tuple: (현재 스냅샷, 변경 유형별 이슈 목록). update 모드에서 변경이 없으면 (현재 스냅샷, None)
+    """
     print(f"\n=== 스냅샷 파일 정보 ===")
-    print(f"모드: {mode}")
-    print(f"스냅샷 파일: {SNAPSHOT_FILE_PATH}")
-    print(f"대상 기간: {start_date_str} ~ {end_date_str}")
+    print(f"모드: {options['mode']}")
+    print(f"스냅샷 이력: {SNAPSHOT_HISTORY.path} (주간 {options['start_date_str']})")
+    print(f"대상 기간: {options['start_date_str']} ~ {options['end_date_str']}")
     
-    prev_snapshot = read_json(SNAPSHOT_FILE_PATH)
+    prev_snapshot = load_previous_snapshot(options)
     curr_snapshot = snapshot_issues(issues, JIRA_DEPLOY_DATE_FIELD_ID)
+    changed_issues = get_changed_issues(prev_snapshot, curr_snapshot, options['atlassian_url'])
     
     # create, current 모드에서는 이슈 변경 여부와 관계없이 페이지 생성/업데이트 진행
-    if mode in ["create", "current"]:
-        changed_issues = get_changed_issues(prev_snapshot, curr_snapshot, atlassian_url)
-    else:
-        # update 모드에서만 이슈 변경 감지 (강제 업데이트 제외)
-        if not force_update and not issues_changed(prev_snapshot, curr_snapshot):
-            print(f"JIRA 이슈 변경 없음. 업데이트/알림 생략. {get_now_str()}")
-            log(f"\n실행시간: {get_now_str()}\n업데이트 할 사항 없음.")
-            return
-        changed_issues = get_changed_issues(prev_snapshot, curr_snapshot, atlassian_url)
+    # update 모드에서만 이슈 변경 감지 (강제 업데이트 제외)
+    if options['mode'] not in ["create", "current"] and not options['force_update'] \
+            and prev_snapshot is not None and not any(changed_issues.values()):
+        print(f"JIRA 이슈 변경 없음. 업데이트/알림 생략. {get_now_str()}")
+        log(f"\n실행시간: {get_now_str()}\n업데이트 할 사항 없음.")
+        return curr_snapshot, None
+    return curr_snapshot, changed_issues
+
+def build_report_content(jira, issues, options):
+    """
+    Confluence 페이지 본문을 생성합니다.
 
-    # 7. Confluence 페이지 생성/업데이트 및 Slack 알림
-    page_content = create_confluence_content(jql_query, issues, atlassian_url, jira, jira_project_key, start_date_str, end_date_str, use_pagination)
+    Returns:
+        tuple: (주간 페이지 본문, [(하위 페이지 제목, 본문), ...])
+    """
+    return create_confluence_page_set(
+        options['jql_query'], issues, options['atlassian_url'], jira, options['jira_project_key'],
+        options['start_date_str'], options['end_date_str'], options['use_pagination'], options['use_issue_store'],
+        options['compact'], options['static_table'], options['page_title'], options['compare_size']
+    )
+
+class ConfluencePageIndex:
+    """
+    주간 페이지 제목 → 페이지 ID 색인입니다.
+
+    상위 페이지의 하위 페이지 목록을 한 번 훑어 만들고 파일에 저장하므로,
+    평소에는 페이지 ID를 찾는 데 Confluence 요청이 필요하지 않습니다. 색인에 없거나 404가 나면 목록을 다시 받습니다.
+    """
+    
+    def __init__(self, path=CONFLUENCE_PAGE_INDEX_FILE_PATH):
+        self.path = path
+        self.pages = None
+        self._dirty = False
+        self._lock = threading.Lock()
+    
+    def _ensure_loaded(self):
+        if self.pages is None:
+            pages = read_json(self.path, default={})
+            self.pages = pages if isinstance(pages, dict) else {}
+    
+    def get(self, title):
+        with self._lock:
+            self._ensure_loaded()
+            return self.pages.get(title)
+    
+    def put(self, title, page_id):
+        with self._lock:
+            self._ensure_loaded()
+            self.pages[title] = str(page_id)
+            self._dirty = True
+    
+    def titles_with_prefix(self, prefix):
+        with self._lock:
+            self._ensure_loaded()
+            return sorted(title for title in self.pages if title.startswith(prefix))
+    
+    def forget(self, title):
+        with self._lock:
+            self._ensure_loaded()
+            if self.pages.pop(title, None) is not None:
+                self._dirty = True
+    
+    def refresh(self, confluence, parent_page_id):
+        """상위 페이지의 하위 페이지 목록을 페이지 단위로 모두 받아 색인을 갱신합니다."""
+        start = 0
+        listed = {}
+        while True:
+            children = confluence.get_page_child_by_type(
+                parent_page_id, type='page', start=start, limit=CONFLUENCE_CHILD_PAGE_LIMIT
+            ) or []
+            listed.update({child['title']: str(child['id']) for child in children})
+            if len(children) < CONFLUENCE_CHILD_PAGE_LIMIT:
+                break
+            start += len(children)
+        print(f"Confluence 페이지 색인 갱신: 하위 페이지 {len(listed)}개")
+        with self._lock:
+            self._ensure_loaded()
+            self.pages.update(listed)
+            self._dirty = True
+    
+    def save(self):
+        if self.pages is not None and self._dirty:
+            write_json(self.path, self.pages)
+            self._dirty = False
+
+CONFLUENCE_PAGE_INDEX = ConfluencePageIndex()
+
+def is_not_found_error(error):
+    """Confluence 요청 오류가 404(페이지 없음)인지 확인합니다."""
+    if isinstance(error, ApiNotFoundError):
+        return True
+    response = getattr(error, 'response', None) or getattr(getattr(error, 'reason', None), 'response', None)
+    return getattr(response, 'status_code', None) == 404
+
+def resolve_weekly_page_id(confluence, space_key, page_title, parent_page_id):
+    """
+    주간 페이지 ID를 색인에서 찾습니다. 없으면 상위 페이지의 하위 목록으로 색인을 갱신하고,
+    그래도 없으면 (다른 위치로 옮겨진 경우를 위해) 제목으로 조회합니다. 페이지가 없으면 None.
+    """
+    page_id = CONFLUENCE_PAGE_INDEX.get(page_title)
+    if page_id:
+        return page_id
+    CONFLUENCE_PAGE_INDEX.refresh(confluence, parent_page_id)
+    page_id = CONFLUENCE_PAGE_INDEX.get(page_title)
+    if page_id is None and confluence.page_exists(space=space_key, title=page_title):
+        page_id = str(confluence.get_page_id(space=space_key, title=page_title))
+        CONFLUENCE_PAGE_INDEX.put(page_title, page_id)
+    CONFLUENCE_PAGE_INDEX.save()
+    return page_id
+
+def lookup_confluence_page(confluence, space_key, page_title, parent_page_id):
+    """
+    주간 페이지가 있으면 페이지 ID와 현재 버전 번호를 반환합니다. 본문은 내려받지 않습니다.
+    색인의 페이지 ID가 404이면(삭제/이동) 색인을 갱신하여 한 번 더 찾습니다.
+
+    Returns:
+        tuple: (page_id, 버전 번호). 페이지가 없으면 (None, None)
+    """
+    page_id = resolve_weekly_page_id(confluence, space_key, page_title, parent_page_id)
+    if page_id is None:
+        return None, None
     try:
-        if confluence.page_exists(space=confluence_space_key, title=page_title):
-            page_id = confluence.get_page_id(space=confluence_space_key, title=page_title)
-            page_url = f"{atlassian_url}/wiki/spaces/{confluence_space_key}/pages/{page_id}"
-            current_page = confluence.get_page_by_id(page_id, expand='body.storage')
-            current_content = current_page.get('body', {}).get('storage', {}).get('value', '')
-            if normalize_html_content(current_content) != normalize_html_content(page_content):
-                confluence.update_page(
-                    page_id=page_id, title=page_title, body=page_content,
-                    parent_id=parent_page_id, type='page', representation='storage'
-                )
-                print(f"'{page_title}' 페이지 업데이트 완료.")
-                
-                # 중복 알림 방지를 위한 변경사항 해시 확인
-                notified_changes = get_notified_changes()
-                change_hash = generate_change_hash(changed_issues, page_title)
-                
-                # 변경사항이 있고, 아직 알림을 보내지 않은 경우에만 Slack 알림 전송
-                total_changes = len(changed_issues.get('added', [])) + len(changed_issues.get('removed', [])) + len(changed_issues.get('updated', []))
-                if total_changes > 0 and change_hash not in notified_changes:
-                    # 변경 유형별로 메시지 구성
-                    added_list = '\n'.join([
-                        f"➕ <{i['url']}|{i['key']}: {i['summary']}>" for i in changed_issues.get('added', [])
-                    ])
-                    removed_list = '\n'.join([
-                        f"➖ <{i['url']}|{i['key']}: {i['summary']}>" for i in changed_issues.get('removed', [])
-                    ])
-                    updated_list = '\n'.join([
-                        f"🔄 <{i['url']}|{i['key']}: {i['summary']}>" for i in changed_issues.get('updated', [])
-                    ])
-                    
-                    # 변경사항 요약 메시지 구성
-                    change_summary = []
-                    if changed_issues.get('added'):
-                        change_summary.append(f"➕ 추가: {len(changed_issues['added'])}개")
-                    if changed_issues.get('removed'):
-                        change_summary.append(f"➖ 제거: {len(changed_issues['removed'])}개")
-                    if changed_issues.get('updated'):
-                        change_summary.append(f"🔄 갱신: {len(changed_issues['updated'])}개")
-                    
-                    # 전체 변경사항 목록
-                    all_changes = []
-                    if added_list:
-                        all_changes.append(f"[추가된 티켓]\n{added_list}")
-                    if removed_list:
-                        all_changes.append(f"[제거된 티켓]\n{removed_list}")
-                    if updated_list:
-                        all_changes.append(f"[갱신된 티켓]\n{updated_list}")
-                    
-                    changes_text = '\n\n'.join(all_changes)
-                    summary_text = ' | '.join(change_summary)
-                    
-                    # 테스트 모드가 아닌 경우에만 Slack 알림 전송
-                    if not test_mode:
-                        slack_msg = f"📊 배포 일정 리포트가 업데이트되었습니다:\n{page_title}\n{page_url}\n\n{summary_text}\n\n{changes_text}"
-                        send_slack(slack_msg)
-                        # 알림을 보낸 변경사항 해시를 저장
-                        notified_changes.add(change_hash)
-                        save_notified_changes(notified_changes)
-                        
-                        print(f"Slack 알림 전송 완료 (변경사항: {total_changes}개)")
-                    else:
-                        print(f"🧪 테스트 모드: Slack 알림 전송 생략 (변경사항: {total_changes}개)")
-                elif total_changes > 0:
-                    print(f"동일한 변경사항에 대한 알림이 이미 전송됨 (변경사항: {total_changes}개)")
-                else:
-                    print("변경사항이 없어 Slack 알림을 전송하지 않습니다.")
-                
-                # 테스트 모드가 아닌 경우에만 새로운 배포 티켓 알림 전송
-                if not test_mode:
-                    notify_new_deploy_tickets(issues, atlassian_url, page_title, deploy_message_enabled)
-                else:
-                    print("🧪 테스트 모드: 새로운 배포 티켓 알림 전송 생략")
-                log(f"실행시간: {get_now_str()}\n대상: {', '.join([i['key'] for i in issues])} 업데이트.")
-            else:
-                print(f"'{page_title}' 페이지 내용 변경 없음. 업데이트 생략.")
-                log(f"실행시간: {get_now_str()}\n업데이트 할 사항 없음.")
-        else:
-            confluence.create_page(
-                space=confluence_space_key, title=page_title, body=page_content,
-                parent_id=parent_page_id, representation='storage'
+        current_page = confluence.get_page_by_id(page_id, expand='version')
+    except Exception as e:
+        if not is_not_found_error(e):
+            raise
+        print(f"색인의 페이지 ID({page_id})를 찾을 수 없어 색인을 갱신합니다.")
+        CONFLUENCE_PAGE_INDEX.forget(page_title)
+        page_id = resolve_weekly_page_id(confluence, space_key, page_title, parent_page_id)
+        if page_id is None:
+            return None, None
+        current_page = confluence.get_page_by_id(page_id, expand='version')
+    return page_id, get_page_version(current_page)
+
+def get_page_version(page):
+    """Confluence 페이지 응답에서 버전 번호를 꺼냅니다. 없으면 None."""
+    if not isinstance(page, dict):
+        return None
+    return (page.get('version') or {}).get('number')
+
+def fetch_page_body(confluence, page_id):
+    """페이지의 현재 본문(storage)을 내려받습니다."""
+    current_page = confluence.get_page_by_id(page_id, expand='body.storage')
+    return current_page.get('body', {}).get('storage', {}).get('value', '')
+
+def get_published_fingerprint(page_id, path=PUBLISHED_FINGERPRINT_FILE_PATH):
+    """마지막으로 게시한 본문 지문과 버전 {'fingerprint', 'version'}을 반환합니다. 없으면 None."""
+    return read_json(path, default={}).get(str(page_id))
+
+def save_published_fingerprint(page_id, fingerprint, version, path=PUBLISHED_FINGERPRINT_FILE_PATH):
+    """게시한 본문 지문과 게시 후 Confluence 버전을 저장합니다."""
+    fingerprints = read_json(path, default={})
+    fingerprints[str(page_id)] = {'fingerprint': fingerprint, 'version': version}
+    write_json(path, fingerprints)
+
+def publish_confluence_page(confluence, options, page_content, page_id, page_version, parent_page_id):
+    """
+    주간 페이지를 생성하거나, 내용이 바뀐 경우에만 업데이트합니다.
+
+    새로 만든 본문의 지문이 마지막으로 게시한 지문과 같고 Confluence 버전도 그대로이면
+    현재 본문을 내려받지 않고 'unchanged'로 처리합니다. 버전이 바뀌었으면(누군가 편집함) 본문 전체를 비교합니다.
+
+    Returns:
+        tuple: (page_id, 처리 결과 'created' | 'updated' | 'unchanged')
+    """
+    return publish_page(
+        confluence, options['confluence_space_key'], options['page_title'], page_content, page_id, page_version, parent_page_id
+    )
+
+def publish_page(confluence, space_key, page_title, page_content, page_id, page_version, parent_page_id):
+    """publish_confluence_page의 본체입니다. 주간 페이지와 배포 예정 목록 하위 페이지에 함께 사용합니다."""
+    fingerprint = content_fingerprint(page_content)
+    if page_id is None:
+        created_page = confluence.create_page(
+            space=space_key, title=page_title, body=page_content,
+            parent_id=parent_page_id, representation='storage'
+        )
+        print("✅ Confluence 페이지 생성 완료!")
+        page_id = created_page.get('id') if isinstance(created_page, dict) else None
+        if not page_id:
+            page_id = confluence.get_page_id(space=space_key, title=page_title)
+        CONFLUENCE_PAGE_INDEX.put(page_title, page_id)
+        CONFLUENCE_PAGE_INDEX.save()
+        save_published_fingerprint(page_id, fingerprint, get_page_version(created_page))
+        return page_id, 'created'
+    
+    published = get_published_fingerprint(page_id)
+    if published and page_version is not None and published['version'] == page_version:
+        if published['fingerprint'] == fingerprint:
+            print(f"게시된 본문 지문과 동일 (버전 {page_version}). 현재 본문 다운로드 생략.")
+            return page_id, 'unchanged'
+        content_changed = True
+    else:
+        content_changed = normalize_html_content(fetch_page_body(confluence, page_id)) != normalize_html_content(page_content)
+    
+    if content_changed:
+        updated_page = confluence.update_page(
+            page_id=page_id, title=page_title, body=page_content,
+            parent_id=parent_page_id, type='page', representation='storage'
+        )
+        print(f"'{page_title}' 페이지 업데이트 완료.")
+        save_published_fingerprint(page_id, fingerprint, get_page_version(updated_page))
+        return page_id, 'updated'
+    save_published_fingerprint(page_id, fingerprint, page_version)
+    return page_id, 'unchanged'
+
+def publish_child_pages(confluence, options, child_pages, weekly_page_id):
+    """
+    배포 예정 목록 하위 페이지들을 주간 페이지 아래에 게시합니다.
+
+    하위 페이지마다 지문을 따로 비교하므로 바뀐 행이 있는 페이지만 업데이트됩니다.
+    색인에 남아 있는 이 주간의 하위 페이지 중 이번에 만들지 않은 페이지(티켓이 없어진 날짜 등)는 삭제합니다.
+
+    Returns:
+        int: 생성/업데이트/삭제한 하위 페이지 수
+    """
+    space_key = options['confluence_space_key']
+    changed = 0
+    for child_title, child_content in child_pages:
+        page_id, page_version = lookup_confluence_page(confluence, space_key, child_title, weekly_page_id)
+        _, action = publish_page(confluence, space_key, child_title, child_content, page_id, page_version, weekly_page_id)
+        if action != 'unchanged':
+            changed += 1
+    
+    current_titles = {child_title for child_title, _ in child_pages}
+    for stale_title in CONFLUENCE_PAGE_INDEX.titles_with_prefix(get_child_page_title(options['page_title'], '')):
+        if stale_title in current_titles:
+            continue
+        try:
+            confluence.remove_page(CONFLUENCE_PAGE_INDEX.get(stale_title))
+            print(f"사용하지 않는 하위 페이지 삭제: '{stale_title}'")
+            changed += 1
+        except Exception as e:
+            if not is_not_found_error(e):
+                raise
+        CONFLUENCE_PAGE_INDEX.forget(stale_title)
+    CONFLUENCE_PAGE_INDEX.save()
+    
+    if child_pages:
+        print(f"하위 페이지 {len(child_pages)}개 중 {changed}개 변경")
+    return changed
+
+def notify_page_changes(changed_issues, page_title, page_url, test_mode):
+    """변경사항이 있고 아직 알림을 보내지 않은 경우에만 Slack 알림을 보냅니다."""
+    # 중복 알림 방지를 위한 변경사항 지문 확인
+    change_hash = notification_digest('change', generate_change_hash(changed_issues, page_title))
+    
+    total_changes = len(changed_issues.get('added', [])) + len(changed_issues.get('removed', [])) + len(changed_issues.get('updated', []))
+    if total_changes > 0 and not NOTIFICATION_DEDUPE.contains(page_title, change_hash):
+        # 변경 유형별로 메시지 구성
+        added_list = '\n'.join([
+            f"➕ <{i['url']}|{i['key']}: {i['summary']}>" for i in changed_issues.get('added', [])
+        ])
+        removed_list = '\n'.join([
+            f"➖ <{i['url']}|{i['key']}: {i['summary']}>" for i in changed_issues.get('removed', [])
+        ])
+        updated_list = '\n'.join([
+            f"🔄 <{i['url']}|{i['key']}: {i['summary']}>" + (f" ({format_field_changes(i['changes'])})" if i.get('changes') else '')
+            for i in changed_issues.get('updated', [])
+        ])
+        
+        # 변경사항 요약 메시지 구성
+        change_summary = []
+        if changed_issues.get('added'):
+            change_summary.append(f"➕ 추가: {len(changed_issues['added'])}개")
+        if changed_issues.get('removed'):
+            change_summary.append(f"➖ 제거: {len(changed_issues['removed'])}개")
+        if changed_issues.get('updated'):
+            change_summary.append(f"🔄 갱신: {len(changed_issues['updated'])}개")
+        
+        # 전체 변경사항 목록
+        all_changes = []
+        if added_list:
+            all_changes.append(f"[추가된 티켓]\n{added_list}")
+        if removed_list:
+            all_changes.append(f"[제거된 티켓]\n{removed_list}")
+        if updated_list:
+            all_changes.append(f"[갱신된 티켓]\n{updated_list}")
+        
+        changes_text = '\n\n'.join(all_changes)
+        summary_text = ' | '.join(change_summary)
+        
+        # 테스트 모드가 아닌 경우에만 Slack 알림 전송
+        if not test_mode:
+            # 짧은 간격으로 이어지는 실행의 변경 알림은 주간 페이지별로 합쳐서 보냅니다.
+            send_slack(
+                f"{summary_text}\n\n{changes_text}",
+                header=f"📊 배포 일정 리포트가 업데이트되었습니다:\n{page_title}\n{page_url}",
+                coalesce_key=page_title
             )
-            print("✅ Confluence 페이지 생성 완료!")
-            page_id = confluence.get_page_id(space=confluence_space_key, title=page_title)
-            page_url = f"{atlassian_url}/wiki/spaces/{confluence_space_key}/pages/{page_id}"
-            
-            # 중복 알림 방지를 위한 변경사항 해시 확인
-            notified_changes = get_notified_changes()
-            change_hash = generate_change_hash(changed_issues, page_title)
-
-            # 변경사항이 있고, 아직 알림을 보내지 않은 경우에만 Slack 알림 전송
-            total_changes = len(changed_issues.get('added', [])) + len(changed_issues.get('removed', [])) + len(changed_issues.get('updated', []))
-            if total_changes > 0 and change_hash not in notified_changes:
-                # 변경 유형별로 메시지 구성
-                added_list = '\n'.join([
-                    f"➕ <{i['url']}|{i['key']}: {i['summary']}>" for i in changed_issues.get('added', [])
-                ])
-                removed_list = '\n'.join([
-                    f"➖ <{i['url']}|{i['key']}: {i['summary']}>" for i in changed_issues.get('removed', [])
-                ])
-                updated_list = '\n'.join([
-                    f"🔄 <{i['url']}|{i['key']}: {i['summary']}>" for i in changed_issues.get('updated', [])
-                ])
-                
-                # 변경사항 요약 메시지 구성
-                change_summary = []
-                if changed_issues.get('added'):
-                    change_summary.append(f"➕ 추가: {len(changed_issues['added'])}개")
-                if changed_issues.get('removed'):
-                    change_summary.append(f"➖ 제거: {len(changed_issues['removed'])}개")
-                if changed_issues.get('updated'):
-                    change_summary.append(f"🔄 갱신: {len(changed_issues['updated'])}개")
-                
-                # 전체 변경사항 목록
-                all_changes = []
-                if added_list:
-                    all_changes.append(f"[추가된 티켓]\n{added_list}")
-                if removed_list:
-                    all_changes.append(f"[제거된 티켓]\n{removed_list}")
-                if updated_list:
-                    all_changes.append(f"[갱신된 티켓]\n{updated_list}")
-                
-                changes_text = '\n\n'.join(all_changes)
-                summary_text = ' | '.join(change_summary)
-                
-                # 테스트 모드가 아닌 경우에만 Slack 알림 전송
-                if not test_mode:
-                    slack_msg = f"📊 배포 일정 리포트가 업데이트되었습니다:\n{page_title}\n{page_url}\n\n{summary_text}\n\n{changes_text}"
-                    send_slack(slack_msg)
-                    # 알림을 보낸 변경사항 해시를 저장
-                    notified_changes.add(change_hash)
-                    save_notified_changes(notified_changes)
-                    
-                    print(f"Slack 알림 전송 완료 (변경사항: {total_changes}개)")
-                else:
-                    print(f"🧪 테스트 모드: Slack 알림 전송 생략 (변경사항: {total_changes}개)")
-            elif total_changes > 0:
-                print(f"동일한 변경사항에 대한 알림이 이미 전송됨 (변경사항: {total_changes}개)")
-            else:
-                print("변경사항이 없어 Slack 알림을 전송하지 않습니다.")
+            # 알림을 보낸 변경사항 지문을 저장
+            NOTIFICATION_DEDUPE.add(page_title, change_hash)
+            NOTIFICATION_DEDUPE.save()
             
-            # 테스트 모드가 아닌 경우에만 새로운 배포 티켓 알림 전송
-            if not test_mode:
-                notify_new_deploy_tickets(issues, atlassian_url, page_title, deploy_message_enabled)
-            else:
-                print("🧪 테스트 모드: 새로운 배포 티켓 알림 전송 생략")
-            log(f"실행시간: {get_now_str()}\n대상: {', '.join([i['key'] for i in issues])} 생성.")
+            print(f"Slack 알림 대기열에 추가 (변경사항: {total_changes}개)")
+        else:
+            print(f"🧪 테스트 모드: Slack 알림 전송 생략 (변경사항: {total_changes}개)")
+    elif total_changes > 0:
+        print(f"동일한 변경사항에 대한 알림이 이미 전송됨 (변경사항: {total_changes}개)")
+    else:
+        print("변경사항이 없어 Slack 알림을 전송하지 않습니다.")
+
+def complete_publication(options, issues, page_id, action, changed_issues, curr_snapshot):
+    """게시 결과에 따라 Slack 알림, 실행 로그, 스냅샷과 캐시 저장을 처리합니다."""
+    page_title = options['page_title']
+    page_url = f"{options['atlassian_url']}/wiki/spaces/{options['confluence_space_key']}/pages/{page_id}"
+    if action == 'unchanged':
+        print(f"'{page_title}' 페이지 내용 변경 없음. 업데이트 생략.")
+        log(f"실행시간: {get_now_str()}\n업데이트 할 사항 없음.")
+    else:
+        notify_page_changes(changed_issues, page_title, page_url, options['test_mode'])
         
-        # 스냅샷 저장
-        write_json(SNAPSHOT_FILE_PATH, curr_snapshot)
-        print(f"✅ 스냅샷 저장 완료: {SNAPSHOT_FILE_PATH} ({len(curr_snapshot)}개 이슈)")
+        # 테스트 모드가 아닌 경우에만 새로운 배포 티켓 알림 전송
+        if not options['test_mode']:
+            notify_new_deploy_tickets(issues, options['atlassian_url'], page_title, options['deploy_message_enabled'])
+        else:
+            print("🧪 테스트 모드: 새로운 배포 티켓 알림 전송 생략")
+        action_text = '생성' if action == 'created' else '업데이트'
+        log(f"실행시간: {get_now_str()}\n대상: {', '.join([issue.key for issue in issues])} {action_text}.")
+    
+    # 스냅샷 저장
+    SNAPSHOT_HISTORY.save(options['start_date_str'], curr_snapshot)
+    print(f"✅ 스냅샷 저장 완료: {SNAPSHOT_HISTORY.path} ({len(curr_snapshot)}개 이슈)")
+    LINKED_TICKETS_CACHE.save()
+    ROW_RENDER_CACHE.save()
+    print(LINKED_TICKETS_CACHE.stats_text())
+    print(ROW_RENDER_CACHE.stats_text())
+    print(REQUEST_GOVERNOR.stats_text())
+    print(RUN_CACHE.stats_text())
+
+def run_weekly_report(jira, confluence, options):
+    """조회 → 변경 감지 → 본문 생성(연결 티켓 조회) → Confluence 게시 → 알림을 순서대로 실행합니다."""
+    issues = fetch_report_issues(jira, options)
+    curr_snapshot, changed_issues = detect_issue_changes(issues, options)
+    if changed_issues is None:
+        return
+    
+    # 7. Confluence 페이지 생성/업데이트 및 Slack 알림
+    page_content, child_pages = build_report_content(jira, issues, options)
+    try:
+        page_id, page_version = lookup_confluence_page(
+            confluence, options['confluence_space_key'], options['page_title'], options['parent_page_id']
+        )
+        page_id, action = publish_confluence_page(
+            confluence, options, page_content, page_id, page_version, options['parent_page_id']
+        )
+        if publish_child_pages(confluence, options, child_pages, page_id) and action == 'unchanged':
+            action = 'updated'
+        complete_publication(options, issues, page_id, action, changed_issues, curr_snapshot)
+    except Exception as e:
+        error_msg = f"Confluence 페이지 생성/업데이트 실패: {e}"
+        print(error_msg)
+        log(error_msg)
+        raise
+
+async def run_blocking(func, *args):
+    """블로킹 함수(동기 Jira/Confluence 클라이언트 호출)를 기본 스레드 풀에서 실행합니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+async def run_weekly_report_async(jira, confluence, options):
+    """
+    run_weekly_report와 같은 결과를 내는 asyncio 실행 엔진입니다 (--async).
+
+    서로 의존하지 않는 네트워크 호출을 동시에 실행합니다.
+    - 주간 티켓 조회와 함께 Confluence 페이지 조회를 시작합니다 (상위 페이지는 동기 엔진과 같이 options['parent_page_id'] 사용).
+    - 연결된 IT 티켓 조회(본문 생성)는 페이지 조회가 끝나기를 기다리지 않고 진행합니다.
+    """
+    space_key = options['confluence_space_key']
+    page_lookup = asyncio.ensure_future(run_blocking(
+        lookup_confluence_page, confluence, space_key, options['page_title'], options['parent_page_id']
+    ))
+    try:
+        issues = await run_blocking(fetch_report_issues, jira, options)
+        curr_snapshot, changed_issues = detect_issue_changes(issues, options)
+        if changed_issues is None:
+            return
         
+        (page_content, child_pages), (page_id, page_version) = await asyncio.gather(
+            run_blocking(build_report_content, jira, issues, options), page_lookup
+        )
+        page_id, action = await run_blocking(
+            publish_confluence_page, confluence, options, page_content, page_id, page_version, options['parent_page_id']
+        )
+        if await run_blocking(publish_child_pages, confluence, options, child_pages, page_id) and action == 'unchanged':
+            action = 'updated'
+        complete_publication(options, issues, page_id, action, changed_issues, curr_snapshot)
     except Exception as e:
         error_msg = f"Confluence 페이지 생성/업데이트 실패: {e}"
         print(error_msg)
         log(error_msg)
         raise
+    finally:
+        # 변경이 없어 결과를 사용하지 않은 조회 작업을 정리합니다.
+        if page_lookup.done() and not page_lookup.cancelled():
+            page_lookup.exception()
+        else:
+            page_lookup.cancel()
 
 def debug_issue_links(jira, issue_key):
     """특정 이슈의 모든 연결 관계를 디버깅합니다."""
@@ -1332,7 +3328,7 @@ def check_confluence_page_content():
         confluence_space_key = os.getenv('CONFLUENCE_SPACE_KEY', 'DEV')
         
         # Confluence 클라이언트 초기화
-        confluence = Confluence(url=atlassian_url, username=atlassian_username, password=atlassian_token, cloud=True)
+        confluence = create_confluence_client(atlassian_url, atlassian_username, atlassian_token)
         
         # 페이지 제목
         page_title = "7월 4째주: (07/21~07/27)"
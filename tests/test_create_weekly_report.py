@@ -4,8 +4,10 @@ import datetime
 import os
 import sys
 import json
+import io
 from unittest.mock import MagicMock, patch, Mock
 from freezegun import freeze_time
+from jira.client import ResultList
 from datetime import date, datetime, timedelta
 
 # 테스트 대상 함수 import
@@ -100,9 +102,10 @@ class TestJiraFunctions:
         )
         
         assert len(result) == 2
-        assert result[0]['key'] == 'IT-6813'
-        assert result[1]['key'] == 'IT-5332'
-        assert result[0]['fields']['summary'] == '신상스튜디오 상품관리 엑셀 다운로드 > 상태 컬럼 추가'
+        assert result[0].key == 'IT-6813'
+        assert result[1].key == 'IT-5332'
+        assert result[0].summary == '신상스튜디오 상품관리 엑셀 다운로드 > 상태 컬럼 추가'
+        assert result[0].status == '완료'
     
     def test_get_jira_issues_by_customfield_10817_exception(self):
         """배포 예정 티켓 조회 실패 테스트"""
@@ -115,6 +118,236 @@ class TestJiraFunctions:
         
         assert result == []
     
+    def test_build_deploy_date_jql(self):
+        """주간 범위가 JQL에 포함되는지 테스트 (KST 기준 주간 경계)"""
+        with patch.object(cwr, 'JIRA_JQL_UTC_OFFSET_HOURS', 9):
+            jql = cwr.build_deploy_date_jql('IT', '2025-07-21', '2025-07-27')
+        assert "project = 'IT'" in jql
+        assert 'cf[10817] >= "2025-07-21 00:00"' in jql
+        assert 'cf[10817] < "2025-07-28 00:00"' in jql
+        
+        # JQL 시간대가 UTC인 경우 KST 자정이 전날 15시로 변환되어야 함
+        with patch.object(cwr, 'JIRA_JQL_UTC_OFFSET_HOURS', 0):
+            jql = cwr.build_deploy_date_jql('IT', '2025-07-21', '2025-07-27')
+        assert 'cf[10817] >= "2025-07-20 15:00"' in jql
+        assert 'cf[10817] < "2025-07-27 15:00"' in jql
+    
+    def test_iter_search_pages_bounds_pages_in_flight(self):
+        """Server/DC에서 페이지 제너레이터가 소비 속도에 맞춰 최대 max_workers개 페이지만 미리 조회하는지 테스트"""
+        def search_issues(jql, fields=None, startAt=0, maxResults=50):
+            return ResultList([f'IT-{n}' for n in range(startAt, min(startAt + 100, 1000))], _total=1000)
+        
+        mock_jira = MagicMock(deploymentType='Server')
+        mock_jira.search_issues.side_effect = search_issues
+        
+        pages = cwr.iter_search_pages(mock_jira, 'project = IT', 'key', max_workers=2)
+        assert next(pages)[0] == 'IT-0'
+        assert mock_jira.search_issues.call_count == 1
+        assert next(pages)[0] == 'IT-100'
+        assert mock_jira.search_issues.call_count <= 3
+        
+        remaining = list(pages)
+        assert [page[0] for page in remaining] == [f'IT-{n}' for n in range(200, 1000, 100)]
+        assert mock_jira.search_issues.call_count == 10
+    
+    def test_get_jira_issues_by_customfield_10817_verify_filter(self):
+        """서버 측 필터링 검증 모드에서 불일치 보고 테스트"""
+        in_range = MagicMock()
+        in_range.key = 'IT-1'
+        in_range.fields.customfield_10817 = '2025-07-23T11:00:00.000+0900'
+        out_of_range = MagicMock()
+        out_of_range.key = 'IT-2'
+        out_of_range.fields.customfield_10817 = '2025-07-30T11:00:00.000+0900'
+        
+        mock_jira = MagicMock()
+        # 첫 번째 호출: 서버 측 필터링 결과, 두 번째 호출: 검증용 전체 조회
+        mock_jira.search_issues.side_effect = [[in_range, out_of_range], [in_range, out_of_range]]
+        
+        result = cwr.get_jira_issues_by_customfield_10817(
+            mock_jira, 'IT', '2025-07-21', '2025-07-27', verify_filter=True
+        )
+        assert len(result) == 2
+        assert mock_jira.search_issues.call_count == 2
+        
+        mismatch = cwr.verify_deploy_date_filter(
+            MagicMock(search_issues=MagicMock(return_value=[in_range, out_of_range])),
+            'IT', [in_range, out_of_range], '2025-07-21', '2025-07-27', 'key'
+        )
+        assert mismatch == {'missing': [], 'unexpected': ['IT-2']}
+    
+    def test_search_jira_issues_pages_cloud_by_token(self):
+        """Jira Cloud에서는 total(받은 개수)을 믿지 않고 nextPageToken이 없을 때까지 나머지 페이지를 조회하는지 테스트"""
+        keys = [f'IT-{n}' for n in range(2500)]
+        
+        def enhanced_search_issues(jql, nextPageToken=None, maxResults=50, fields=None):
+            # jira 3.10.5: 요청 한 번에 서버 페이지 크기(100)만큼만 받고, total은 len(page), isLast는 None
+            start = int(nextPageToken or 0)
+            end = min(start + 100, len(keys))
+            return ResultList(keys[start:end], _nextPageToken=str(end) if end < len(keys) else None)
+        
+        mock_jira = MagicMock(deploymentType='Cloud')
+        mock_jira.search_issues.side_effect = AssertionError('Cloud에서는 startAt 검색을 사용하지 않아야 함')
+        mock_jira.enhanced_search_issues.side_effect = enhanced_search_issues
+        
+        result = cwr.search_jira_issues(mock_jira, 'project = IT', 'key', use_pagination=True)
+        
+        assert result == keys
+        tokens = [call.kwargs['nextPageToken'] for call in mock_jira.enhanced_search_issues.call_args_list]
+        assert tokens == [None] + [str(n) for n in range(100, 2500, 100)]
+    
+    def test_search_pages_without_total_fetches_until_short_page(self):
+        """total이 없는 응답이 요청 크기만큼 꽉 차 있으면 짧은 페이지가 올 때까지 이어서 조회하는지 테스트"""
+        def search_issues(jql, fields=None, startAt=0, maxResults=50):
+            return [f'IT-{n}' for n in range(startAt, min(startAt + maxResults, 25))]
+        
+        mock_jira = MagicMock(deploymentType='Server')
+        mock_jira.search_issues.side_effect = search_issues
+        
+        with patch.object(cwr, 'JIRA_SEARCH_MAX_RESULTS', 10):
+            result = cwr.search_jira_issues(mock_jira, 'project = IT', 'key')
+        
+        assert result == [f'IT-{n}' for n in range(25)]
+        assert [call.kwargs['startAt'] for call in mock_jira.search_issues.call_args_list] == [0, 10, 20]
+    
+    def test_sync_issue_store_full_then_delta(self):
+        """로컬 이슈 저장소 전체/증분 동기화 테스트"""
+        def make_issue(key, deploy_date, updated):
+            issue = MagicMock()
+            issue.key = key
+            issue.fields.summary = f'{key} 요약'
+            issue.fields.status.name = '실행'
+            issue.fields.created = '2025-07-01T10:00:00.000+0900'
+            issue.fields.updated = updated
+            issue.fields.customfield_10817 = deploy_date
+            return issue
+        
+        mock_jira = MagicMock()
+        store = cwr.load_issue_store('nonexistent_store.json')
+        
+        # 첫 실행: 전체 동기화
+        mock_jira.search_issues.return_value = [
+            make_issue('IT-1', '2025-07-23T11:00:00.000+0900', '2025-07-20T10:00:00.000+0900'),
+            make_issue('IT-2', '2025-07-30T11:00:00.000+0900', '2025-07-20T10:00:00.000+0900'),
+        ]
+        cwr.sync_issue_store(mock_jira, 'IT', store)
+        assert 'IS NOT EMPTY' in mock_jira.search_issues.call_args[0][0]
+        assert set(store['issues']) == {'IT-1', 'IT-2'}
+        
+        # 두 번째 실행: updated 기준 증분 동기화 (IT-2 날짜 이동, IT-1 예정된 시작 값 제거)
+        mock_jira.search_issues.return_value = [
+            make_issue('IT-2', '2025-07-22T11:00:00.000+0900', '2025-07-21T10:00:00.000+0900'),
+            make_issue('IT-1', None, '2025-07-21T10:00:00.000+0900'),
+        ]
+        cwr.sync_issue_store(mock_jira, 'IT', store)
+        assert 'updated >=' in mock_jira.search_issues.call_args[0][0]
+        assert set(store['issues']) == {'IT-2'}
+        
+        selected = cwr.select_issues_from_store(store, '2025-07-21', '2025-07-27')
+        assert [issue.key for issue in selected] == ['IT-2']
+    
+    def test_sync_issue_store_does_not_replace_store_with_capped_full_sync(self, capsys):
+        """전체 동기화 결과가 검색 요청 크기의 배수(잘렸을 가능성)이면 저장소를 교체하지 않고 다음에 다시 시도하는지 테스트"""
+        def make_issue(key):
+            issue = MagicMock()
+            issue.key = key
+            issue.fields.customfield_10817 = '2025-07-23T11:00:00.000+0900'
+            return issue
+        
+        mock_jira = MagicMock(deploymentType='Server')
+        mock_jira.search_issues.return_value = ResultList([make_issue('IT-1'), make_issue('IT-2')], _total=2)
+        store = {'project': 'IT', 'high_water_mark': '2025-07-20T00:00:00+00:00', 'last_full_sync': None,
+                 'issues': {'IT-9': cwr.IssueRecord('IT-9', deploy_date='2025-07-24T11:00:00.000+0900')}}
+        
+        with patch.object(cwr, 'JIRA_SEARCH_MAX_RESULTS', 2):
+            cwr.sync_issue_store(mock_jira, 'IT', store)
+        
+        assert '결과가 잘렸을 수 있어' in capsys.readouterr().out
+        assert set(store['issues']) == {'IT-1', 'IT-2', 'IT-9'}
+        assert store['last_full_sync'] is None
+        assert store['high_water_mark'] == '2025-07-20T00:00:00+00:00'
+    
+    def test_verify_filter_applies_to_issue_store_results(self, tmp_path, monkeypatch):
+        """--delta-sync와 --verify-filter를 함께 쓰면 저장소에서 고른 결과를 검증하는지 테스트"""
+        monkeypatch.chdir(tmp_path)
+        issue = MagicMock()
+        issue.key = 'IT-1'
+        issue.fields.customfield_10817 = '2025-07-23T11:00:00.000+0900'
+        mock_jira = MagicMock(deploymentType='Server')
+        mock_jira.search_issues.return_value = [issue]
+        
+        with patch.object(cwr, 'verify_deploy_date_filter') as verify, patch.object(cwr, 'save_issue_store'):
+            result = cwr.fetch_jira_issues_by_customfield_10817(
+                mock_jira, 'IT', '2025-07-21', '2025-07-27', verify_filter=True, use_issue_store=True
+            )
+        
+        assert [record.key for record in result] == ['IT-1']
+        assert verify.call_args.args[2] == result
+    
+    def test_issue_record_conversions(self):
+        """Resource/딕셔너리가 같은 IssueRecord로 변환되고 저장 형식으로 왕복되는지 테스트"""
+        resource = MagicMock()
+        resource.key = 'IT-6813'
+        resource.fields.summary = '요약'
+        resource.fields.status.name = '완료'
+        resource.fields.assignee.displayName = '홍길동'
+        resource.fields.created = '2025-07-01T10:00:00.000+0900'
+        resource.fields.updated = '2025-07-20T10:00:00.000+0900'
+        resource.fields.customfield_10817 = '2025-07-23T11:00:00.000+0900'
+        resource.raw = {'fields': {'issuetype': {'name': '배포'}, 'issuelinks': []}}
+        rest_dict = {
+            'key': 'IT-6813',
+            'fields': {
+                'summary': '요약',
+                'status': {'name': '완료'},
+                'assignee': {'displayName': '홍길동'},
+                'issuetype': {'name': '배포'},
+                'issuelinks': [],
+                'created': '2025-07-01T10:00:00.000+0900',
+                'updated': '2025-07-20T10:00:00.000+0900',
+                'customfield_10817': '2025-07-23T11:00:00.000+0900'
+            }
+        }
+        
+        record = cwr.IssueRecord.from_jira(resource)
+        
+        assert record == cwr.IssueRecord.coerce(rest_dict)
+        assert cwr.IssueRecord.from_dict(record.to_dict()) == record
+        assert cwr.IssueRecord.coerce(record) is record
+        assert not hasattr(record, '__dict__')
+    
+    def test_deploy_date_column_window(self):
+        """예정된 시작 값 컬럼이 시간대를 KST로 맞춰 주간 범위로 분류하는지 테스트"""
+        values = [
+            '2025-07-23T11:00:00.000+0900',
+            '2025-07-20T16:30:00.000+0000',  # KST 2025-07-21 01:30
+            '2025-07-27T23:59:00.000+0900',
+            '2025-07-28T00:00:00.000+0900',
+            None,
+            'invalid',
+        ]
+        column = cwr.build_deploy_date_column(values)
+        
+        mask = cwr.deploy_date_window_mask(column, '2025-07-21', '2025-07-27')
+        assert mask.tolist() == [True, True, True, False, False, False]
+    
+    def test_run_cache_shares_weekly_search_within_run(self):
+        """실행 범위 캐시가 같은 조건의 주간 조회를 한 번만 실행하는지 테스트"""
+        mock_issue = MagicMock()
+        mock_issue.key = 'IT-6813'
+        mock_issue.fields.customfield_10817 = '2025-07-23T11:00:00.000+0900'
+        mock_jira = MagicMock()
+        mock_jira.search_issues.return_value = [mock_issue]
+        run_cache = cwr.RunScopedCache()
+        run_cache.enable()
+        
+        with patch.object(cwr, 'RUN_CACHE', run_cache):
+            first = cwr.get_jira_issues_by_customfield_10817(mock_jira, 'IT', '2025-07-21', '2025-07-27')
+            second = cwr.get_jira_issues_by_customfield_10817(mock_jira, ' it ', date(2025, 7, 21), '2025-07-27', use_pagination=True)
+        
+        assert first is second
+        assert mock_jira.search_issues.call_count == 1
+        assert (run_cache.misses, run_cache.hits) == (1, 1)
+    
     def test_get_linked_it_tickets_success(self):
         """연결된 IT 티켓 조회 성공 테스트"""
         mock_jira = MagicMock()
@@ -206,6 +439,118 @@ class TestJiraFunctions:
         assert len(result) == 1
         assert result[0]['key'] == 'IT-6818'
 
+    def test_resolve_linked_it_tickets_from_search_payload(self):
+        """검색 결과의 issuelinks로 연결된 IT 티켓을 추출하고 개별 조회하지 않는지 테스트"""
+        mock_jira = MagicMock()
+        issue = cwr.IssueRecord('IT-6813', issuelinks=[
+            {
+                'type': {'name': 'Deployments'},
+                'inwardIssue': {
+                    'key': 'IT-6818',
+                    'fields': {
+                        'summary': 'prod-studio-admin에 대한 배포 요청',
+                        'status': {'name': '완료'},
+                        'issuetype': {'name': '변경'}
+                    }
+                }
+            }
+        ])
+        
+        result = cwr.resolve_linked_it_tickets(mock_jira, issue)
+        
+        assert [ticket['key'] for ticket in result] == ['IT-6818']
+        mock_jira.issue.assert_not_called()
+        
+        # issuelinks가 검색 결과에 없으면 개별 조회로 대체
+        mock_jira.issue.return_value.raw = {'fields': {'issuelinks': issue.issuelinks}}
+        result = cwr.resolve_linked_it_tickets(mock_jira, cwr.IssueRecord('IT-6813'))
+        assert [ticket['key'] for ticket in result] == ['IT-6818']
+        mock_jira.issue.assert_called_once_with('IT-6813', expand='issuelinks')
+
+    def test_enrich_linked_it_tickets_keeps_order_and_isolates_retries(self):
+        """동시 조회 결과가 원래 순서를 유지하고, 티켓별 재시도가 독립적인지 테스트"""
+        attempts = {}
+        
+        def issue_side_effect(issue_key, expand=None):
+            attempts[issue_key] = attempts.get(issue_key, 0) + 1
+            if issue_key == 'IT-2':
+                raise Exception('API error')
+            return MagicMock(raw={'fields': {'issuelinks': [{
+                'type': {'name': 'Deployments'},
+                'inwardIssue': {
+                    'key': f'{issue_key}-DEPLOY',
+                    'fields': {'summary': '배포', 'status': {'name': '완료'}, 'issuetype': {'name': '변경'}}
+                }
+            }]}})
+        
+        mock_jira = MagicMock()
+        mock_jira.issue.side_effect = issue_side_effect
+        deploy_issues = [cwr.IssueRecord(f'IT-{n}') for n in range(1, 5)]
+        
+        with patch.object(cwr.time, 'sleep'):
+            result = cwr.enrich_linked_it_tickets(mock_jira, deploy_issues, max_workers=4)
+        
+        assert [[t['key'] for t in tickets] for tickets in result] == [
+            ['IT-1-DEPLOY'], [], ['IT-3-DEPLOY'], ['IT-4-DEPLOY']
+        ]
+        assert attempts['IT-2'] == 3
+        assert attempts['IT-1'] == 1
+
+    def test_linked_tickets_cache_invalidated_by_parent_updated(self, tmp_path):
+        """부모 티켓의 updated가 같으면 캐시를 사용하고, 바뀌면 다시 조회하는지 테스트"""
+        cache = cwr.LinkedTicketsCache(path=str(tmp_path / 'cache.json'))
+        mock_jira = MagicMock()
+        mock_jira.issue.return_value.raw = {'fields': {'issuelinks': []}}
+        issue = cwr.IssueRecord('IT-1', updated='2025-07-21T10:00:00.000+0900')
+        
+        with patch.object(cwr, 'LINKED_TICKETS_CACHE', cache):
+            cwr.resolve_linked_it_tickets(mock_jira, issue)
+            cwr.resolve_linked_it_tickets(mock_jira, issue)
+            assert mock_jira.issue.call_count == 1
+            
+            cwr.resolve_linked_it_tickets(mock_jira, cwr.IssueRecord('IT-1', updated='2025-07-22T10:00:00.000+0900'))
+            assert mock_jira.issue.call_count == 2
+        
+        assert (cache.hits, cache.misses) == (1, 2)
+        cache.save()
+        assert cwr.read_json(str(tmp_path / 'cache.json'))['IT-1']['updated'] == '2025-07-22T10:00:00.000+0900'
+    
+    def test_linked_tickets_cache_refreshes_linked_status(self, tmp_path):
+        """부모 티켓의 updated가 같아도 연결 티켓의 상태가 바뀌면 최신 상태를 반환하는지 테스트"""
+        cache = cwr.LinkedTicketsCache(path=str(tmp_path / 'cache.json'))
+        mock_jira = MagicMock()
+        mock_jira.issue.return_value.raw = {'fields': {'issuelinks': [
+            {'type': {'name': 'Deployments'}, 'outwardIssue': {'key': 'IT-9', 'fields': {
+                'summary': '연결 작업', 'status': {'name': '진행 중'}, 'issuetype': {'name': 'Task'}}}},
+        ]}}
+        issue = cwr.IssueRecord('IT-1', updated='2025-07-21T10:00:00.000+0900')
+        linked = MagicMock(key='IT-9')
+        linked.fields.summary = '연결 작업'
+        linked.fields.status.name = '완료'
+        
+        with patch.object(cwr, 'LINKED_TICKETS_CACHE', cache), \
+             patch.object(cwr, 'iter_search_issues', return_value=[linked]) as mock_search:
+            first = list(cwr.iter_linked_it_tickets(mock_jira, [issue]))
+            mock_search.assert_not_called()
+            second = list(cwr.iter_linked_it_tickets(mock_jira, [issue]))
+        
+        assert first[0][0]['status'] == '진행 중'
+        assert second[0][0]['status'] == '완료'
+        assert mock_jira.issue.call_count == 1
+        assert mock_search.call_args[0][1] == 'key in (IT-9)'
+    
+    def test_linked_tickets_cache_eviction(self, tmp_path):
+        """최대 개수와 보관 기간을 넘는 캐시 항목 제거 테스트"""
+        cache = cwr.LinkedTicketsCache(path=str(tmp_path / 'cache.json'), max_entries=2, max_age_days=1)
+        cache.entries = {
+            'IT-1': {'updated': 'u', 'tickets': [], 'cached_at': cwr.time.time() - 3 * 86400},
+            'IT-2': {'updated': 'u', 'tickets': [], 'cached_at': cwr.time.time() - 30},
+            'IT-3': {'updated': 'u', 'tickets': [], 'cached_at': cwr.time.time() - 20},
+            'IT-4': {'updated': 'u', 'tickets': [], 'cached_at': cwr.time.time() - 10},
+        }
+        cache.evict()
+        assert set(cache.entries) == {'IT-3', 'IT-4'}
+
 class TestConfluenceFunctions:
     """Confluence 관련 함수 테스트"""
     
@@ -263,6 +608,126 @@ class TestConfluenceFunctions:
         assert 'tr' in result
         assert 'td' in result
     
+    def test_row_render_cache_rerenders_only_changed_rows(self, tmp_path):
+        """행 지문이 같은 행은 재사용하고, 바뀐 행만 다시 생성하는지 테스트"""
+        cache = cwr.RowRenderCache(path=str(tmp_path / 'rows.json'))
+        linked = [{'key': 'IT-6818', 'status': '완료', 'summary': '배포 요청'}]
+        deploy_issues = [
+            cwr.IssueRecord(f'IT-{n}', summary=f'요약 {n}', status='실행', issuelinks=[]) for n in range(1, 4)
+        ]
+        
+        with patch.object(cwr, 'ROW_RENDER_CACHE', cache), \
+                patch.object(cwr, 'resolve_linked_it_tickets', return_value=linked):
+            first = cwr.create_deploy_links_html_table_with_issues(MagicMock(), deploy_issues, 'https://jira.example.com')
+            cache.save()
+            
+            reloaded = cwr.RowRenderCache(path=str(tmp_path / 'rows.json'))
+            deploy_issues[1].summary = '바뀐 요약'
+            with patch.object(cwr, 'ROW_RENDER_CACHE', reloaded), \
+                    patch.object(cwr, 'render_deploy_link_row', wraps=cwr.render_deploy_link_row) as render:
+                second = cwr.create_deploy_links_html_table_with_issues(MagicMock(), deploy_issues, 'https://jira.example.com')
+        
+        assert render.call_count == 1
+        assert render.call_args[0][0].key == 'IT-2'
+        assert (reloaded.hits, reloaded.misses) == (2, 1)
+        assert second == first.replace('요약 2', '바뀐 요약')
+    
+    def test_compact_rendering_uses_confluence_markup(self, tmp_path, capsys):
+        """간결 렌더링이 <style>/class 없이 기본 표와 상태 매크로를 쓰고, 크기 비교는 요청할 때만 기본 본문을 만드는지 테스트"""
+        linked = [{'key': 'IT-6818', 'status': '완료', 'summary': '배포 요청'}]
+        deploy_issues = [cwr.IssueRecord(f'IT-{n}', summary=f'요약 {n}', status='실행', issuelinks=[]) for n in range(1, 30)]
+        args = ('project = IT', deploy_issues, 'https://jira.example.com', MagicMock(), 'IT', '2025-07-21', '2025-07-27')
+        
+        with patch.object(cwr, 'ROW_RENDER_CACHE', cwr.RowRenderCache(path=str(tmp_path / 'rows.json'))), \
+                patch.object(cwr, 'LINKED_TICKETS_CACHE', cwr.LinkedTicketsCache(path=str(tmp_path / 'links.json'))), \
+                patch.object(cwr, 'get_jira_issues_by_customfield_10817', return_value=deploy_issues), \
+                patch.object(cwr, 'resolve_linked_it_tickets', return_value=linked) as resolve, \
+                patch.object(cwr, 'create_deploy_links_section', wraps=cwr.create_deploy_links_section) as section:
+            standard = cwr.create_confluence_content(*args)
+            section.reset_mock()
+            compact = cwr.create_confluence_content(*args, compact=True)
+            assert [c.kwargs.get('compact') for c in section.call_args_list] == [True]
+            assert '페이지 본문 크기' not in capsys.readouterr().out
+            
+            compared, _ = cwr.create_confluence_page_set(*args, compact=True, compare_size=True)
+        
+        status_macro = ('<ac:structured-macro ac:name="status"><ac:parameter ac:name="colour">Green</ac:parameter>'
+                        '<ac:parameter ac:name="title">완료</ac:parameter></ac:structured-macro>')
+        assert status_macro in compact
+        assert '<style>' not in compact and 'class=' not in compact
+        assert 'style="padding' not in compact
+        # 상태 매크로는 인라인 배지보다 길어 절반까지는 줄지 않지만, 인라인 스타일과 안내 문구만큼 작아야 함
+        assert len(compact.encode('utf-8')) < len(standard.encode('utf-8')) * 0.7
+        assert compared == compact
+        assert '페이지 본문 크기' in capsys.readouterr().out
+        assert resolve.call_count >= len(deploy_issues)
+    
+    def test_large_week_splits_into_child_pages(self, tmp_path):
+        """예산을 넘으면 배포 예정 표를 날짜별 하위 페이지로 나누고, 티켓이 추가되어도 다른 날짜의 페이지는 그대로인지 테스트"""
+        def make_issue(n, day):
+            deploy_date = f'2025-07-{day}T10:00:00.000+0900' if day else None
+            return cwr.IssueRecord(f'IT-{n}', summary=f'요약 {n}', status='실행', deploy_date=deploy_date, issuelinks=[])
+        deploy_issues = [make_issue(1, 22), make_issue(2, 22), make_issue(3, 23), make_issue(4, 23), make_issue(5, None)]
+        
+        with patch.object(cwr, 'ROW_RENDER_CACHE', cwr.RowRenderCache(path=str(tmp_path / 'rows.json'))), \
+                patch.object(cwr, 'resolve_linked_it_tickets', return_value=[]), \
+                patch.object(cwr, 'PAGE_SPLIT_MAX_ROWS', 3):
+            index_html, child_pages = cwr.create_deploy_links_section(
+                MagicMock(), deploy_issues, 'https://jira.example.com', page_title='7월 4째주'
+            )
+            # 07/23에 티켓 하나 추가 (맨 앞에 끼워 넣어도 다른 날짜의 하위 페이지는 바뀌지 않아야 함)
+            _, next_child_pages = cwr.create_deploy_links_section(
+                MagicMock(), [make_issue(6, 23)] + deploy_issues, 'https://jira.example.com', page_title='7월 4째주'
+            )
+            unsplit, no_children = cwr.create_deploy_links_section(MagicMock(), deploy_issues[:2], 'https://jira.example.com', page_title='7월 4째주')
+        
+        assert [title for title, _ in child_pages] == [f'7월 4째주 - 배포 예정 목록 {label}' for label in ('07/22', '07/23', '날짜 미정')]
+        assert ['browse/IT-5"' in body for _, body in child_pages] == [False, False, True]
+        assert index_html.count('<ac:link>') == 3
+        assert '>07/23</td>' in index_html
+        assert [title for title, _ in next_child_pages] == [title for title, _ in child_pages]
+        assert [a == b for (_, a), (_, b) in zip(child_pages, next_child_pages)] == [True, False, True]
+        assert no_children == [] and 'IT-2' in unsplit
+    
+    def test_split_rows_by_deploy_day_splits_large_day_by_key(self):
+        """하루치가 예산을 넘으면 키 기준의 고정된 조각으로 나누어 모든 조각이 예산 안에 드는지 테스트"""
+        deploy_issues = [cwr.IssueRecord(f'IT-{n}', deploy_date='2025-07-22T10:00:00.000+0900') for n in range(1, 8)]
+        rows = [issue.key for issue in deploy_issues]
+        
+        groups = cwr.split_rows_by_deploy_day(deploy_issues, rows, max_rows=3, max_bytes=0)
+        
+        assert sorted(row for _, _, chunk in groups for row in chunk) == sorted(rows)
+        assert all(len(chunk) <= 3 and day == '07/22' for _, day, chunk in groups)
+        parts = int(groups[0][0].rsplit('/', 1)[1].rstrip(')'))
+        assert all(label.startswith('07/22 (') and label.endswith(f'/{parts})') for label, _, _ in groups)
+        assert groups == cwr.split_rows_by_deploy_day(deploy_issues, rows, max_rows=3, max_bytes=0)
+        assert cwr.rows_fit_budget(['a' * 10] * 2, max_rows=0, max_bytes=25)
+        assert not cwr.rows_fit_budget(['a' * 10] * 3, max_rows=0, max_bytes=25)
+    
+    def test_static_issue_table_replaces_jira_macro(self, tmp_path):
+        """정적 표 모드에서 Jira 매크로 없이 조회한 티켓을 예정된 시작 순으로 표시하는지 테스트"""
+        deploy_issues = [
+            cwr.IssueRecord('IT-2', summary='<나중>', status='실행', assignee='홍길동', issue_type='변경',
+                            created='2025-07-01T10:00:00.000+0900', updated='2025-07-20T09:30:00.000+0900',
+                            deploy_date='2025-07-24T11:00:00.000+0900', issuelinks=[]),
+            cwr.IssueRecord('IT-1', summary='먼저', status='완료', issue_type='변경',
+                            deploy_date='2025-07-21T02:00:00.000+0000', issuelinks=[]),
+        ]
+        
+        with patch.object(cwr, 'ROW_RENDER_CACHE', cwr.RowRenderCache(path=str(tmp_path / 'rows.json'))), \
+                patch.object(cwr, 'LINKED_TICKETS_CACHE', cwr.LinkedTicketsCache(path=str(tmp_path / 'links.json'))), \
+                patch.object(cwr, 'get_jira_issues_by_customfield_10817', return_value=deploy_issues):
+            content = cwr.create_confluence_content(
+                'project = IT', deploy_issues, 'https://jira.example.com', MagicMock(), 'IT',
+                '2025-07-21', '2025-07-27', static_table=True
+            )
+        
+        assert 'ac:name="jira"' not in content
+        assert '검색된 이슈가 없습니다' not in content
+        assert content.index('>IT-1</a>') < content.index('>IT-2</a>')
+        assert '2025-07-21 11:00' in content  # UTC 값은 KST로 표시
+        assert '&lt;나중&gt;' in content
+    
     def test_get_status_style(self):
         """상태별 CSS 스타일 테스트"""
         # 완료 상태
@@ -285,6 +750,106 @@ class TestConfluenceFunctions:
         assert 'background-color: #D3D3D3' in style
         assert 'color: #2F4F4F' in style
 
+class TestRequestGovernor:
+    """요청 제어(rate limit / 재시도) 테스트"""
+    
+    def make_response(self, status_code, headers=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        return response
+    
+    def test_retry_after_header_is_respected(self):
+        """429 응답의 Retry-After 값만큼 기다린 뒤 재시도하는지 테스트"""
+        sleeps = []
+        governor = cwr.RequestGovernor(rate=1000, burst=1000, sleep=sleeps.append)
+        responses = [self.make_response(429, {'Retry-After': '7'}), self.make_response(200)]
+        
+        result = governor.execute('test.atlassian.net', lambda: responses.pop(0))
+        
+        assert result.status_code == 200
+        assert sleeps == [7.0]
+        assert governor.throttled == 1
+    
+    def test_retry_budget_limits_total_retries(self):
+        """실행당 재시도 예산을 모두 쓰면 더 이상 재시도하지 않는지 테스트"""
+        governor = cwr.RequestGovernor(rate=1000, burst=1000, retry_budget=2, sleep=lambda _: None)
+        send = MagicMock(return_value=self.make_response(503))
+        
+        result = governor.execute('test.atlassian.net', send)
+        
+        assert result.status_code == 503
+        assert send.call_count == 3
+        assert governor.retries == 2
+    
+    def test_post_is_not_retried_after_server_may_have_received_it(self):
+        """POST는 읽기 timeout/5xx에서 재시도하지 않고, 429와 연결 단계 오류만 재시도하는지 테스트"""
+        governor = cwr.RequestGovernor(rate=1000, burst=1000, sleep=lambda _: None)
+        
+        read_timeout = MagicMock(side_effect=cwr.requests.exceptions.ReadTimeout('read timed out'))
+        with pytest.raises(cwr.requests.exceptions.ReadTimeout):
+            governor.execute('hooks.slack.com', read_timeout, method='POST')
+        assert read_timeout.call_count == 1
+        
+        send = MagicMock(return_value=self.make_response(503))
+        assert governor.execute('hooks.slack.com', send, method='POST').status_code == 503
+        assert send.call_count == 1
+        
+        refused = cwr.requests.exceptions.ConnectionError(MagicMock(reason=cwr.NewConnectionError(None, 'refused')))
+        responses = [refused, self.make_response(429), self.make_response(200)]
+        
+        def send_post():
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        
+        assert governor.execute('hooks.slack.com', send_post, method='POST').status_code == 200
+        
+        # 멱등 요청(GET)은 읽기 timeout도 재시도
+        get = MagicMock(side_effect=[cwr.requests.exceptions.ReadTimeout('read timed out'), self.make_response(200)])
+        assert governor.execute('test.atlassian.net', get, method='GET').status_code == 200
+    
+    def test_token_bucket_waits_when_empty(self):
+        """토큰이 없으면 다음 토큰이 생길 때까지 기다리는지 테스트"""
+        now = [0.0]
+        sleeps = []
+        
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+        
+        governor = cwr.RequestGovernor(rate=2, burst=1, sleep=sleep, clock=lambda: now[0])
+        governor.acquire('host')
+        governor.acquire('host')
+        
+        assert sleeps == [pytest.approx(0.5)]
+
+class TestHttpSession:
+    """공유 HTTP 세션 테스트"""
+    
+    def test_sessions_share_one_connection_pool(self):
+        """여러 세션이 같은 연결 풀 어댑터를 사용하는지 테스트"""
+        session1 = cwr.create_http_session()
+        session2 = cwr.create_http_session()
+        
+        adapter = session1.get_adapter('https://test.atlassian.net')
+        assert isinstance(adapter, cwr.GovernedHTTPAdapter)
+        assert adapter is session2.get_adapter('https://hooks.slack.com')
+    
+    def test_adapter_applies_explicit_timeouts(self):
+        """timeout이 없는 요청에 연결/읽기 timeout이 적용되는지 테스트"""
+        adapter = cwr.GovernedHTTPAdapter(governor=MagicMock(), connect_timeout=3, read_timeout=30)
+        request = MagicMock(url='https://test.atlassian.net/rest/api/2/search')
+        
+        with patch.object(cwr.HTTPAdapter, 'send') as mock_send:
+            adapter.governor.execute.side_effect = lambda host, send, method: send()
+            adapter.send(request, timeout=None)
+            assert mock_send.call_args.kwargs['timeout'] == (3, 30)
+            
+            adapter.send(request, timeout=75)
+            assert mock_send.call_args.kwargs['timeout'] == (3, 75)
+
 class TestSnapshotFunctions:
     """스냅샷 관련 함수 테스트"""
     
@@ -311,6 +876,40 @@ class TestSnapshotFunctions:
         assert result[0]['assignee'] == '홍길동'
         assert result[0]['customfield_10817'] == '2025-07-23T11:00:00.000+0900'
     
+    def test_snapshot_history_records_only_changes(self, tmp_path):
+        """스냅샷 이력이 바뀐 티켓만 새 행으로 기록하고, 지난 시점의 스냅샷을 그대로 조회하는지 테스트"""
+        history = cwr.SnapshotHistory(path=str(tmp_path / 'history.sqlite3'))
+        first = [
+            {'key': f'IT-{n}', 'summary': f'요약 {n}', 'status': '실행', 'assignee': '홍길동', 'customfield_10817': '2025-07-23'}
+            for n in range(1, 4)
+        ]
+        second = [dict(first[2]), dict(first[0], status='완료')]  # IT-2 제거, IT-1 상태 변경, 순서 변경
+        
+        assert history.load('2025-07-21') is None
+        history.save('2025-07-21', first, run_at='2025-07-21T01:00:00')
+        history.save('2025-07-21', second, run_at='2025-07-22T01:00:00')
+        history.save('2025-07-28', first, run_at='2025-07-22T02:00:00')
+        
+        assert history.load('2025-07-21') == second
+        assert history.load('2025-07-21', at='2025-07-21T12:00:00') == first  # 과거 시점은 키 순
+        assert history.load('2025-07-21', at='2025-07-20T00:00:00') is None
+        assert history.runs('2025-07-21') == ['2025-07-21T01:00:00', '2025-07-22T01:00:00']
+        
+        versions = history._connect().execute("SELECT COUNT(*) FROM issue_versions WHERE week = '2025-07-21'").fetchone()[0]
+        assert versions == 4  # 처음 3행 + IT-1 변경 1행
+        history.close()
+    
+    def test_previous_snapshot_falls_back_to_legacy_file(self, tmp_path):
+        """이력이 없는 주간은 기존 스냅샷 파일을 비교 기준으로 사용하는지 테스트"""
+        legacy = [{'key': 'IT-1', 'summary': '요약', 'status': '실행', 'assignee': '', 'customfield_10817': ''}]
+        cwr.write_json(str(tmp_path / 'legacy.json'), legacy)
+        options = {'start_date_str': '2025-07-21', 'snapshot_file_path': str(tmp_path / 'legacy.json')}
+        
+        with patch.object(cwr, 'SNAPSHOT_HISTORY', cwr.SnapshotHistory(path=str(tmp_path / 'history.sqlite3'))) as history:
+            assert cwr.load_previous_snapshot(options) == legacy
+            history.save('2025-07-21', [])
+            assert cwr.load_previous_snapshot(options) == []
+    
     def test_issues_changed(self):
         """이슈 변경 감지 테스트"""
         prev = [{'key': 'IT-1', 'summary': 'Test 1'}]
@@ -322,16 +921,22 @@ class TestSnapshotFunctions:
         # 변경 있음
         curr = [{'key': 'IT-1', 'summary': 'Test 2'}]
         assert cwr.issues_changed(prev, curr)
+        
+        # 순서만 바뀐 경우는 변경 아님
+        prev = [{'key': 'IT-1', 'summary': 'Test 1'}, {'key': 'IT-2', 'summary': 'Test 2'}]
+        assert not cwr.issues_changed(prev, list(reversed(prev)))
     
     def test_get_changed_issues(self):
         """변경된 이슈 감지 테스트"""
         prev = [
-            {'key': 'IT-1', 'summary': 'Test 1', 'deploy_date': '2025-07-21'},
-            {'key': 'IT-2', 'summary': 'Test 2', 'deploy_date': '2025-07-22'}
+            {'key': 'IT-1', 'summary': 'Test 1', 'customfield_10817': '2025-07-21T11:00:00.000+0900'},
+            {'key': 'IT-2', 'summary': 'Test 2', 'customfield_10817': '2025-07-22T11:00:00.000+0900'},
+            {'key': 'IT-4', 'summary': 'Test 4', 'customfield_10817': '2025-07-22T11:00:00.000+0900'}
         ]
         curr = [
-            {'key': 'IT-1', 'summary': 'Test 1 Updated', 'deploy_date': '2025-07-21'},
-            {'key': 'IT-3', 'summary': 'Test 3', 'deploy_date': '2025-07-23'}
+            {'key': 'IT-4', 'summary': 'Test 4', 'customfield_10817': '2025-07-24T11:00:00.000+0900'},
+            {'key': 'IT-1', 'summary': 'Test 1 Updated', 'customfield_10817': '2025-07-21T11:00:00.000+0900'},
+            {'key': 'IT-3', 'summary': 'Test 3', 'customfield_10817': '2025-07-23T11:00:00.000+0900'}
         ]
         
         result = cwr.get_changed_issues(prev, curr, 'https://jira.example.com')
@@ -344,53 +949,70 @@ class TestSnapshotFunctions:
         assert len(result['removed']) == 1
         assert result['removed'][0]['key'] == 'IT-2'
         
-        # 업데이트된 티켓 (deploy_date가 변경되지 않았으므로 없음)
-        assert len(result['updated']) == 0
+        # 업데이트된 티켓: 요약 변경(IT-1)과 배포 예정일 변경(IT-4)을 필드별로 구분
+        changes = {item['key']: item['changes'] for item in result['updated']}
+        assert changes == {
+            'IT-4': {'deploy_date': ('2025-07-22T11:00:00.000+0900', '2025-07-24T11:00:00.000+0900')},
+            'IT-1': {'summary': ('Test 1', 'Test 1 Updated')},
+        }
+        assert cwr.format_field_changes(changes['IT-4']) == '배포 예정일 2025-07-22 11:00 → 2025-07-24 11:00'
 
 class TestNotificationFunctions:
     """알림 관련 함수 테스트"""
     
-    def test_get_notified_deploy_keys(self):
-        """알림 전송된 배포 키 조회 테스트"""
-        # 파일이 없는 경우
-        with patch('builtins.open', side_effect=FileNotFoundError):
-            keys = cwr.get_notified_deploy_keys()
-            assert keys == set()
+    def test_notification_dedupe_store_partitions_by_week(self, tmp_path):
+        """중복 알림 저장소가 주간별로 지문을 저장하고 다시 불러오는지 테스트"""
+        path = str(tmp_path / 'dedupe.json')
+        store = cwr.NotificationDedupeStore(path=path, legacy_deploy_keys_path=str(tmp_path / 'none.json'))
+        digest = cwr.notification_digest('deploy', 'IT-6813')
         
-        # 파일이 있는 경우
-        test_data = ['IT-6813', 'IT-5332']
-        with patch('builtins.open', mock_open(read_data=json.dumps(test_data))):
-            keys = cwr.get_notified_deploy_keys()
-            assert keys == {'IT-6813', 'IT-5332'}
+        assert len(digest) == 64
+        assert not store.contains('7월 4째주', digest)
+        store.add('7월 4째주', digest)
+        store.save()
+        
+        reloaded = cwr.NotificationDedupeStore(path=path)
+        assert reloaded.contains('7월 4째주', digest)
+        assert not reloaded.contains('8월 1째주', digest)
     
-    def test_save_notified_deploy_keys(self):
-        """알림 전송된 배포 키 저장 테스트"""
-        test_keys = {'IT-6813', 'IT-5332'}
+    def test_notification_dedupe_store_expires_and_compacts(self, tmp_path):
+        """만료된 지문은 중복으로 보지 않고, 저장 시 빈 주간과 함께 정리되는지 테스트"""
+        path = str(tmp_path / 'dedupe.json')
+        store = cwr.NotificationDedupeStore(path=path, ttl_days=1, legacy_deploy_keys_path=str(tmp_path / 'none.json'))
+        now = cwr.time.time()
+        store.add('지난 주', 'old', now=now - 2 * 86400)
+        store.add('이번 주', 'new', now=now)
         
-        with patch('builtins.open', mock_open()) as mock_file:
-            cwr.save_notified_deploy_keys(test_keys)
-            mock_file.assert_called_once()
+        assert not store.contains('지난 주', 'old')
+        store.save()
+        assert cwr.read_json(path) == {'partitions': {'이번 주': {'new': now + 86400}}}
     
-    def test_get_notified_changes(self):
-        """알림 전송된 변경사항 조회 테스트"""
-        # 파일이 없는 경우
-        with patch('builtins.open', side_effect=FileNotFoundError):
-            changes = cwr.get_notified_changes()
-            assert changes == set()
+    def test_notification_dedupe_store_merges_concurrent_saves(self, tmp_path):
+        """동시에 실행된 두 저장소가 저장할 때 서로의 주간 기록을 덮어쓰지 않는지 테스트"""
+        path = str(tmp_path / 'dedupe.json')
+        legacy_path = str(tmp_path / 'none.json')
+        create_run = cwr.NotificationDedupeStore(path=path, legacy_deploy_keys_path=legacy_path)
+        update_run = cwr.NotificationDedupeStore(path=path, legacy_deploy_keys_path=legacy_path)
+        create_run.contains('다음 주', 'a')
+        update_run.contains('이번 주', 'b')
         
-        # 파일이 있는 경우
-        test_data = ['hash1', 'hash2']
-        with patch('builtins.open', mock_open(read_data=json.dumps(test_data))):
-            changes = cwr.get_notified_changes()
-            assert changes == {'hash1', 'hash2'}
+        create_run.add('다음 주', 'a')
+        update_run.add('이번 주', 'b')
+        create_run.save()
+        update_run.save()
+        
+        reloaded = cwr.NotificationDedupeStore(path=path, legacy_deploy_keys_path=legacy_path)
+        assert reloaded.contains('다음 주', 'a')
+        assert reloaded.contains('이번 주', 'b')
     
-    def test_save_notified_changes(self):
-        """알림 전송된 변경사항 저장 테스트"""
-        test_changes = {'hash1', 'hash2'}
+    def test_notification_dedupe_store_imports_legacy_files(self, tmp_path):
+        """저장소 파일이 없으면 기존 notified_deploy_keys.json 기록을 옮겨 와 다시 알리지 않는지 테스트"""
+        cwr.write_json(str(tmp_path / 'keys.json'), ['IT-5332'])
+        store = cwr.NotificationDedupeStore(path=str(tmp_path / 'dedupe.json'),
+                                            legacy_deploy_keys_path=str(tmp_path / 'keys.json'))
         
-        with patch('builtins.open', mock_open()) as mock_file:
-            cwr.save_notified_changes(test_changes)
-            mock_file.assert_called_once()
+        assert store.contains('아무 주간', cwr.notification_digest('deploy', 'IT-5332'))
+        assert not store.contains('아무 주간', cwr.notification_digest('deploy', 'IT-6813'))
     
     def test_generate_change_hash(self):
         """변경사항 해시 생성 테스트"""
@@ -403,33 +1025,113 @@ class TestNotificationFunctions:
         
         hash_result = cwr.generate_change_hash(changed_issues, page_title)
         
-        assert isinstance(hash_result, str)
-        assert 'IT-6813' in hash_result
-        assert 'IT-5332' in hash_result
-        assert page_title in hash_result
+        assert len(hash_result) == 64
+        assert hash_result == cwr.generate_change_hash(changed_issues, page_title)
+        assert hash_result != cwr.generate_change_hash(changed_issues, "8월 1째주: (07/28~08/03)")
     
-    @patch('requests.post')
-    def test_send_slack_success(self, mock_post):
-        """Slack 알림 전송 성공 테스트"""
+    @patch('create_weekly_report.get_http_session')
+    def test_send_slack_success(self, mock_get_session, tmp_path):
+        """Slack 알림 전송 성공 테스트 (대기열에 넣고 백그라운드에서 제한 시간을 두고 전송)"""
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_post = mock_get_session.return_value.post
         mock_post.return_value = mock_response
+        outbox = cwr.SlackOutbox(path=str(tmp_path / 'outbox.json'))
         
-        with patch.dict(os.environ, {'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test'}):
+        with patch.dict(os.environ, {'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test'}), \
+                patch.object(cwr, 'SLACK_OUTBOX', outbox), \
+                patch.object(cwr.SlackOutbox, 'is_quiet_hour', return_value=False):
             cwr.send_slack('Test message')
-            mock_post.assert_called_once()
+            outbox.wait()
+        
+        mock_post.assert_called_once()
+        assert mock_post.call_args.kwargs['timeout'] == cwr.SLACK_POST_TIMEOUT_SECONDS
+        assert outbox.pending() == []
     
-    @patch('requests.post')
-    def test_send_slack_failure(self, mock_post):
-        """Slack 알림 전송 실패 테스트"""
+    @patch('create_weekly_report.get_http_session')
+    def test_send_slack_failure(self, mock_get_session, tmp_path):
+        """Slack 알림 전송 실패 테스트 (예외 없이 대기열에 남겨 다음에 다시 전송)"""
         mock_response = MagicMock()
         mock_response.status_code = 400
         mock_response.text = 'Bad Request'
-        mock_post.return_value = mock_response
+        mock_get_session.return_value.post.return_value = mock_response
+        outbox = cwr.SlackOutbox(path=str(tmp_path / 'outbox.json'))
         
-        with patch.dict(os.environ, {'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test'}):
+        with patch.dict(os.environ, {'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test'}), \
+                patch.object(cwr, 'SLACK_OUTBOX', outbox), \
+                patch.object(cwr.SlackOutbox, 'is_quiet_hour', return_value=False):
             cwr.send_slack('Test message')
-            # 실패해도 예외가 발생하지 않아야 함
+            outbox.wait()
+        
+        assert [message['attempts'] for message in outbox.pending()] == [1]
+    
+    @patch('create_weekly_report.get_http_session')
+    def test_slack_outbox_defers_quiet_hours_and_coalesces(self, mock_get_session, tmp_path):
+        """알림 시간 외의 메시지는 보류했다가 보내고, 같은 주간의 변경 알림은 하나로 합치는지 테스트"""
+        mock_post = mock_get_session.return_value.post
+        mock_post.return_value.status_code = 200
+        outbox = cwr.SlackOutbox(path=str(tmp_path / 'outbox.json'))
+        night = datetime(2025, 7, 22, 22, 0).timestamp()
+        morning = datetime(2025, 7, 23, 10, 0).timestamp()
+        
+        with patch.dict(os.environ, {'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test'}):
+            assert not outbox.enqueue('➕ 추가: 1개', header='7월 4째주', coalesce_key='7월 4째주', now=night)
+            assert outbox.enqueue('🔄 갱신: 1개', header='7월 4째주', coalesce_key='7월 4째주', now=night + 300)
+            outbox.enqueue('승인 요청', now=night)
+            
+            assert outbox.flush(now=night + 3600) == 0
+            mock_post.assert_not_called()
+            
+            assert outbox.flush(now=morning) == 2
+        
+        texts = [call.kwargs['json']['text'] for call in mock_post.call_args_list]
+        assert texts[0] == '7월 4째주\n\n[22:00] ➕ 추가: 1개\n\n[22:05] 🔄 갱신: 1개'
+        assert texts[1] == '승인 요청'
+        assert outbox.pending() == []
+
+    @patch('create_weekly_report.get_http_session')
+    def test_slack_outbox_sends_change_notice_in_same_run(self, mock_get_session, tmp_path):
+        """알림 시간 안의 변경 알림은 기다리지 않고 바로 보내고, 실패해 대기 중인 알림에만 다음 알림을 합치는지 테스트"""
+        mock_post = mock_get_session.return_value.post
+        mock_post.return_value.status_code = 200
+        outbox = cwr.SlackOutbox(path=str(tmp_path / 'outbox.json'))
+        evening = datetime(2025, 7, 23, 20, 45).timestamp()
+        
+        with patch.dict(os.environ, {'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test'}):
+            assert not outbox.enqueue('➕ 추가: 1개', header='7월 4째주', coalesce_key='7월 4째주', now=evening)
+            assert outbox.flush(now=evening) == 1
+            
+            mock_post.return_value.status_code = 500
+            outbox.enqueue('🔄 갱신: 1개', header='7월 4째주', coalesce_key='7월 4째주', now=evening + 60)
+            assert outbox.flush(now=evening + 60) == 0
+            assert outbox.enqueue('➖ 삭제: 1개', header='7월 4째주', coalesce_key='7월 4째주', now=evening + 120)
+        
+        assert mock_post.call_args_list[0].kwargs['json']['text'] == '7월 4째주\n\n➕ 추가: 1개'
+        assert [len(message['parts']) for message in outbox.pending()] == [2]
+
+    @patch('create_weekly_report.get_http_session')
+    def test_slack_outbox_posts_without_holding_lock(self, mock_get_session, tmp_path):
+        """전송 중에도 대기열에 넣을 수 있고, 보낸 메시지는 다음 전송 전에 바로 기록되는지 테스트"""
+        outbox = cwr.SlackOutbox(path=str(tmp_path / 'outbox.json'))
+        morning = datetime(2025, 7, 23, 10, 0).timestamp()
+        outbox.enqueue('첫 번째', now=morning)
+        outbox.enqueue('두 번째', now=morning)
+        seen = []
+        
+        def post(url, json, timeout):
+            # 잠금을 잡고 전송하면 여기서 멈춥니다.
+            if not seen:
+                outbox.enqueue('전송 중 추가', now=morning)
+            seen.append([message['parts'][0]['text'] for message in outbox.pending()])
+            return MagicMock(status_code=200)
+        
+        mock_get_session.return_value.post.side_effect = post
+        with patch.dict(os.environ, {'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test'}):
+            assert outbox.flush(now=morning) == 3
+        
+        assert seen[0] == ['첫 번째', '두 번째', '전송 중 추가']
+        assert seen[1] == ['두 번째', '전송 중 추가']  # 첫 번째 메시지는 보낸 직후 기록됨
+        assert outbox.pending() == []
 
 class TestFileOperations:
     """파일 작업 관련 함수 테스트"""
@@ -448,21 +1150,234 @@ class TestFileOperations:
             result = cwr.read_json('nonexistent.json', default={'default': 'value'})
             assert result == {'default': 'value'}
     
-    def test_write_json(self):
-        """JSON 파일 쓰기 테스트"""
+    def test_write_json(self, tmp_path):
+        """JSON 파일 쓰기 테스트 (임시 파일에 쓴 뒤 교체하여 임시 파일이 남지 않음)"""
         test_data = {'key': 'value'}
+        path = tmp_path / 'test.json'
+        path.write_text('{"key": "old"}', encoding='utf-8')
         
-        with patch('builtins.open', mock_open()) as mock_file:
-            cwr.write_json('test.json', test_data)
-            mock_file.assert_called_once()
+        with patch.object(cwr.os, 'replace', wraps=cwr.os.replace) as replace:
+            cwr.write_json(str(path), test_data)
+        
+        replace.assert_called_once()
+        assert cwr.read_json(str(path)) == test_data
+        assert [p.name for p in tmp_path.iterdir()] == ['test.json']
+    
+    def test_atomic_write_keeps_old_file_on_failure(self, tmp_path):
+        """쓰기 도중 실패하면 기존 파일을 그대로 두고 임시 파일을 지우는지 테스트"""
+        path = tmp_path / 'state.json'
+        cwr.write_json(str(path), {'key': 'old'})
+        
+        with pytest.raises(TypeError):
+            cwr.write_json(str(path), {'key': object()})
+        
+        assert cwr.read_json(str(path)) == {'key': 'old'}
+        assert [p.name for p in tmp_path.iterdir()] == ['state.json']
+    
+    def test_report_run_lock_serializes_runs(self, tmp_path):
+        """실행 잠금은 하나만 얻을 수 있고, 기다린 실행만 같은 주간·모드의 최근 실행을 재사용하는지 테스트"""
+        lock_path = str(tmp_path / 'run.lock')
+        state_path = str(tmp_path / 'runs.json')
+        
+        with cwr.ReportRunLock(path=lock_path):
+            with patch.object(cwr, 'RUN_LOCK_POLL_SECONDS', 0.01):
+                waiting = cwr.ReportRunLock(timeout=0.05, path=lock_path)
+                with pytest.raises(TimeoutError):
+                    waiting.acquire()
+            cwr.mark_run_completed('2025-07-21', 'update', path=state_path)
+        
+        with cwr.ReportRunLock(timeout=0.05, path=lock_path) as lock:
+            assert lock.waited == 0
+            # 기다리지 않고 시작한 실행은 최근 실행이 있어도 진행
+            assert not cwr.should_reuse_recent_run(lock, '2025-07-21', 'update', False, path=state_path)
+        
+        assert waiting.waited > 0
+        assert cwr.should_reuse_recent_run(waiting, '2025-07-21', 'update', False, path=state_path)
+        assert not cwr.should_reuse_recent_run(waiting, '2025-07-21', 'current', False, path=state_path)
+        assert not cwr.should_reuse_recent_run(waiting, '2025-07-28', 'update', False, path=state_path)
+        assert not cwr.should_reuse_recent_run(waiting, '2025-07-21', 'update', True, path=state_path)
+        
+        finished_at = cwr.read_json(state_path)['2025-07-21']['update']
+        assert cwr.get_recent_run('2025-07-21', 'update', now=finished_at + cwr.RUN_REUSE_SECONDS, path=state_path) is None
     
-    def test_log(self):
-        """로그 작성 테스트"""
-        test_message = "Test log message"
+    def test_log(self, tmp_path):
+        """로그 작성 테스트 (cron.log를 한 번만 열고 이어서 기록)"""
+        log_path = tmp_path / 'cron.log'
+        for handler in list(cwr.cron_logger.handlers):
+            cwr.cron_logger.removeHandler(handler)
         
-        with patch('builtins.open', mock_open()) as mock_file:
-            cwr.log(test_message)
-            mock_file.assert_called_once_with('cron.log', 'a', encoding='utf-8')
+        try:
+            with patch.object(cwr, 'CRON_LOG_FILE_PATH', str(log_path)):
+                cwr.log("Test log message")
+                cwr.log("Second message")
+            assert len(cwr.cron_logger.handlers) == 1
+        finally:
+            for handler in list(cwr.cron_logger.handlers):
+                cwr.cron_logger.removeHandler(handler)
+                handler.close()
+        
+        assert log_path.read_text(encoding='utf-8') == "Test log message\nSecond message\n"
+    
+    def test_debug_logs_are_lazy_and_off_by_default(self):
+        """티켓별 상세 로그가 기본(INFO)에서는 출력되지 않고 --verbose(DEBUG)에서만 출력되는지 테스트"""
+        links = [{
+            'type': {'name': 'Deployments'},
+            'inwardIssue': {'key': 'IT-6818', 'fields': {'summary': '배포', 'status': {'name': '완료'}, 'issuetype': {'name': '변경'}}}
+        }]
+        stream = io.StringIO()
+        try:
+            cwr.configure_logging('INFO', stream)
+            cwr.extract_linked_it_tickets(links)
+            assert stream.getvalue() == ''
+            
+            cwr.configure_logging('DEBUG', stream)
+            cwr.extract_linked_it_tickets(links)
+            assert 'IT-6818' in stream.getvalue()
+        finally:
+            cwr.configure_logging('WARNING')
+
+class TestReportPipeline:
+    """동기/asyncio 실행 엔진 테스트"""
+    
+    def make_options(self, tmp_path):
+        return {
+            'mode': 'current', 'mode_desc': '이번 주', 'force_update': False,
+            'use_pagination': False, 'verify_filter': False, 'use_issue_store': False, 'compact': False,
+            'static_table': False, 'compare_size': False,
+            'test_mode': True, 'deploy_message_enabled': False,
+            'atlassian_url': 'https://test.atlassian.net', 'jira_project_key': 'IT',
+            'confluence_space_key': 'DEV', 'parent_page_id': '4596203549',
+            'start_date_str': '2025-07-21', 'end_date_str': '2025-07-27',
+            'page_title': '7월 4째주: (07/21~07/27)', 'jql_query': 'project = IT',
+            'snapshot_file_path': str(tmp_path / 'snapshot.json'),
+        }
+    
+    def run_engine(self, tmp_path, monkeypatch, use_async):
+        monkeypatch.chdir(tmp_path)
+        issues = [cwr.IssueRecord('IT-1', summary='요약', status='실행')]
+        confluence = MagicMock()
+        confluence.page_exists.return_value = True
+        confluence.get_page_id.return_value = '100'
+        confluence.get_page_by_id.return_value = {'body': {'storage': {'value': '<p>이전</p>'}}}
+        options = self.make_options(tmp_path)
+        
+        with patch.object(cwr, 'get_jira_issues_by_customfield_10817', return_value=issues), \
+                patch.object(cwr, 'build_report_content', return_value=('<p>새 본문</p>', [])), \
+                patch.object(cwr, 'CONFLUENCE_PAGE_INDEX', cwr.ConfluencePageIndex()), \
+                patch.object(cwr, 'SNAPSHOT_HISTORY', cwr.SnapshotHistory(path=str(tmp_path / 'history.sqlite3'))) as history:
+            if use_async:
+                cwr.asyncio.run(cwr.run_weekly_report_async(MagicMock(), confluence, options))
+            else:
+                cwr.run_weekly_report(MagicMock(), confluence, options)
+        return confluence, history.load(options['start_date_str'])
+    
+    def test_async_engine_matches_sync_engine(self, tmp_path, monkeypatch):
+        """asyncio 실행 엔진이 동기 실행과 같은 Confluence 업데이트와 스냅샷을 만드는지 테스트"""
+        (tmp_path / 'sync').mkdir()
+        (tmp_path / 'async').mkdir()
+        sync_confluence, sync_snapshot = self.run_engine(tmp_path / 'sync', monkeypatch, False)
+        async_confluence, async_snapshot = self.run_engine(tmp_path / 'async', monkeypatch, True)
+        
+        assert sync_confluence.update_page.call_args == async_confluence.update_page.call_args
+        assert sync_confluence.update_page.call_args.kwargs['body'] == '<p>새 본문</p>'
+        # 두 엔진 모두 상위 페이지는 options['parent_page_id']를 그대로 사용 (제목 조회 없음)
+        assert async_confluence.update_page.call_args.kwargs['parent_id'] == '4596203549'
+        assert async_confluence.get_page_id.call_count == sync_confluence.get_page_id.call_count
+        assert sync_snapshot == async_snapshot
+
+    def test_caches_are_saved_with_publication(self, tmp_path, monkeypatch):
+        """연결 티켓/행 캐시는 본문 생성이 아니라 게시를 마친 뒤 스냅샷과 함께 저장되는지 테스트"""
+        monkeypatch.chdir(tmp_path)
+        options = self.make_options(tmp_path)
+        deploy_issues = [cwr.IssueRecord('IT-1', summary='요약', status='실행', issuelinks=[])]
+        linked_cache = cwr.LinkedTicketsCache(path=str(tmp_path / 'links.json'))
+        row_cache = cwr.RowRenderCache(path=str(tmp_path / 'rows.json'))
+        
+        with patch.object(cwr, 'LINKED_TICKETS_CACHE', linked_cache), patch.object(cwr, 'ROW_RENDER_CACHE', row_cache), \
+                patch.object(cwr, 'get_jira_issues_by_customfield_10817', return_value=deploy_issues), \
+                patch.object(cwr, 'resolve_linked_it_tickets', return_value=[]), \
+                patch.object(cwr, 'SNAPSHOT_HISTORY', cwr.SnapshotHistory(path=str(tmp_path / 'history.sqlite3'))):
+            cwr.build_report_content(MagicMock(), deploy_issues, options)
+            assert not (tmp_path / 'rows.json').exists()
+            
+            cwr.complete_publication(options, deploy_issues, '100', 'unchanged', {}, {})
+        
+        assert (tmp_path / 'rows.json').exists()
+
+    def test_publish_skips_body_download_when_fingerprint_matches(self, tmp_path, monkeypatch):
+        """게시한 본문 지문과 버전이 같으면 본문을 내려받지 않고, 버전이 바뀌면 전체 비교하는지 테스트"""
+        monkeypatch.chdir(tmp_path)
+        options = self.make_options(tmp_path)
+        confluence = MagicMock()
+        confluence.update_page.return_value = {'version': {'number': 4}}
+        confluence.get_page_by_id.return_value = {'body': {'storage': {'value': '<p>이전</p>'}}}
+        
+        # 지문이 없으면 본문 전체를 비교하여 업데이트하고, 게시 후 버전을 기록
+        assert cwr.publish_confluence_page(confluence, options, '<p>새 본문</p>', '100', 3, '1') == ('100', 'updated')
+        assert cwr.get_published_fingerprint('100')['version'] == 4
+        
+        # 같은 본문, 같은 버전: 본문 다운로드 없이 변경 없음
+        confluence.get_page_by_id.reset_mock()
+        assert cwr.publish_confluence_page(confluence, options, '<p>새 본문</p>', '100', 4, '1') == ('100', 'unchanged')
+        confluence.get_page_by_id.assert_not_called()
+        assert confluence.update_page.call_count == 1
+        
+        # 버전이 바뀌면(직접 편집) 본문을 내려받아 비교
+        confluence.get_page_by_id.return_value = {'body': {'storage': {'value': '<p>직접 편집</p>'}}}
+        assert cwr.publish_confluence_page(confluence, options, '<p>새 본문</p>', '100', 5, '1') == ('100', 'updated')
+        confluence.get_page_by_id.assert_called_once_with('100', expand='body.storage')
+
+    def test_child_pages_update_independently(self, tmp_path, monkeypatch):
+        """하위 페이지는 바뀐 페이지만 업데이트하고, 필요 없어진 하위 페이지는 삭제하는지 테스트"""
+        monkeypatch.chdir(tmp_path)
+        options = self.make_options(tmp_path)
+        confluence = MagicMock()
+        confluence.get_page_child_by_type.return_value = []
+        confluence.page_exists.return_value = False
+        confluence.create_page.side_effect = lambda **kwargs: {'id': f"{kwargs['title'][-1]}00", 'version': {'number': 1}}
+        confluence.get_page_by_id.return_value = {'version': {'number': 1}}
+        confluence.update_page.return_value = {'version': {'number': 2}}
+        titles = [cwr.get_child_page_title(options['page_title'], n) for n in (1, 2, 3)]
+        
+        with patch.object(cwr, 'CONFLUENCE_PAGE_INDEX', cwr.ConfluencePageIndex()):
+            assert cwr.publish_child_pages(confluence, options, [(t, f'<p>{t}</p>') for t in titles], '4596203549') == 3
+            assert confluence.create_page.call_args.kwargs['parent_id'] == '4596203549'
+            
+            # 두 번째 페이지만 바뀌고 세 번째 페이지는 더 이상 필요 없음
+            pages = [(titles[0], f'<p>{titles[0]}</p>'), (titles[1], '<p>바뀐 행</p>')]
+            assert cwr.publish_child_pages(confluence, options, pages, '4596203549') == 2
+        
+        confluence.update_page.assert_called_once()
+        assert confluence.update_page.call_args.kwargs['page_id'] == '200'
+        confluence.remove_page.assert_called_once_with('300')
+        assert confluence.get_page_by_id.call_count == 2  # 버전만 확인하고 본문은 내려받지 않음
+    
+    def test_page_index_resolves_without_requests_and_refreshes_on_404(self, tmp_path):
+        """색인에 있는 페이지는 요청 없이 찾고, 404이면 하위 페이지 목록으로 색인을 갱신하는지 테스트"""
+        index = cwr.ConfluencePageIndex(path=str(tmp_path / 'index.json'))
+        confluence = MagicMock()
+        confluence.get_page_child_by_type.side_effect = lambda parent_id, type, start, limit: (
+            [{'id': n, 'title': f'페이지 {n}'} for n in range(start, min(start + limit, 250))]
+        )
+        confluence.get_page_by_id.return_value = {'version': {'number': 7}}
+        
+        with patch.object(cwr, 'CONFLUENCE_PAGE_INDEX', index):
+            # 첫 조회: 하위 페이지 목록(2페이지)으로 색인 생성
+            assert cwr.lookup_confluence_page(confluence, 'DEV', '페이지 210', '1') == ('210', 7)
+            assert confluence.get_page_child_by_type.call_count == 2
+            
+            # 저장된 색인으로 다시 조회: 목록/제목 조회 없이 버전만 확인
+            with patch.object(cwr, 'CONFLUENCE_PAGE_INDEX', cwr.ConfluencePageIndex(path=str(tmp_path / 'index.json'))):
+                assert cwr.lookup_confluence_page(confluence, 'DEV', '페이지 5', '1') == ('5', 7)
+            assert confluence.get_page_child_by_type.call_count == 2
+            confluence.page_exists.assert_not_called()
+            
+            # 색인의 페이지가 삭제되어 404이면 색인을 갱신하여 다시 찾음
+            not_found = cwr.ApiNotFoundError('not found')
+            confluence.get_page_by_id.side_effect = [not_found, {'version': {'number': 1}}]
+            index.put('페이지 5', '999')
+            assert cwr.lookup_confluence_page(confluence, 'DEV', '페이지 5', '1') == ('5', 1)
+            assert confluence.get_page_child_by_type.call_count == 4
 
 class TestIntegration:
     """통합 테스트"""